@@ -1,47 +1,49 @@
 """
 FastAPI 애플리케이션 메인 진입점
-- 미들웨어 설정
-- 라우터 등록
-- 예외 핸들러 설정
-- 데이터베이스 초기화
+- 애플리케이션 팩토리(create_app): 미들웨어(요청 단위 트랜잭션 등), 라우터, 예외 핸들러 등록
+- lifespan: 워커 시작 시 DB 엔진 생성/n-gram 색인 적재, 종료 시 연결 풀 정리
+- import 시점에는 앱/엔진을 만들지 않음 - `app`은 처음 접근할 때 생성 (uvicorn app.main:app)
+- 스키마는 마이그레이션(alembic upgrade head)으로 준비 - import/워커 시작 시 DDL 없음
 """
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from app.database import engine, Base
-from app.routers import books, categories
+from app import database
+from app.config import Settings, settings
+from app.database import READ_PRIMARY_COOKIE, USE_ASYNC_DB, USE_REPLICAS, UnitOfWorkMiddleware
+from app.utils.ngram_index import NGRAM_INDEX_ENABLED, book_ngram_index
 from app.utils.exceptions import BusinessException
-import uvicorn
-
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
-
-# FastAPI 애플리케이션 인스턴스 생성
-app = FastAPI(
-    title="도서 관리 시스템 API",
-    description="FastAPI와 SQLAlchemy를 활용한 도서 관리 RESTful API",
-    version="1.0.0",
-    docs_url="/docs",  # Swagger UI
-    redoc_url="/redoc"  # ReDoc
-)
-
-# CORS 미들웨어 설정 (개발 환경용)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 운영 환경에서는 특정 도메인만 허용
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# 라우터 등록
-app.include_router(books.router, prefix="/api/v1")
-app.include_router(categories.router, prefix="/api/v1")
-
-# 전역 예외 핸들러
-@app.exception_handler(BusinessException)
+from app.utils.pool_metrics import pool_status
+from app.utils.responses import FastJSONResponse
+import math
+import time
+
+router = APIRouter()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    워커 시작/종료 처리
+    - 시작: DB 엔진/세션 팩토리 생성, 한글 부분 일치 검색용 n-gram 메모리 색인 적재
+    - 종료: 연결 풀 정리
+    """
+    database.init_engines(app.state.settings)
+    if NGRAM_INDEX_ENABLED:
+        book_ngram_index.load(database.engine)
+        if database.async_engine is not None:
+            book_ngram_index.attach(database.async_engine.sync_engine)
+    try:
+        yield
+    finally:
+        await database.dispose_engines()
+
+
+# 전역 예외 핸들러 (create_app에서 등록)
 async def business_exception_handler(request: Request, exc: BusinessException):
     """비즈니스 로직 예외 처리"""
     return JSONResponse(
@@ -53,7 +55,6 @@ async def business_exception_handler(request: Request, exc: BusinessException):
         }
     )
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Pydantic 유효성 검증 오류 처리"""
     errors = exc.errors()
@@ -73,7 +74,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
 
-@app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """일반 HTTP 예외 처리"""
     return JSONResponse(
@@ -85,7 +85,6 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         }
     )
 
-@app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """예상치 못한 예외 처리"""
     return JSONResponse(
@@ -98,7 +97,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 # 루트 엔드포인트
-@app.get("/")
+@router.get("/")
 async def root():
     """API 상태 확인"""
     return {
@@ -111,7 +110,7 @@ async def root():
         }
     }
 
-@app.get("/health")
+@router.get("/health")
 async def health_check():
     """헬스 체크 엔드포인트"""
     return {
@@ -120,11 +119,121 @@ async def health_check():
         "data": {"status": "healthy"}
     }
 
+@router.get("/health/pool")
+async def pool_metrics(request: Request):
+    """
+    DB 연결 풀 지표 (현재 워커 프로세스 기준)
+    - checked_out/overflow가 자주 한도에 닿거나 wait_ms/timeouts가 늘면 풀 확대 또는 워커 수 조정
+    """
+    app_settings = request.app.state.settings
+    async_engine, replica_pool = database.async_engine, database.replica_pool
+    return {
+        "status": "success",
+        "message": "연결 풀 상태",
+        "data": {
+            "app_env": app_settings.app_env,
+            "config": {
+                "pool_size": app_settings.db_pool_size,
+                "max_overflow": app_settings.db_max_overflow,
+                "pool_timeout": app_settings.db_pool_timeout,
+                "pool_recycle": app_settings.db_pool_recycle,
+                "pool_pre_ping": app_settings.db_pool_pre_ping,
+            },
+            "sync": pool_status(database.engine),
+            "async": pool_status(async_engine.sync_engine if async_engine is not None else None),
+            "replicas": [pool_status(replica) for replica in replica_pool.engines] if replica_pool else [],
+        }
+    }
+
+
+def create_app(app_settings: Settings = settings) -> FastAPI:
+    """
+    FastAPI 애플리케이션 생성
+    - app_settings: 엔진 URL/연결 풀(lifespan), 응답 직렬화, 미들웨어에 사용
+    - 동기/비동기 세션 경로와 복제본 사용 여부는 라우터 import 시점에 정해지므로 프로세스 설정과 같아야 함
+    - 라우터/스키마/서비스 모듈은 여기서 import (앱이 필요 없는 import에는 비용 없음)
+    """
+    if app_settings.use_async_db != USE_ASYNC_DB or bool(app_settings.replica_urls) != USE_REPLICAS:
+        raise ValueError("USE_ASYNC_DB, DATABASE_REPLICA_URLS는 프로세스 설정(환경 변수)으로만 바꿀 수 있습니다")
+
+    from app.routers import books, categories
+
+    app = FastAPI(
+        title="도서 관리 시스템 API",
+        description="FastAPI와 SQLAlchemy를 활용한 도서 관리 RESTful API",
+        version="1.0.0",
+        docs_url="/docs",  # Swagger UI
+        redoc_url="/redoc",  # ReDoc
+        # 빠른 JSON 응답 사용 시 모든 엔드포인트의 기본 직렬화도 orjson
+        default_response_class=FastJSONResponse if app_settings.fast_json_response else JSONResponse,
+        lifespan=lifespan
+    )
+    app.state.settings = app_settings
+
+    # 쓰기 요청 단위 트랜잭션 - 가장 안쪽 미들웨어 (커밋 실패 시의 500 응답에도 CORS 헤더 적용)
+    if app_settings.db_unit_of_work:
+        app.add_middleware(UnitOfWorkMiddleware)
+
+    # CORS 미들웨어 설정 (개발 환경용)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # 운영 환경에서는 특정 도메인만 허용
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["ETag", "Last-Modified"],  # 프론트엔드에서 조건부 요청 검증자 확인
+    )
+
+    # 읽기 복제본 사용 시 read-your-writes 보장
+    # 쓰기 요청에 성공한 클라이언트는 복제 지연 시간 동안 조회도 primary에서 처리 (쿠키로 표시)
+    if app_settings.replica_urls and app_settings.db_read_your_writes_seconds > 0:
+        @app.middleware("http")
+        async def read_your_writes(request: Request, call_next):
+            response = await call_next(request)
+            if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+                window = app_settings.db_read_your_writes_seconds
+                response.set_cookie(
+                    READ_PRIMARY_COOKIE,
+                    f"{time.time() + window:.3f}",
+                    max_age=math.ceil(window),
+                    httponly=True
+                )
+            return response
+
+    # 라우터 등록
+    app.include_router(books.router, prefix="/api/v1")
+    app.include_router(categories.router, prefix="/api/v1")
+    app.include_router(router)
+
+    # 전역 예외 핸들러 등록
+    app.add_exception_handler(BusinessException, business_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(Exception, general_exception_handler)
+
+    return app
+
+
+_app: Optional[FastAPI] = None
+
+
+def __getattr__(name: str):
+    """`app`은 처음 접근할 때 기본 설정으로 생성 (uvicorn app.main:app, from app.main import app)"""
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
+    import uvicorn
+
     # 개발 서버 실행
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
         reload=True  # 코드 변경 시 자동 재시작
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,65 @@
+"""
+Alembic 마이그레이션 환경
+- 대상 스키마: app.database.Base.metadata (모든 모델 등록)
+- DB URL: sqlalchemy.url 옵션이 없으면 앱 설정의 DATABASE_URL
+- 리비전마다 별도 트랜잭션 - 인덱스 추가 등을 리비전 단위로 나눠 배포
+"""
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import create_engine, pool
+from sqlalchemy.engine import make_url
+from app.config import settings
+from app.database import Base
+from app.models import book, book_tombstone, category  # noqa: F401 - 메타데이터에 테이블 등록
+from app.services.search_service import is_search_schema_object
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """전문 검색 객체는 모델에 없으므로 자동 비교에서 제외 (마이그레이션에서 직접 관리)"""
+    return name is None or not is_search_schema_object(name)
+
+
+def configure_options(dialect_name: str) -> dict:
+    return {
+        "target_metadata": target_metadata,
+        "include_name": include_name,
+        "compare_type": True,
+        "transaction_per_migration": True,
+        # SQLite는 ALTER TABLE 지원이 제한적이므로 테이블 재생성 방식으로 변경
+        "render_as_batch": dialect_name == "sqlite",
+    }
+
+
+def run_migrations_offline() -> None:
+    """SQL 스크립트 생성 (alembic upgrade head --sql) - DBA 검토/수동 적용용"""
+    url = config.get_main_option("sqlalchemy.url") or settings.database_url
+    context.configure(
+        url=url,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        **configure_options(make_url(url).get_backend_name()),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    url = config.get_main_option("sqlalchemy.url") or settings.database_url
+    engine = create_engine(url, poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        context.configure(connection=connection, **configure_options(connection.dialect.name))
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,96 @@
+"""초기 스키마 - categories, books, book_tombstones, 전문 검색 인덱스
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+from app.models.timestamps import PreciseDateTime, precise_now
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _sqlite_fts_tokenizer():
+    """
+    SQLite FTS5 토크나이저 - FTS5가 없는 빌드면 None (검색은 LIKE로 대체)
+    - trigram 토크나이저는 SQLite 3.34 이상에서만 지원
+    """
+    if context.is_offline_mode():
+        return "trigram"
+    bind = op.get_bind()
+    if not bind.execute(sa.text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar():
+        return None
+    version = tuple(int(v) for v in bind.execute(sa.text("SELECT sqlite_version()")).scalar().split("."))
+    return "trigram" if version >= (3, 34, 0) else "unicode61"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "categories",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_categories_id", "categories", ["id"])
+    op.create_index("ix_categories_name", "categories", ["name"], unique=True)
+
+    op.create_table(
+        "books",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("author", sa.String(length=100), nullable=False),
+        sa.Column("isbn", sa.String(length=13), nullable=False),
+        sa.Column("price", sa.Integer(), nullable=False),
+        sa.Column("stock_quantity", sa.Integer(), nullable=False),
+        sa.Column("published_date", sa.Date(), nullable=True),
+        sa.Column("created_at", PreciseDateTime, server_default=precise_now(), nullable=False),
+        sa.Column("updated_at", PreciseDateTime, server_default=precise_now(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=True),
+        sa.Column("category_name", sa.String(length=50), nullable=True),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_books_id", "books", ["id"])
+    op.create_index("ix_books_title", "books", ["title"])
+    op.create_index("ix_books_author", "books", ["author"])
+    op.create_index("ix_books_isbn", "books", ["isbn"], unique=True)
+    op.create_index("ix_books_category_id", "books", ["category_id"])
+    op.create_index("ix_books_updated_at_id", "books", ["updated_at", "id"])
+    op.create_index("ix_books_price_cover", "books", ["price", "id", "updated_at"])
+    op.create_index("ix_books_published_date_id", "books", ["published_date", "id"])
+    op.create_index("ix_books_category_price_cover", "books", ["category_id", "price", "id", "updated_at"])
+    op.create_index("ix_books_category_published_date_id", "books", ["category_id", "published_date", "id"])
+
+    op.create_table(
+        "book_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("isbn", sa.String(length=13), nullable=False),
+        sa.Column("deleted_at", PreciseDateTime, server_default=precise_now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_book_tombstones_book_id", "book_tombstones", ["book_id"])
+    op.create_index("ix_book_tombstones_deleted_at_id", "book_tombstones", ["deleted_at", "id"])
+
+    # 전문 검색 인덱스 (services/search.py) - MySQL FULLTEXT(ngram) / SQLite FTS5
+    dialect = op.get_context().dialect.name
+    if dialect == "mysql":
+        op.execute("ALTER TABLE books ADD FULLTEXT INDEX ft_books_title_author (title, author) WITH PARSER ngram")
+    elif dialect == "sqlite":
+        tokenizer = _sqlite_fts_tokenizer()
+        if tokenizer is not None:
+            op.execute(f"CREATE VIRTUAL TABLE books_fts USING fts5(title, author, tokenize='{tokenizer}')")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS books_fts")
+    op.drop_table("book_tombstones")
+    op.drop_table("books")
+    op.drop_table("categories")
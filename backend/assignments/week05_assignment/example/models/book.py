@@ -2,15 +2,30 @@
 Book 모델 정의
 - 도서 정보를 관리하는 핵심 테이블
 """
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 from app.database import Base
+from app.models.timestamps import PreciseDateTime, precise_now
 
 class Book(Base):
     """도서 ORM 모델"""
     __tablename__ = "books"
     
+    # 쓰기 직후 서버에서 생성된 값(created_at, updated_at)을 바로 조회
+    # RETURNING을 지원하는 DB는 INSERT/UPDATE 문에 포함, 그 외에는 직후 SELECT 한 번
+    __mapper_args__ = {"eager_defaults": True}
+    
+    # 정렬/키셋 조회용 복합 인덱스 - (필터, 정렬 키, id) 순서로 두어 범위 스캔만으로 정렬된 페이지 조회
+    # - 변경분 동기화(GET /books/changes): updated_at 순
+    # - 목록 정렬(GET /books?sort=): 가격/출간일 순, 카테고리 필터와 함께 사용
+    __table_args__ = (
+        Index("ix_books_updated_at_id", "updated_at", "id"),
+        Index("ix_books_price_cover", "price", "id", "updated_at"),
+        Index("ix_books_published_date_id", "published_date", "id"),
+        Index("ix_books_category_price_cover", "category_id", "price", "id", "updated_at"),
+        Index("ix_books_category_published_date_id", "category_id", "published_date", "id"),
+    )
+    
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
     
@@ -30,17 +45,20 @@ class Book(Base):
     
     # 타임스탬프 필드들
     # server_default: INSERT 시 자동 설정
+    # 정렬/커서 키(sort=created_at)로 쓰므로 updated_at과 같은 정밀도/형식으로 저장
+    # (SQLite는 문자열로 비교하므로 초 단위 값과 커서의 마이크로초 값이 섞이면 안 됨)
     created_at = Column(
-        DateTime(timezone=True),
-        server_default=func.now(),
+        PreciseDateTime,
+        server_default=precise_now(),
         nullable=False
     )
     
-    # onupdate: UPDATE 시 자동 갱신
+    # onupdate: UPDATE 시 자동 갱신 (집합 UPDATE 포함)
+    # ETag/변경 감지에 사용하므로 같은 초 안의 수정도 구분되도록 소수점 이하 초까지 저장
     updated_at = Column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        PreciseDateTime,
+        server_default=precise_now(),
+        onupdate=precise_now(),
         nullable=False
     )
     
@@ -52,6 +70,10 @@ class Book(Base):
         index=True  # 조인 성능 최적화를 위한 인덱스
     )
     
+    # 카테고리명 (비정규화) - 목록/상세 조회 시 JOIN 없이 응답에 사용
+    # 도서 생성/카테고리 변경 시 BookService가, 카테고리명 변경 시 CategoryService가 갱신
+    category_name = Column(String(50), nullable=True)
+    
     # 관계 설정
     category = relationship("Category", back_populates="books")
     
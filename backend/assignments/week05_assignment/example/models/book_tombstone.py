@@ -0,0 +1,33 @@
+"""
+BookTombstone 모델 정의
+- 삭제된 도서 기록 (변경분 동기화에서 삭제를 전달하기 위한 테이블)
+"""
+from sqlalchemy import Column, Index, Integer, String
+from app.database import Base
+from app.models.timestamps import PreciseDateTime, precise_now
+
+class BookTombstone(Base):
+    """삭제된 도서 ORM 모델"""
+    __tablename__ = "book_tombstones"
+    
+    # 변경분 동기화에서 삭제 시각 순으로 조회
+    __table_args__ = (
+        Index("ix_book_tombstones_deleted_at_id", "deleted_at", "id"),
+    )
+    
+    # Primary Key
+    id = Column(Integer, primary_key=True)
+    
+    # 삭제된 도서 정보 - 클라이언트가 id 또는 ISBN으로 사본에서 제거
+    book_id = Column(Integer, nullable=False, index=True)
+    isbn = Column(String(13), nullable=False)
+    
+    # 삭제 시각 - books.updated_at과 같은 정밀도
+    deleted_at = Column(
+        PreciseDateTime,
+        server_default=precise_now(),
+        nullable=False
+    )
+    
+    def __repr__(self):
+        return f"<BookTombstone(book_id={self.book_id}, isbn='{self.isbn}')>"
@@ -29,11 +29,13 @@ class Category(Base):
     
     # 관계 설정 - 카테고리에 속한 도서들
     # back_populates: 양방향 관계 설정
-    # cascade: 카테고리 삭제 시 연관 도서 처리 방식
+    # 카테고리 삭제 시 도서는 삭제하지 않고 category_id를 NULL로 변경
+    # (Book.category_id FK의 ondelete="SET NULL"과 동일)
+    # passive_deletes: 삭제 시 도서를 세션으로 불러오지 않음 - CategoryService가 집합 UPDATE로 처리
     books = relationship(
         "Book", 
         back_populates="category",
-        cascade="all, delete-orphan"  # 카테고리 삭제 시 도서도 삭제
+        passive_deletes=True
     )
     
     def __repr__(self):
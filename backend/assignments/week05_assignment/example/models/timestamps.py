@@ -0,0 +1,38 @@
+"""
+고정밀 타임스탬프
+- updated_at으로 변경 여부(ETag 등)를 판단하려면 같은 초 안의 연속 수정도 구분되어야 함
+- MySQL/SQLite의 CURRENT_TIMESTAMP는 초 단위이므로 방언별로 소수점 이하 초까지 생성
+"""
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# MySQL은 DATETIME(6) 컬럼이어야 마이크로초까지 저장
+PreciseDateTime = DateTime(timezone=True).with_variant(
+    mysql.DATETIME(timezone=True, fsp=6), "mysql"
+)
+
+
+class precise_now(FunctionElement):
+    """현재 시각 (소수점 이하 초 포함) - server_default/onupdate에 사용"""
+    type = DateTime(timezone=True)
+    name = "precise_now"
+    inherit_cache = True
+
+
+@compiles(precise_now)
+def _compile_precise_now(element, compiler, **kw):
+    # PostgreSQL 등은 CURRENT_TIMESTAMP가 이미 마이크로초 정밀도
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(precise_now, "mysql")
+def _compile_precise_now_mysql(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP(6)"
+
+
+@compiles(precise_now, "sqlite")
+def _compile_precise_now_sqlite(element, compiler, **kw):
+    # %f는 밀리초까지("SS.SSS") - 뒤에 000을 붙여 SQLAlchemy가 마이크로초 6자리로 읽도록 함
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
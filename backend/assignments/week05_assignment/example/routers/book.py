@@ -2,17 +2,30 @@
 Book API 엔드포인트
 - 복잡한 비즈니스 로직과 다양한 쿼리 파라미터 처리
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from typing import AsyncIterator, List, Optional
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from app.database import DBSession, get_read_session, get_session, read_from_primary, stream_in_session
 from app.schemas.book import (
     BookCreate, BookUpdate, BookResponse, 
-    StockUpdateRequest, BookSearchParams
+    StockUpdateRequest, BookSearchParams,
+    StockBatchRequest, StockBatchResult, BookImportResponse, BookChange,
+    BOOK_RESPONSE_FIELDS
 )
 from app.schemas.common import ResponseBase, PaginatedResponse, PaginationMeta
-from app.services.book_service import BookService
-from app.utils.exceptions import BusinessException
+from app.services.book_service import (
+    AsyncBookService, BOOK_EXPORT_BATCH_SIZE, BOOK_IMPORT_MAX_ROWS, BOOK_SYNC_PAGE_SIZE
+)
+from app.utils.counting import COUNT_ESTIMATED
+from app.utils.csv_export import dump_csv, dump_csv_header
+from app.utils.exceptions import BusinessException, InvalidOperationException
+from app.utils.http_cache import (
+    cache_headers, has_conditional_headers, is_not_modified, make_etag, not_modified_response
+)
+from app.utils.ndjson import dump_ndjson, read_ndjson
+from app.utils.responses import model_response, partial_response
 import math
 
 router = APIRouter(
@@ -32,8 +45,9 @@ router = APIRouter(
     description="새로운 도서를 등록합니다. ISBN은 13자리 숫자여야 합니다."
 )
 async def create_book(
+    request: Request,
     book_data: BookCreate,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ) -> ResponseBase[BookResponse]:
     """
     도서 생성 엔드포인트
@@ -41,12 +55,12 @@ async def create_book(
     - 카테고리 존재 여부 확인
     """
     try:
-        book = BookService.create_book(db, book_data)
-        return ResponseBase(
+        book = await AsyncBookService.create_book(db, book_data)
+        return model_response(request, ResponseBase(
             status="success",
-            data=BookResponse.from_orm(book),
+            data=book,
             message="도서가 성공적으로 등록되었습니다"
-        )
+        ))
     except BusinessException as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -58,6 +72,51 @@ async def create_book(
             detail={"status": "error", "message": f"서버 오류: {str(e)}"}
         )
 
+@router.post(
+    "/bulk",
+    response_model=ResponseBase[BookImportResponse],
+    summary="도서 대량 등록",
+    description="JSON 배열 또는 NDJSON(application/x-ndjson) 본문으로 여러 도서를 한 번에 등록합니다. 행 단위로 성공/실패를 보고합니다."
+)
+async def import_books(
+    request: Request,
+    chunk_size: Optional[int] = Query(None, gt=0, le=5000, description="INSERT 한 번에 처리할 행 수"),
+    db: DBSession = Depends(get_session)
+) -> ResponseBase[BookImportResponse]:
+    """
+    도서 대량 등록 엔드포인트
+    - Content-Type: application/json -> 도서 객체 배열
+    - Content-Type: application/x-ndjson -> 한 줄에 도서 객체 하나 (줄 단위로 읽고, 최대 행 수를 넘으면 바로 400)
+    - 일부 행이 실패해도 나머지는 등록 (failed_items에 사유 포함)
+    """
+    try:
+        if "ndjson" in request.headers.get("content-type", ""):
+            records = await read_ndjson(request.stream(), BOOK_IMPORT_MAX_ROWS)
+        else:
+            try:
+                records = await request.json()
+            except ValueError:
+                raise InvalidOperationException("JSON 형식이 올바르지 않습니다")
+            if not isinstance(records, list):
+                raise InvalidOperationException("요청 본문은 도서 객체 배열이어야 합니다")
+        
+        result = await AsyncBookService.import_books(db, records, chunk_size)
+        return model_response(request, ResponseBase(
+            status="success",
+            data=result,
+            message=f"{result.success_count}건 등록, {result.failed_count}건 실패"
+        ))
+    except BusinessException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"status": "error", "message": e.message}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={"status": "error", "message": "서버 오류가 발생했습니다"}
+        )
+
 @router.get(
     "",
     response_model=PaginatedResponse[List[BookResponse]],
@@ -65,24 +124,55 @@ async def create_book(
     description="도서 목록을 조회합니다. 검색, 필터링, 페이지네이션을 지원합니다."
 )
 async def get_books(
+    request: Request,
+    response: Response,
     search: Optional[str] = Query(None, description="검색어 (제목/저자)"),
     category_id: Optional[int] = Query(None, gt=0, description="카테고리 ID"),
     min_price: Optional[int] = Query(None, ge=0, description="최소 가격"),
     max_price: Optional[int] = Query(None, ge=0, description="최대 가격"),
     page: int = Query(1, gt=0, description="페이지 번호"),
     size: int = Query(10, gt=0, le=100, description="페이지 크기"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 meta.next_cursor)"),
+    sort: Optional[str] = Query(
+        None,
+        description=(
+            "정렬 기준 - relevance(검색 관련도순, search 필요) 또는 쉼표로 구분한 필드 "
+            "(-는 내림차순, 예: price,-published_date,title)"
+        )
+    ),
+    count_strategy: str = Query(
+        "exact",
+        regex="^(exact|cached|estimated)$",
+        description="전체 개수 계산 방식 (exact: 정확, cached: 캐시된 정확값, estimated: 추정값)"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="응답에 포함할 도서 필드 (쉼표 구분, 예: id,title,price - id는 항상 포함)"
+    ),
+    db: DBSession = Depends(get_read_session)
 ) -> PaginatedResponse[List[BookResponse]]:
     """
     도서 목록 조회 엔드포인트
-    - 검색: 제목 또는 저자명에 키워드 포함
+    - 검색: 제목 또는 저자명에 키워드 포함 (전문 검색 인덱스 사용)
+    - 정렬: sort=relevance 지정 시 검색 관련도순, sort=price,-published_date 처럼 여러 필드 정렬 (마지막 키는 항상 id)
     - 필터링: 카테고리, 가격대
     - 페이지네이션: 기본 10개씩
+    - 커서 페이지네이션: meta.next_cursor를 cursor로 전달하면 OFFSET 없이 다음 페이지 조회
+    - 전체 개수: count_strategy로 계산 방식 선택, 추정값이면 meta.total_exact=false
+    - 필드 선택: fields로 지정한 컬럼만 조회하고 응답에도 해당 필드만 포함
+    - ETag: 필터 범위의 도서 수 + 최대 updated_at과 쿼리 문자열로 계산, If-None-Match 일치 시 304
+      (집계 조회 1회로 판단하고 그 개수를 total로 재사용, estimated는 COUNT를 피하려는 용도이므로 생략,
+      cached는 캐시된 개수 + MAX(updated_at)만 조회)
     
     쿼리 파라미터 예시:
     - /books?search=파이썬
+    - /books?search=파이썬&sort=relevance
+    - /books?category_id=1&sort=-price,title
     - /books?category_id=1&min_price=10000&max_price=50000
     - /books?page=2&size=20
+    - /books?size=20&cursor=eyJzIjoiaWQiLCJ2IjpbMjBdfQ
+    - /books?min_price=10000&count_strategy=estimated
+    - /books?fields=id,title,price
     """
     try:
         # 검색 파라미터 객체 생성
@@ -92,32 +182,210 @@ async def get_books(
             min_price=min_price,
             max_price=max_price,
             page=page,
-            size=size
+            size=size,
+            cursor=cursor,
+            sort=sort,
+            count_strategy=count_strategy,
+            fields=fields
         )
         
+        # 목록 버전으로 조건부 요청 처리 - 일치하면 도서 행 조회/직렬화 없이 304
+        etag = None
+        known_total = None
+        if count_strategy != COUNT_ESTIMATED:
+            known_total, last_updated = await AsyncBookService.get_books_version(db, params)
+            etag = make_etag("books", known_total, last_updated, *sorted(request.query_params.multi_items()))
+            if is_not_modified(request, etag):
+                return not_modified_response(etag)
+        
         # 서비스 호출
-        books, total = BookService.get_all_books(db, params)
+        books, total, total_exact, next_cursor = await AsyncBookService.get_all_books(
+            db, params, known_total
+        )
+        if etag is not None:
+            response.headers.update(cache_headers(etag))
         
         # 페이지네이션 메타 정보 계산
         total_pages = math.ceil(total / size) if total > 0 else 0
+        total_text = f"{total}" if total_exact else f"약 {total}"
         
-        return PaginatedResponse(
+        if params.fields:
+            # 로드한 컬럼만 읽어 검증 없이 구성 (나머지 속성에 접근하면 행마다 추가 조회 발생)
+            data = [
+                BookResponse.construct(**{field: getattr(book, field) for field in params.fields})
+                for book in books
+            ]
+        else:
+            data = [BookResponse.from_orm(book) for book in books]
+        
+        result = PaginatedResponse(
             status="success",
-            data=[BookResponse.from_orm(book) for book in books],
-            message=f"총 {total}개 중 {len(books)}개의 도서가 조회되었습니다",
+            data=data,
+            message=f"총 {total_text}개 중 {len(books)}개의 도서가 조회되었습니다",
             meta=PaginationMeta(
                 page=page,
                 size=size,
                 total=total,
-                total_pages=total_pages
+                total_pages=total_pages,
+                total_exact=total_exact,
+                next_cursor=next_cursor
             )
         )
+        if params.fields:
+            excluded = set(BOOK_RESPONSE_FIELDS) - set(params.fields)
+            return partial_response(request, result, {"data": {"__all__": excluded}}, response)
+        # 빠른 응답 경로면 검증된 모델을 바로 직렬화 (response_model 재검증 생략)
+        return model_response(request, result, response)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"status": "error", "message": e.errors()[0]["msg"]}
+        )
+    except BusinessException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"status": "error", "message": e.message}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail={"status": "error", "message": f"서버 오류: {str(e)}"}
         )
 
+# 내보내기 형식 -> Content-Type
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}, "description": "도서 전체 스트림"}},
+    summary="도서 내보내기",
+    description="검색/필터 조건에 맞는 도서 전체를 NDJSON 또는 CSV로 스트리밍합니다."
+)
+async def export_books(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="내보내기 형식 (ndjson, csv)"),
+    search: Optional[str] = Query(None, description="검색어 (제목/저자)"),
+    category_id: Optional[int] = Query(None, gt=0, description="카테고리 ID"),
+    min_price: Optional[int] = Query(None, ge=0, description="최소 가격"),
+    max_price: Optional[int] = Query(None, ge=0, description="최대 가격"),
+    db: DBSession = Depends(get_read_session)
+) -> StreamingResponse:
+    """
+    도서 내보내기 엔드포인트
+    - 목록 조회와 같은 검색/필터 조건, id 순으로 전체 도서 (페이지 크기 제한 없음)
+    - 서버 측 커서로 BOOK_EXPORT_BATCH_SIZE행씩 읽어 바로 전송 - 도서 수와 관계없이 메모리 사용량 일정
+    - NDJSON: 한 줄에 BookResponse 하나, CSV: BookResponse 필드 순서의 헤더 + 행 (엑셀용 BOM 포함)
+    
+    예시:
+    - /books/export
+    - /books/export?format=csv&category_id=1
+    """
+    try:
+        params = BookSearchParams(
+            search=search,
+            category_id=category_id,
+            min_price=min_price,
+            max_price=max_price
+        )
+        statement = await AsyncBookService.get_export_statement(db, params)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"status": "error", "message": e.errors()[0]["msg"]}
+        )
+    except BusinessException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"status": "error", "message": e.message}
+        )
+    return StreamingResponse(
+        _stream_export(db, statement, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="books.{format}"'}
+    )
+
+async def _stream_export(db: DBSession, statement, format: str) -> AsyncIterator[bytes]:
+    """묶음 단위로 직렬화해 전송 (행마다 전송하지 않아 쓰기 횟수 최소화)"""
+    columns = list(BookResponse.__fields__)
+    if format == "csv":
+        yield dump_csv_header(columns)
+    if statement is None:
+        return
+    
+    async for books in stream_in_session(db, statement, BOOK_EXPORT_BATCH_SIZE):
+        responses = [BookResponse.from_orm(book) for book in books]
+        yield dump_csv(responses, columns) if format == "csv" else dump_ndjson(responses)
+
+@router.get(
+    "/changes",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}, "description": "변경분 NDJSON 스트림"}},
+    summary="도서 변경분 동기화",
+    description="since 토큰 이후 생성/수정/삭제된 도서를 NDJSON으로 스트리밍합니다."
+)
+async def get_book_changes(
+    since: Optional[str] = Query(None, description="이전 동기화의 next_since 토큰 (없으면 전체 스냅샷)"),
+    db: DBSession = Depends(get_read_session)
+) -> StreamingResponse:
+    """
+    도서 변경분 동기화 엔드포인트
+    - 한 줄에 하나의 BookChange: delete 줄을 먼저, 그다음 upsert 줄(updated_at 순), 마지막에 sync 줄
+    - 삭제 후 같은 ISBN으로 재등록된 경우에도 순서대로 적용하면 현재 상태와 같아짐
+    - 마지막 sync 줄의 next_since를 받은 경우에만 토큰을 저장 (중간에 끊기면 이전 토큰으로 재요청)
+    - 토큰이 잘못되면 400, 삭제 기록 보존 기간이 지났으면 410 (since 없이 전체 재동기화)
+    
+    예시:
+    - /books/changes
+    - /books/changes?since=eyJzIjoic3luYyIsInYiOlsiMjAyNC0wMS0wMVQwMDowMDowMCJdfQ
+    """
+    try:
+        lower, next_since = await AsyncBookService.start_sync(db, since)
+    except BusinessException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"status": "error", "message": e.message}
+        )
+    return StreamingResponse(
+        _stream_book_changes(db, lower, next_since),
+        media_type="application/x-ndjson"
+    )
+
+async def _stream_book_changes(
+    db: DBSession,
+    since: Optional[datetime],
+    next_since: str
+) -> AsyncIterator[bytes]:
+    """변경분을 페이지 단위로 조회해 페이지마다 한 번에 전송 (전체 결과를 메모리에 올리지 않음)"""
+    after_id = None
+    while True:
+        tombstones = await AsyncBookService.get_deleted_books(db, since, after_id, BOOK_SYNC_PAGE_SIZE)
+        if tombstones:
+            yield _change_lines(
+                BookChange(op="delete", id=tombstone.book_id, isbn=tombstone.isbn, deleted_at=tombstone.deleted_at)
+                for tombstone in tombstones
+            )
+        if len(tombstones) < BOOK_SYNC_PAGE_SIZE:
+            break
+        after_id = tombstones[-1].id
+    
+    after = None
+    while True:
+        books = await AsyncBookService.get_changed_books(db, since, after, BOOK_SYNC_PAGE_SIZE)
+        if books:
+            yield _change_lines(BookChange(op="upsert", book=BookResponse.from_orm(book)) for book in books)
+        if len(books) < BOOK_SYNC_PAGE_SIZE:
+            break
+        after = [books[-1].updated_at, books[-1].id]
+    
+    yield _change_lines([BookChange(op="sync", next_since=next_since)])
+
+def _change_lines(changes) -> bytes:
+    # 설정한 필드만 출력 (upsert의 도서 필드는 null이어도 모두 포함)
+    return dump_ndjson(changes, exclude_unset=True)
+
 @router.get(
     "/{book_id}",
     response_model=ResponseBase[BookResponse],
@@ -126,19 +394,74 @@ async def get_books(
 )
 async def get_book(
     book_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_read_session)
 ) -> ResponseBase[BookResponse]:
     """
     도서 상세 조회 엔드포인트
     - 카테고리 정보 포함
+    - read-through 캐시 사용 (수정/삭제/재고 변경 시 무효화)
+    - ETag(id + updated_at)/Last-Modified 제공, 조건부 요청은 updated_at만 확인해 일치 시 304
+    - 최근 쓰기 요청을 보낸 클라이언트는 캐시를 건너뛰고 primary에서 조회 (read-your-writes)
     """
     try:
-        book = BookService.get_book_by_id(db, book_id)
-        return ResponseBase(
+        read_cache = not read_from_primary(request)
+        if has_conditional_headers(request):
+            updated_at = await AsyncBookService.get_book_updated_at(db, book_id, read_cache)
+            etag = make_etag("book", book_id, updated_at)
+            if is_not_modified(request, etag, updated_at):
+                return not_modified_response(etag, updated_at)
+        
+        book = await AsyncBookService.get_book_response(db, book_id, read_cache)
+        response.headers.update(cache_headers(make_etag("book", book.id, book.updated_at), book.updated_at))
+        return model_response(request, ResponseBase(
             status="success",
-            data=BookResponse.from_orm(book),
+            data=book,
             message="도서 정보가 조회되었습니다"
+        ), response)
+    except BusinessException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"status": "error", "message": e.message}
         )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={"status": "error", "message": "서버 오류가 발생했습니다"}
+        )
+
+@router.patch(
+    "/stock:batch",
+    response_model=ResponseBase[List[StockBatchResult]],
+    summary="일괄 재고 변경",
+    description="여러 도서의 재고를 하나의 트랜잭션으로 변경합니다. 하나라도 실패하면 전체가 취소됩니다."
+)
+async def update_stock_batch(
+    request: Request,
+    batch: StockBatchRequest,
+    db: DBSession = Depends(get_session)
+) -> ResponseBase[List[StockBatchResult]]:
+    """
+    일괄 재고 관리 엔드포인트
+    - 주문의 모든 항목을 한 번의 요청/트랜잭션으로 처리
+    - /{book_id} 경로보다 먼저 등록해야 함
+    
+    요청 예시:
+    {
+        "items": [
+            {"book_id": 1, "quantity": 2, "operation": "subtract"},
+            {"book_id": 3, "quantity": 1, "operation": "subtract"}
+        ]
+    }
+    """
+    try:
+        results = await AsyncBookService.update_stock_batch(db, batch.items)
+        return model_response(request, ResponseBase(
+            status="success",
+            data=results,
+            message=f"{len(results)}건의 재고 변경이 처리되었습니다"
+        ))
     except BusinessException as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -157,9 +480,10 @@ async def get_book(
     description="도서 정보를 부분적으로 수정합니다."
 )
 async def update_book(
+    request: Request,
     book_id: int,
     book_data: BookUpdate,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ) -> ResponseBase[BookResponse]:
     """
     도서 정보 수정 엔드포인트
@@ -167,12 +491,12 @@ async def update_book(
     - 변경하고자 하는 필드만 전송
     """
     try:
-        book = BookService.update_book(db, book_id, book_data)
-        return ResponseBase(
+        book = await AsyncBookService.update_book(db, book_id, book_data)
+        return model_response(request, ResponseBase(
             status="success",
-            data=BookResponse.from_orm(book),
+            data=book,
             message="도서 정보가 성공적으로 수정되었습니다"
-        )
+        ))
     except BusinessException as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -191,20 +515,21 @@ async def update_book(
     description="도서를 삭제합니다."
 )
 async def delete_book(
+    request: Request,
     book_id: int,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ) -> ResponseBase[dict]:
     """
     도서 삭제 엔드포인트
     - 물리적 삭제 수행
     """
     try:
-        result = BookService.delete_book(db, book_id)
-        return ResponseBase(
+        result = await AsyncBookService.delete_book(db, book_id)
+        return model_response(request, ResponseBase(
             status="success",
             data=result,
             message="도서가 성공적으로 삭제되었습니다"
-        )
+        ))
     except BusinessException as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -223,9 +548,10 @@ async def delete_book(
     description="도서의 재고를 추가하거나 차감합니다."
 )
 async def update_stock(
+    request: Request,
     book_id: int,
     stock_update: StockUpdateRequest,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ) -> ResponseBase[BookResponse]:
     """
     재고 관리 엔드포인트
@@ -240,14 +566,14 @@ async def update_stock(
     }
     """
     try:
-        book = BookService.update_stock(db, book_id, stock_update)
+        book = await AsyncBookService.update_stock(db, book_id, stock_update)
         
         operation_msg = "추가" if stock_update.operation == "add" else "차감"
-        return ResponseBase(
+        return model_response(request, ResponseBase(
             status="success",
-            data=BookResponse.from_orm(book),
+            data=book,
             message=f"재고가 {stock_update.quantity}개 {operation_msg}되었습니다. 현재 재고: {book.stock_quantity}개"
-        )
+        ))
     except BusinessException as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -4,15 +4,17 @@ Category API 엔드포인트
 - 일관된 응답 형식 적용
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from app.database import DBSession, get_read_session, get_session
 from app.schemas.category import (
     CategoryCreate, CategoryUpdate, CategoryResponse
 )
-from app.schemas.common import ResponseBase, PaginatedResponse
-from app.services.category_service import CategoryService
+from app.schemas.common import ResponseBase, PaginatedResponse, JobResponse
+from app.services.category_service import AsyncCategoryService, CategoryService
+from app.utils.http_cache import cache_headers, is_not_modified, make_etag, not_modified_response
+from app.utils.jobs import job_registry
 from app.utils.exceptions import BusinessException
+from app.utils.responses import model_response
 
 # 라우터 인스턴스 생성
 router = APIRouter(
@@ -29,8 +31,9 @@ router = APIRouter(
     description="새로운 도서 카테고리를 생성합니다."
 )
 async def create_category(
+    request: Request,
     category_data: CategoryCreate,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ) -> ResponseBase[CategoryResponse]:
     """
     카테고리 생성 엔드포인트
@@ -38,12 +41,12 @@ async def create_category(
     - 성공 시 201 Created 반환
     """
     try:
-        category = CategoryService.create_category(db, category_data)
-        return ResponseBase(
+        category = await AsyncCategoryService.create_category(db, category_data)
+        return model_response(request, ResponseBase(
             status="success",
             data=CategoryResponse.from_orm(category),
             message="카테고리가 성공적으로 생성되었습니다"
-        )
+        ))
     except BusinessException as e:
         raise HTTPException(
             status_code=e.status_code,
@@ -62,21 +65,93 @@ async def create_category(
     description="등록된 모든 카테고리를 조회합니다."
 )
 async def get_all_categories(
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: DBSession = Depends(get_read_session)
 ) -> ResponseBase[List[CategoryResponse]]:
     """
     전체 카테고리 목록 조회
     - 각 카테고리의 도서 개수 포함
+    - categories에는 수정 시각이 없으므로 ETag는 응답 데이터로 계산 (조회 1회, 일치 시 본문 전송 생략)
     """
     try:
-        categories = CategoryService.get_all_categories(db)
-        return ResponseBase(
+        categories = await AsyncCategoryService.get_all_categories(db)
+        data = [CategoryResponse.from_orm(cat) for cat in categories]
+        etag = make_etag("categories", *[category.json() for category in data])
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        response.headers.update(cache_headers(etag))
+        return model_response(request, ResponseBase(
             status="success",
-            data=[CategoryResponse.from_orm(cat) for cat in categories],
+            data=data,
             message=f"총 {len(categories)}개의 카테고리가 조회되었습니다"
+        ), response)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={"status": "error", "message": "서버 오류가 발생했습니다"}
+        )
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=ResponseBase[JobResponse],
+    summary="카테고리 작업 진행 상황 조회",
+    description="백그라운드 카테고리 삭제 작업의 상태와 진행률을 조회합니다."
+)
+async def get_category_job(request: Request, job_id: str) -> ResponseBase[JobResponse]:
+    """
+    백그라운드 작업 조회
+    - 작업 정보는 작업을 시작한 서버 프로세스 메모리에만 있음
+    """
+    job = job_registry.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"status": "error", "message": f"작업 (ID: {job_id})을(를) 찾을 수 없습니다"}
+        )
+    return model_response(request, ResponseBase(status="success", data=JobResponse.from_orm(job)))
+
+@router.delete(
+    "/{category_id}",
+    response_model=ResponseBase[dict],
+    summary="카테고리 삭제",
+    description=(
+        "카테고리를 삭제합니다. 소속 도서는 삭제되지 않고 카테고리 없음으로 변경됩니다. "
+        "background=true면 202 Accepted와 작업 정보를 반환하고 백그라운드에서 나눠서 처리합니다."
+    )
+)
+async def delete_category(
+    request: Request,
+    category_id: int,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    background: bool = Query(False, description="백그라운드 작업으로 실행 (진행률은 /categories/jobs/{job_id})"),
+    db: DBSession = Depends(get_session)
+) -> ResponseBase[dict]:
+    """
+    카테고리 삭제 엔드포인트
+    - 소속 도서는 집합 UPDATE로 category_id를 NULL로 변경
+    - 도서가 많은 카테고리는 background=true로 요청 처리 시간과 잠금 시간을 제한
+    """
+    try:
+        if background:
+            job = await AsyncCategoryService.start_delete_job(db, category_id)
+            background_tasks.add_task(CategoryService.run_delete_job, job, category_id)
+            response.status_code = status.HTTP_202_ACCEPTED
+            return model_response(request, ResponseBase(
+                status="success",
+                data=JobResponse.from_orm(job).dict(),
+                message="카테고리 삭제 작업이 시작되었습니다"
+            ), response)
+        result = await AsyncCategoryService.delete_category(db, category_id)
+        return model_response(request, ResponseBase(status="success", data=result, message=result["message"]))
+    except BusinessException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail={"status": "error", "message": e.message}
         )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail={"status": "error", "message": "서버 오류가 발생했습니다"}
-        )
\ No newline at end of file
+        )
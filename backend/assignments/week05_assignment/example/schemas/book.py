@@ -107,6 +107,13 @@ class BookResponse(BookBase):
     class Config:
         orm_mode = True
 
+# fields= 로 선택할 수 있는 도서 응답 필드 (응답 순서 기준)
+BOOK_RESPONSE_FIELDS = list(BookResponse.__fields__)
+
+# sort= 로 지정할 수 있는 정렬 필드 (-를 붙이면 내림차순), 한 번에 지정할 수 있는 최대 개수
+BOOK_SORT_FIELDS = ("title", "author", "price", "stock_quantity", "published_date", "created_at", "updated_at", "id")
+BOOK_SORT_MAX_KEYS = 3
+
 class StockUpdateRequest(BaseModel):
     """재고 수정 요청 스키마"""
     quantity: int = Field(..., gt=0, description="변경할 수량 (양수)")
@@ -118,6 +125,52 @@ class StockUpdateRequest(BaseModel):
             raise ValueError("operation은 'add' 또는 'subtract'만 가능합니다")
         return v
 
+class StockBatchItem(StockUpdateRequest):
+    """일괄 재고 변경 항목 - 도서 ID별 재고 변경 요청"""
+    book_id: int = Field(..., gt=0, description="도서 ID")
+
+class StockBatchRequest(BaseModel):
+    """
+    일괄 재고 변경 요청 스키마
+    - 한 주문의 여러 항목을 하나의 트랜잭션으로 처리
+    - 같은 도서가 여러 번 나오면 요청 순서대로 적용
+    """
+    items: List[StockBatchItem] = Field(
+        ...,
+        min_items=1,
+        max_items=500,
+        description="재고 변경 항목 목록"
+    )
+
+class StockBatchResult(BaseModel):
+    """일괄 재고 변경 항목별 결과"""
+    book_id: int
+    operation: str
+    quantity: int
+    stock_quantity: int = Field(..., description="해당 항목 적용 후 재고 수량")
+
+class BookImportResult(BaseModel):
+    """대량 등록 성공 항목"""
+    index: int = Field(..., description="요청 내 순번 (0부터)")
+    id: int
+    isbn: str
+
+class BookImportFailure(BaseModel):
+    """대량 등록 실패 항목"""
+    index: int = Field(..., description="요청 내 순번 (0부터)")
+    isbn: Optional[str] = None
+    error: str
+
+class BookImportResponse(BaseModel):
+    """
+    대량 등록 결과
+    - 행 단위로 성공/실패를 보고 (일부 실패해도 나머지는 등록)
+    """
+    success_count: int
+    failed_count: int
+    created_items: List[BookImportResult]
+    failed_items: List[BookImportFailure]
+
 class BookSearchParams(BaseModel):
     """도서 검색 파라미터"""
     search: Optional[str] = Field(None, description="검색어 (제목/저자)")
@@ -126,6 +179,60 @@ class BookSearchParams(BaseModel):
     max_price: Optional[int] = Field(None, ge=0, description="최대 가격")
     page: int = Field(1, gt=0, description="페이지 번호")
     size: int = Field(10, gt=0, le=100, description="페이지 크기")
+    cursor: Optional[str] = Field(None, description="다음 페이지 커서 (지정 시 page 무시)")
+    sort: Optional[str] = Field(
+        None,
+        description="정렬 기준 (relevance: 검색 관련도순, 또는 price,-published_date처럼 쉼표로 구분한 필드)"
+    )
+    count_strategy: str = Field(
+        "exact",
+        regex="^(exact|cached|estimated)$",
+        description="전체 개수 계산 방식 (exact, cached, estimated)"
+    )
+    fields: Optional[List[str]] = Field(None, description="응답에 포함할 필드 (쉼표 구분, id는 항상 포함)")
+    
+    @validator('sort')
+    def validate_sort(cls, v):
+        """
+        정렬 기준 검증 - relevance 또는 허용된 필드 목록 (-는 내림차순)
+        - 공백을 제거한 형태로 정규화 (커서에 기록되는 정렬 기준과 비교)
+        """
+        if v is None:
+            return None
+        v = v.replace(" ", "")
+        if v == "relevance":
+            return v
+        
+        names = [name[1:] if name.startswith("-") else name for name in v.split(",")]
+        if not all(names):
+            raise ValueError("정렬 필드가 비어 있습니다")
+        unknown = [name for name in names if name not in BOOK_SORT_FIELDS]
+        if unknown:
+            raise ValueError(
+                f"정렬할 수 없는 필드입니다: {', '.join(unknown)} "
+                f"(사용 가능: relevance 또는 {', '.join(BOOK_SORT_FIELDS)})"
+            )
+        if len(set(names)) != len(names):
+            raise ValueError("같은 정렬 필드를 여러 번 지정할 수 없습니다")
+        if len(names) > BOOK_SORT_MAX_KEYS:
+            raise ValueError(f"정렬 필드는 최대 {BOOK_SORT_MAX_KEYS}개까지 지정할 수 있습니다")
+        return v
+    
+    @validator('fields', pre=True)
+    def parse_fields(cls, v):
+        """쉼표 구분 문자열을 응답 필드 순서의 목록으로 변환 (id는 항상 포함)"""
+        if v is None:
+            return None
+        names = v.split(",") if isinstance(v, str) else v
+        requested = {name.strip() for name in names if name and name.strip()}
+        unknown = requested - set(BOOK_RESPONSE_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"알 수 없는 필드입니다: {', '.join(sorted(unknown))} "
+                f"(사용 가능: {', '.join(BOOK_RESPONSE_FIELDS)})"
+            )
+        requested.add("id")
+        return [name for name in BOOK_RESPONSE_FIELDS if name in requested]
     
     @validator('max_price')
     def validate_price_range(cls, v, values):
@@ -133,4 +240,19 @@ class BookSearchParams(BaseModel):
         min_price = values.get('min_price')
         if min_price is not None and v is not None and v < min_price:
             raise ValueError("최대 가격은 최소 가격보다 크거나 같아야 합니다")
-        return v
\ No newline at end of file
+        return v
+
+
+class BookChange(BaseModel):
+    """
+    변경분 동기화 스트림(NDJSON)의 한 줄
+    - upsert: 생성/수정된 도서 (book)
+    - delete: 삭제된 도서 (id, isbn, deleted_at)
+    - sync: 마지막 줄, 다음 요청에 사용할 토큰 (next_since) - 이 줄까지 받은 경우에만 토큰 저장
+    """
+    op: str
+    book: Optional[BookResponse] = None
+    id: Optional[int] = None
+    isbn: Optional[str] = None
+    deleted_at: Optional[datetime] = None
+    next_since: Optional[str] = None
@@ -23,7 +23,24 @@ class PaginationMeta(BaseModel):
     size: int
     total: int
     total_pages: int
+    total_exact: bool = True  # False면 total은 추정값
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
     
 class PaginatedResponse(ResponseBase[T]):
     """페이지네이션이 포함된 응답"""
-    meta: Optional[PaginationMeta] = None
\ No newline at end of file
+    meta: Optional[PaginationMeta] = None
+
+
+class JobResponse(BaseModel):
+    """백그라운드 작업 상태"""
+    id: str
+    kind: str
+    status: str  # "pending" | "running" | "completed" | "failed"
+    total: int
+    processed: int
+    progress: float  # 진행률 (0~100)
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    
+    class Config:
+        orm_mode = True
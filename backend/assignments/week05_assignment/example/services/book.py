@@ -4,47 +4,95 @@ Book 서비스 계층
 - 도서 관련 복잡한 비즈니스 로직 처리
 - 검색, 필터링, 페이지네이션 구현
 """
-from typing import List, Optional, Tuple
-from datetime import date
-from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, func
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Query, Session, load_only
+from sqlalchemy import and_, or_, func, select, update, insert
+from sqlalchemy.sql import Select
 from sqlalchemy.exc import IntegrityError
+from pydantic import ValidationError
+from app.config import STOCK_MODE_ATOMIC, STOCK_MODE_LOCK, settings
+from app.database import DBSession, after_commit, commit, reads_from_replica, run_in_session, supports_returning
 from app.models.book import Book
+from app.models.book_tombstone import BookTombstone
+from app.models.timestamps import precise_now
+from app.services.search_service import SearchService
 from app.models.category import Category
 from app.schemas.book import (
-    BookCreate, BookUpdate, StockUpdateRequest, BookSearchParams
+    BookCreate, BookUpdate, BookResponse, StockUpdateRequest, BookSearchParams,
+    StockBatchItem, StockBatchResult,
+    BookImportResponse, BookImportResult, BookImportFailure
 )
 from app.utils.exceptions import (
-    NotFoundException, DuplicateException, 
+    NotFoundException, DuplicateException, GoneException,
     InsufficientStockException, InvalidOperationException
 )
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_condition
+from app.utils.counting import (
+    COUNT_CACHED, COUNT_ESTIMATED, book_count_cache, estimate_count
+)
+from app.utils.ngram_index import book_ngram_index
+from app.utils.cache import book_cache, book_cache_key, get_book_entry, set_book_entry
+
+# 커서 토큰에 기록되는 정렬 기준
+BOOK_CURSOR_SORT = "id"
+BOOK_SORT_RELEVANCE = "relevance"
+
+# 재고 변경 방식 (STOCK_UPDATE_MODE=lock | atomic, 값은 config.Settings에서 검증해 읽음)
+STOCK_UPDATE_MODE = settings.stock_update_mode
+
+# 대량 등록 설정 - 요청당 최대 행 수, INSERT 한 번(executemany)에 넣을 행 수
+BOOK_IMPORT_MAX_ROWS = settings.book_import_max_rows
+BOOK_IMPORT_CHUNK_SIZE = settings.book_import_chunk_size
+
+# 변경분 동기화 설정
+# - 토큰에 기록되는 정렬 기준, 한 번에 조회하는 행 수
+# - 겹침 구간(초): 토큰 시각보다 이만큼 앞부터 다시 조회 (늦게 커밋된 트랜잭션, 복제 지연 대비)
+# - 삭제 기록 보존 기간(일): 이보다 오래된 토큰은 410 (전체 재동기화 필요)
+# (값은 config.Settings에서 검증해 읽음)
+BOOK_SYNC_SORT = "sync"
+BOOK_SYNC_PAGE_SIZE = settings.book_sync_page_size
+BOOK_SYNC_OVERLAP_SECONDS = settings.book_sync_overlap_seconds
+BOOK_TOMBSTONE_RETENTION_DAYS = settings.book_tombstone_retention_days
+
+# 내보내기 - 서버 측 커서에서 한 번에 읽어 전송하는 행 수
+BOOK_EXPORT_BATCH_SIZE = settings.book_export_batch_size
 
 class BookService:
     """도서 서비스 클래스"""
     
     @staticmethod
-    def create_book(db: Session, book_data: BookCreate) -> Book:
+    def create_book(db: Session, book_data: BookCreate) -> BookResponse:
         """
         도서 생성
         - 카테고리 존재 여부 확인
         - ISBN 중복 체크
+        - 생성된 값은 INSERT 결과(RETURNING)로 채우고 커밋 후 재조회하지 않음
+        - 캐시/메모리 색인 갱신은 커밋된 뒤에 실행 (요청 단위 트랜잭션이면 응답 직전 커밋 후)
+        - 카테고리명을 복사하는 동안 카테고리 행에 공유 잠금 - 동시에 커밋되는 카테고리명 변경이
+          새 도서를 빠뜨려 비정규화 이름이 어긋나지 않도록 (변경은 이 트랜잭션이 끝난 뒤 실행)
         """
-        # 카테고리 유효성 검증
+        # 카테고리 유효성 검증 (비정규화 카테고리명도 함께 확보)
+        category_name = None
         if book_data.category_id:
             category = db.query(Category).filter(
                 Category.id == book_data.category_id
-            ).first()
+            ).with_for_update(read=True).first()  # SELECT ... FOR SHARE
             if not category:
                 raise NotFoundException("카테고리", book_data.category_id)
+            category_name = category.name
         
         try:
-            db_book = Book(**book_data.dict())
+            db_book = Book(**book_data.dict(), category_name=category_name)
             db.add(db_book)
-            db.commit()
-            db.refresh(db_book)
+            db.flush()
+            SearchService.index_book(db, db_book)
+            response = BookResponse.from_orm(db_book)
+            after_commit(db, book_count_cache.invalidate)
+            after_commit(db, book_ngram_index.add, response.id, response.title, response.author)
+            commit(db)
             
-            # 카테고리 정보와 함께 반환
-            return BookService.get_book_by_id(db, db_book.id)
+            return response
         except IntegrityError as e:
             db.rollback()
             if "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
@@ -52,29 +100,150 @@ class BookService:
             raise
     
     @staticmethod
-    def get_all_books(
+    def import_books(
         db: Session, 
-        params: BookSearchParams
-    ) -> Tuple[List[Book], int]:
+        records: List[Any],
+        chunk_size: Optional[int] = None
+    ) -> BookImportResponse:
         """
-        도서 목록 조회 (검색, 필터링, 페이지네이션)
-        - 복잡한 쿼리 조건 처리
-        - N+1 문제 해결을 위한 eager loading
+        도서 대량 등록
+        - 행마다 BookCreate로 검증하고 실패한 행만 보고 (나머지는 등록)
+        - 카테고리 존재 여부는 IN 쿼리 한 번, ISBN 중복은 요청 내 + DB 조회 한 번으로 확인
+        - chunk_size 행씩 executemany로 INSERT 후 커밋
+          (두 번째 chunk부터는 카테고리명을 공유 잠금으로 다시 읽어 복사 - 커밋으로 잠금이 풀리므로)
+          (요청 단위 트랜잭션 안에서도 chunk마다 커밋 - 트랜잭션 크기를 제한하고 실패한 chunk만 롤백)
         """
-        # 기본 쿼리 - 카테고리 정보와 함께 조회
-        query = db.query(Book).options(
-            selectinload(Book.category)  # 별도 쿼리로 카테고리 정보 로드
+        if len(records) > BOOK_IMPORT_MAX_ROWS:
+            raise InvalidOperationException(
+                f"한 번에 최대 {BOOK_IMPORT_MAX_ROWS}건까지 등록할 수 있습니다"
+            )
+        chunk_size = chunk_size or BOOK_IMPORT_CHUNK_SIZE
+        failed: List[BookImportFailure] = []
+        
+        def fail(index: int, isbn: Optional[str], error: str) -> None:
+            failed.append(BookImportFailure(index=index, isbn=isbn, error=error))
+        
+        # 1. 행 단위 검증 + 요청 내 ISBN 중복 확인 (먼저 나온 행 우선)
+        pending: List[Tuple[int, BookCreate]] = []
+        seen_isbns: Dict[str, int] = {}
+        for index, record in enumerate(records):
+            if not isinstance(record, dict):
+                fail(index, None, "JSON 객체 형식이 아닙니다")
+                continue
+            try:
+                book_data = BookCreate.parse_obj(record)
+            except ValidationError as e:
+                fail(index, record.get("isbn"), "; ".join(
+                    f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                    for error in e.errors()
+                ))
+                continue
+            if book_data.isbn in seen_isbns:
+                fail(index, book_data.isbn, f"요청 내 중복된 ISBN입니다 (행 {seen_isbns[book_data.isbn]})")
+                continue
+            seen_isbns[book_data.isbn] = index
+            pending.append((index, book_data))
+        
+        # 2. 카테고리 존재 여부와 이름 - IN 쿼리 한 번 (create_book과 같은 이유로 공유 잠금)
+        category_ids = {book_data.category_id for _, book_data in pending if book_data.category_id}
+        category_names: Dict[int, str] = {}
+        if category_ids:
+            category_names = dict(db.query(Category.id, Category.name).filter(
+                Category.id.in_(category_ids)
+            ).with_for_update(read=True).all())
+        
+        # 3. DB의 기존 ISBN - 조회 한 번
+        existing_isbns = set()
+        if pending:
+            existing_isbns = {
+                isbn for isbn, in db.query(Book.isbn).filter(
+                    Book.isbn.in_([book_data.isbn for _, book_data in pending])
+                )
+            }
+        
+        valid: List[Tuple[int, BookCreate]] = []
+        for index, book_data in pending:
+            if book_data.category_id and book_data.category_id not in category_names:
+                fail(index, book_data.isbn, NotFoundException("카테고리", book_data.category_id).message)
+            elif book_data.isbn in existing_isbns:
+                fail(index, book_data.isbn, DuplicateException("ISBN", book_data.isbn).message)
+            else:
+                valid.append((index, book_data))
+        
+        # 4. chunk 단위 INSERT (executemany) - 생성된 id는 ISBN으로 한 번에 조회
+        created: List[BookImportResult] = []
+        for start in range(0, len(valid), chunk_size):
+            chunk = valid[start:start + chunk_size]
+            try:
+                # 앞 chunk의 커밋으로 잠금이 풀렸으므로 이 chunk의 카테고리명을 공유 잠금으로 다시 읽음
+                chunk_category_ids = {book_data.category_id for _, book_data in chunk if book_data.category_id}
+                if start > 0 and chunk_category_ids:
+                    category_names.update(db.query(Category.id, Category.name).filter(
+                        Category.id.in_(chunk_category_ids)
+                    ).with_for_update(read=True).all())
+                db.execute(insert(Book.__table__), [
+                    dict(book_data.dict(), category_name=category_names.get(book_data.category_id))
+                    for _, book_data in chunk
+                ])
+                ids = dict(db.query(Book.isbn, Book.id).filter(
+                    Book.isbn.in_([book_data.isbn for _, book_data in chunk])
+                ).all())
+                SearchService.index_new_books(db, [
+                    (ids[book_data.isbn], book_data.title, book_data.author)
+                    for _, book_data in chunk
+                ])
+                db.commit()
+            except IntegrityError:
+                # 검증 이후 다른 요청이 같은 ISBN을 등록한 경우 - 해당 chunk만 실패 처리
+                db.rollback()
+                for index, book_data in chunk:
+                    fail(index, book_data.isbn, "등록 중 ISBN 충돌이 발생했습니다")
+                continue
+            
+            for index, book_data in chunk:
+                created.append(BookImportResult(index=index, id=ids[book_data.isbn], isbn=book_data.isbn))
+                book_ngram_index.add(ids[book_data.isbn], book_data.title, book_data.author)
+        
+        if created:
+            book_count_cache.invalidate()
+        
+        failed.sort(key=lambda failure: failure.index)
+        return BookImportResponse(
+            success_count=len(created),
+            failed_count=len(failed),
+            created_items=created,
+            failed_items=failed
         )
+    
+    @staticmethod
+    def _filtered_query(db: Session, params: BookSearchParams) -> Tuple[Optional[Query], Any]:
+        """
+        검색/필터 조건이 적용된 도서 쿼리
+        - 반환값: (쿼리, 전문 검색 관련도 점수) - n-gram 후보가 없으면 쿼리는 None
+        """
+        # 기본 쿼리
+        query = db.query(Book)
         
         # 검색 조건 적용 (제목 또는 저자명)
+        score = None
         if params.search:
-            search_term = f"%{params.search}%"
-            query = query.filter(
-                or_(
-                    Book.title.like(search_term),
-                    Book.author.like(search_term)
+            candidate_ids = None
+            if params.sort != BOOK_SORT_RELEVANCE:
+                candidate_ids = book_ngram_index.candidates(db, params.search)
+            
+            if candidate_ids is not None:
+                # n-gram 후보가 없으면 DB 조회 없이 빈 결과
+                if not candidate_ids:
+                    return None, None
+                # 후보 id로 범위를 좁힌 뒤 LIKE로 최종 일치 확인
+                query = query.filter(
+                    Book.id.in_(candidate_ids),
+                    SearchService.like_condition(params.search)
                 )
-            )
+            else:
+                # 전문 검색 인덱스 (없으면 LIKE)
+                condition, score = SearchService.search_condition(db, params.search)
+                query = query.filter(condition)
         
         # 카테고리 필터
         if params.category_id:
@@ -86,70 +255,275 @@ class BookService:
         if params.max_price is not None:
             query = query.filter(Book.price <= params.max_price)
         
+        return query, score
+    
+    @staticmethod
+    def get_export_statement(db: Session, params: BookSearchParams) -> Optional[Select]:
+        """
+        내보내기 조회문 - 목록과 같은 검색/필터 조건, id 순 (페이지/커서/정렬/개수 옵션은 무시)
+        - 실행은 호출 측에서 서버 측 커서로 스트리밍 (stream_in_session)
+        - n-gram 후보가 없으면 None
+        """
+        query, _ = BookService._filtered_query(db, params)
+        if query is None:
+            return None
+        return query.order_by(Book.id).statement
+    
+    @staticmethod
+    def get_books_version(db: Session, params: BookSearchParams) -> Tuple[int, Optional[datetime]]:
+        """
+        목록 버전 (ETag 계산용) - 필터 범위의 도서 수와 최대 updated_at
+        - 도서 행을 읽지 않는 집계 조회 1회 (페이지/정렬과 무관)
+        - 추가/수정/삭제/카테고리 이동은 둘 중 하나를 반드시 바꿈
+        - cached: 캐시된 개수가 있으면 MAX(updated_at)만 조회, 없으면 센 개수를 캐시에 저장
+          (쓰기 시 캐시가 무효화되므로 캐시된 개수로 만든 ETag도 변경을 반영)
+        """
+        query, _ = BookService._filtered_query(db, params)
+        if query is None:
+            return 0, None
+        
+        key = None
+        if params.count_strategy == COUNT_CACHED:
+            key = BookService._count_cache_key(params)
+            count = book_count_cache.get(key)
+            if count is not None:
+                return count, query.with_entities(func.max(Book.updated_at)).scalar()
+        
+        count, last_updated = query.with_entities(
+            func.count(Book.id), func.max(Book.updated_at)
+        ).one()
+        if key is not None:
+            book_count_cache.set(key, count)
+        return count, last_updated
+    
+    @staticmethod
+    def get_all_books(
+        db: Session, 
+        params: BookSearchParams,
+        known_total: Optional[int] = None
+    ) -> Tuple[List[Book], int, bool, Optional[str]]:
+        """
+        도서 목록 조회 (검색, 필터링, 페이지네이션)
+        - 복잡한 쿼리 조건 처리
+        - cursor가 주어지면 OFFSET 대신 키셋 페이지네이션 사용
+        - count_strategy에 따라 전체 개수를 정확/캐시/추정값으로 계산
+        - search는 n-gram 메모리 색인으로 후보 id를 먼저 계산하고,
+          색인을 쓸 수 없으면 전문 검색 인덱스 사용 (sort=relevance로 관련도순 정렬)
+        - 카테고리명은 books.category_name(비정규화 컬럼)을 사용하므로 JOIN/추가 쿼리 없음
+        - known_total: 목록 버전 조회(get_books_version)로 이미 센 전체 개수 - 주어지면 COUNT 생략
+        - fields가 주어지면 해당 컬럼만 조회 (load_only)
+        - 반환값: (도서 목록, 전체 개수, 정확한 개수 여부, 다음 페이지 커서)
+        """
+        query, score = BookService._filtered_query(db, params)
+        if query is None:
+            return [], 0, True, None
+        
         # 전체 개수 조회 (페이지네이션용)
-        total = query.count()
+        if known_total is not None:
+            total, total_exact = known_total, True
+        else:
+            total, total_exact = BookService._count_books(query, params)
+        
+        # 정렬 키 - 페이지 간 결과가 겹치지 않도록 항상 id가 마지막 키
+        sort_name = BOOK_CURSOR_SORT
+        order_keys = [(Book.id, False)]
+        if params.sort == BOOK_SORT_RELEVANCE:
+            if not params.search:
+                raise InvalidOperationException("relevance 정렬은 search와 함께 사용해야 합니다")
+            sort_name = BOOK_SORT_RELEVANCE
+            if score is not None:
+                order_keys = [(score, True), (Book.id, False)]
+        elif params.sort:
+            sort_name = params.sort
+            order_keys = BookService._sort_keys(params.sort)
+        
+        query = query.order_by(
+            *[key.desc() if descending else key.asc() for key, descending in order_keys]
+        )
+        
+        if params.cursor:
+            # 키셋 페이지네이션 - 마지막 행 이후부터 조회 (깊은 페이지도 1페이지와 동일한 비용)
+            _, values = decode_cursor(params.cursor, sort=sort_name)
+            query = query.filter(keyset_condition(order_keys, BookService._cursor_values(order_keys, values)))
+        else:
+            # 오프셋 페이지네이션
+            query = query.offset((params.page - 1) * params.size)
+        
+        # 필드 선택(fields) 시 해당 컬럼만 SELECT - 나머지 속성은 로드하지 않으므로 응답에도 선택한 필드만 사용
+        if params.fields:
+            query = query.options(load_only(*[getattr(Book, field) for field in params.fields]))
         
-        # 페이지네이션 적용
-        offset = (params.page - 1) * params.size
-        books = query.offset(offset).limit(params.size).all()
+        # 커서 생성을 위해 정렬 키 값도 함께 조회
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        rows = query.add_columns(*[key for key, _ in order_keys]).limit(params.size + 1).all()
+        next_cursor = None
+        if len(rows) > params.size:
+            rows = rows[:params.size]
+            next_cursor = encode_cursor(sort_name, list(rows[-1][1:]))
+        books = [row[0] for row in rows]
+        
+        return books, total, total_exact, next_cursor
+    
+    @staticmethod
+    def _sort_keys(sort: str) -> List[Tuple[Any, bool]]:
+        """
+        sort 파라미터(예: "price,-published_date") -> (컬럼, 내림차순 여부) 목록
+        - 같은 값의 행 순서가 페이지마다 달라지지 않도록 id가 없으면 마지막 키로 추가
+        """
+        order_keys = [
+            (getattr(Book, name.lstrip("-")), name.startswith("-"))
+            for name in sort.split(",")
+        ]
+        if "id" not in [name.lstrip("-") for name in sort.split(",")]:
+            order_keys.append((Book.id, False))
+        return order_keys
+    
+    @staticmethod
+    def _cursor_values(order_keys: List[Tuple[Any, bool]], values: List[Any]) -> List[Any]:
+        """커서 토큰(JSON)에 문자열로 기록된 날짜/시각 값을 컬럼 타입으로 복원"""
+        if len(order_keys) != len(values):
+            raise InvalidOperationException("유효하지 않은 커서입니다")
+        
+        restored = []
+        for (key, _), value in zip(order_keys, values):
+            if isinstance(value, str):
+                try:
+                    python_type = key.type.python_type
+                    if python_type in (date, datetime):
+                        value = python_type.fromisoformat(value)
+                except NotImplementedError:
+                    pass
+                except ValueError:
+                    raise InvalidOperationException("유효하지 않은 커서입니다")
+            restored.append(value)
+        return restored
+    
+    @staticmethod
+    def _count_books(query, params: BookSearchParams) -> Tuple[int, bool]:
+        """
+        필터가 적용된 쿼리의 전체 개수 계산
+        - cached: 정규화된 필터 조합별 COUNT 결과 재사용
+        - estimated: id 구간 샘플링으로 근사값 계산
+        - 반환값: (개수, 정확한 값 여부)
+        """
+        if params.count_strategy == COUNT_ESTIMATED:
+            return estimate_count(query, Book.id)
         
-        # 카테고리명 추가
-        for book in books:
-            if book.category:
-                book.category_name = book.category.name
+        if params.count_strategy == COUNT_CACHED:
+            key = BookService._count_cache_key(params)
+            total = book_count_cache.get(key)
+            if total is None:
+                total = query.count()
+                book_count_cache.set(key, total)
+            return total, True
         
-        return books, total
+        return query.count(), True
+    
+    @staticmethod
+    def _count_cache_key(params: BookSearchParams) -> Tuple[Any, ...]:
+        """개수 캐시 키 - 정규화된 필터 조합 (페이지/정렬/필드와 무관)"""
+        return (
+            params.search.strip().lower() if params.search else None,
+            params.category_id,
+            params.min_price,
+            params.max_price,
+        )
     
     @staticmethod
     def get_book_by_id(db: Session, book_id: int) -> Book:
         """
         특정 도서 상세 조회
-        - 카테고리 정보 포함
+        - 카테고리명은 비정규화 컬럼에 포함되어 JOIN 불필요
         """
-        book = db.query(Book).options(
-            joinedload(Book.category)  # JOIN을 통한 카테고리 정보 로드
-        ).filter(Book.id == book_id).first()
+        book = db.query(Book).filter(Book.id == book_id).first()
         
         if not book:
             raise NotFoundException("도서", book_id)
         
-        # 카테고리명 추가
-        if book.category:
-            book.category_name = book.category.name
-        
         return book
     
+    @staticmethod
+    def get_book_updated_at(db: Session, book_id: int, read_cache: bool = True) -> datetime:
+        """
+        도서 수정 시각만 조회 (조건부 요청 검증용)
+        - 캐시에 응답이 있으면 DB 조회 없이 캐시 값 사용 (쓰기 경로에서 무효화되므로 최신)
+        - 없거나 read_cache=False(최근 쓰기 요청을 보낸 클라이언트)면 updated_at 한 컬럼만 조회
+        """
+        if read_cache:
+            cached = get_book_entry(book_id)
+            if cached is not None:
+                return BookResponse.parse_raw(cached).updated_at
+        
+        updated_at = db.query(Book.updated_at).filter(Book.id == book_id).scalar()
+        if updated_at is None:
+            raise NotFoundException("도서", book_id)
+        return updated_at
+    
+    @staticmethod
+    def get_book_response(db: Session, book_id: int, read_cache: bool = True) -> BookResponse:
+        """
+        도서 상세 응답 조회 (read-through 캐시)
+        - 캐시에 직렬화된 응답이 있으면 DB 조회 없이 반환
+        - 없으면 DB에서 조회 후 캐시에 저장
+        - 도서 쓰기 경로에서 무효화, 카테고리명 변경/삭제 시에는 카테고리 버전이 바뀌어 miss
+        - 캐시는 primary에서 읽은 값으로만 채움 (복제 지연 중인 복제본 값이 무효화 직후
+          다시 캐시되어 TTL 동안 남는 것 방지)
+        - read_cache=False면 캐시를 읽지 않고 DB에서 조회 (최근 쓰기 요청을 보낸 클라이언트)
+        """
+        if read_cache:
+            cached = get_book_entry(book_id)
+            if cached is not None:
+                return BookResponse.parse_raw(cached)
+        
+        response = BookResponse.from_orm(BookService.get_book_by_id(db, book_id))
+        if not reads_from_replica(db):
+            set_book_entry(book_id, response.category_id, response.json())
+        return response
+    
     @staticmethod
     def update_book(
         db: Session, 
         book_id: int, 
         book_data: BookUpdate
-    ) -> Book:
+    ) -> BookResponse:
         """
         도서 정보 수정
         - 부분 업데이트 지원
         - ISBN 중복 체크
+        - 변경된 updated_at은 UPDATE 결과(RETURNING)로 채우고 커밋 후 재조회하지 않음
         """
         book = BookService.get_book_by_id(db, book_id)
         
-        # 카테고리 변경 시 유효성 검증
+        # 카테고리 변경 시 유효성 검증 및 비정규화 카테고리명 갱신 (create_book과 같이 공유 잠금)
         if book_data.category_id is not None:
+            book.category_name = None
             if book_data.category_id:  # None이 아니고 0이 아닌 경우
                 category = db.query(Category).filter(
                     Category.id == book_data.category_id
-                ).first()
+                ).with_for_update(read=True).first()
                 if not category:
                     raise NotFoundException("카테고리", book_data.category_id)
+                book.category_name = category.name
         
-        # 변경사항 적용
+        # 변경사항 적용 (검색 색인 갱신을 위해 기존 제목/저자 보관)
+        old_title, old_author = book.title, book.author
         update_data = book_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(book, field, value)
         
         try:
-            db.commit()
-            db.refresh(book)
-            return BookService.get_book_by_id(db, book_id)
+            db.flush()
+            if "title" in update_data or "author" in update_data:
+                SearchService.index_book(db, book)
+            # 커밋 시 속성이 만료되므로 커밋 전에 응답 생성 (서버 생성 값은 eager_defaults로 조회됨)
+            response = BookResponse.from_orm(book)
+            after_commit(db, book_count_cache.invalidate)
+            after_commit(db, book_cache.delete, book_cache_key(book_id))
+            if (old_title, old_author) != (response.title, response.author):
+                after_commit(db, book_ngram_index.remove, book_id, old_title, old_author)
+                after_commit(db, book_ngram_index.add, book_id, response.title, response.author)
+            commit(db)
+            return response
         except IntegrityError:
             db.rollback()
             if book_data.isbn:
@@ -158,26 +532,118 @@ class BookService:
     
     @staticmethod
     def delete_book(db: Session, book_id: int) -> dict:
-        """도서 삭제"""
+        """
+        도서 삭제
+        - 변경분 동기화를 위해 같은 트랜잭션에서 삭제 기록(tombstone) 추가
+        - 보존 기간이 지난 삭제 기록은 이때 함께 정리
+        """
         book = BookService.get_book_by_id(db, book_id)
-        book_title = book.title
+        book_title, book_author = book.title, book.author
         
         db.delete(book)
-        db.commit()
+        db.add(BookTombstone(book_id=book_id, isbn=book.isbn))
+        SearchService.remove_books(db, [book_id])
+        BookService.purge_tombstones(db)
+        after_commit(db, book_count_cache.invalidate)
+        after_commit(db, book_cache.delete, book_cache_key(book_id))
+        after_commit(db, book_ngram_index.remove, book_id, book_title, book_author)
+        commit(db)
         
         return {"message": f"도서 '{book_title}'이(가) 삭제되었습니다"}
     
+    @staticmethod
+    def purge_tombstones(db: Session) -> int:
+        """
+        보존 기간이 지난 삭제 기록 정리 (커밋은 호출 측에서)
+        - deleted_at 인덱스 범위 삭제, 정리한 행 수 반환
+        """
+        cutoff = db.query(precise_now()).scalar() - timedelta(days=BOOK_TOMBSTONE_RETENTION_DAYS)
+        return db.query(BookTombstone).filter(
+            BookTombstone.deleted_at < cutoff
+        ).delete(synchronize_session=False)
+    
+    @staticmethod
+    def start_sync(db: Session, since: Optional[str] = None) -> Tuple[Optional[datetime], str]:
+        """
+        변경분 동기화 시작
+        - 반환: (조회 하한 시각, 다음 동기화 토큰) - 토큰이 없으면 하한 없이 전체 스냅샷
+        - 다음 토큰은 조회 시작 시점의 DB 시각 (이후의 변경은 다음 동기화에서 전달)
+        - 하한은 토큰 시각에서 겹침 구간을 뺀 값: 토큰 발급 시점에 진행 중이던 트랜잭션이
+          더 이른 updated_at으로 늦게 커밋되거나 복제본에 늦게 반영되어도 누락되지 않음
+          (겹침 구간의 변경은 다시 전달될 수 있으므로 클라이언트는 id 기준으로 덮어씀)
+        - 토큰이 삭제 기록 보존 기간보다 오래되면 GoneException (전체 재동기화 필요)
+        """
+        now = db.query(precise_now()).scalar()
+        next_token = encode_cursor(BOOK_SYNC_SORT, [now.isoformat()])
+        if not since:
+            return None, next_token
+        
+        try:
+            _, values = decode_cursor(since, sort=BOOK_SYNC_SORT)
+            since_at = datetime.fromisoformat(values[0])
+        except (InvalidOperationException, TypeError, ValueError):
+            raise InvalidOperationException("유효하지 않은 동기화 토큰입니다")
+        
+        if since_at < now - timedelta(days=BOOK_TOMBSTONE_RETENTION_DAYS):
+            raise GoneException(
+                f"동기화 토큰이 {BOOK_TOMBSTONE_RETENTION_DAYS}일 보존 기간을 지났습니다. "
+                "since 없이 전체 목록을 다시 받아야 합니다"
+            )
+        return since_at - timedelta(seconds=BOOK_SYNC_OVERLAP_SECONDS), next_token
+    
+    @staticmethod
+    def get_changed_books(
+        db: Session, 
+        since: Optional[datetime],
+        after: Optional[List[Any]] = None,
+        limit: int = BOOK_SYNC_PAGE_SIZE
+    ) -> List[Book]:
+        """
+        생성/수정된 도서 한 페이지 조회
+        - (updated_at, id) 인덱스 순서로 키셋 조회, after는 이전 페이지 마지막 행의 (updated_at, id)
+        """
+        query = db.query(Book)
+        if since is not None:
+            query = query.filter(Book.updated_at > since)
+        if after:
+            query = query.filter(keyset_condition([(Book.updated_at, False), (Book.id, False)], after))
+        return query.order_by(Book.updated_at, Book.id).limit(limit).all()
+    
+    @staticmethod
+    def get_deleted_books(
+        db: Session, 
+        since: Optional[datetime],
+        after_id: Optional[int] = None,
+        limit: int = BOOK_SYNC_PAGE_SIZE
+    ) -> List[BookTombstone]:
+        """
+        삭제된 도서 한 페이지 조회
+        - 삭제 기록은 삭제 순서로 id가 증가하므로 id로 키셋 조회
+        - 전체 스냅샷(since 없음)에는 삭제 기록이 필요 없으므로 빈 목록
+        """
+        if since is None:
+            return []
+        query = db.query(BookTombstone).filter(BookTombstone.deleted_at > since)
+        if after_id is not None:
+            query = query.filter(BookTombstone.id > after_id)
+        return query.order_by(BookTombstone.id).limit(limit).all()
+    
     @staticmethod
     def update_stock(
         db: Session, 
         book_id: int, 
-        stock_update: StockUpdateRequest
-    ) -> Book:
+        stock_update: StockUpdateRequest,
+        mode: Optional[str] = None
+    ) -> BookResponse:
         """
         재고 수량 변경
         - 트랜잭션 처리로 동시성 문제 방지
         - 음수 재고 방지
+        - mode 미지정 시 STOCK_UPDATE_MODE 설정 사용
         """
+        if (mode or STOCK_UPDATE_MODE) == STOCK_MODE_ATOMIC:
+            return BookService._update_stock_atomic(db, book_id, stock_update)
+        
         # 행 잠금(row lock)을 통한 동시성 제어
         book = db.query(Book).filter(
             Book.id == book_id
@@ -201,7 +667,215 @@ class BookService:
                 f"유효하지 않은 작업: {stock_update.operation}"
             )
         
-        db.commit()
-        db.refresh(book)
+        db.flush()
+        response = BookResponse.from_orm(book)
+        after_commit(db, book_cache.delete, book_cache_key(book_id))
+        commit(db)
+        
+        return response
+    
+    @staticmethod
+    def _update_stock_atomic(
+        db: Session, 
+        book_id: int, 
+        stock_update: StockUpdateRequest
+    ) -> BookResponse:
+        """
+        재고 수량 변경 (조건부 UPDATE, 행 잠금 없음)
+        - UPDATE books SET stock_quantity = stock_quantity - :q
+          WHERE id = :id AND stock_quantity >= :q
+        - 변경된 행이 없으면 도서 없음/재고 부족 여부만 추가로 확인
+        - RETURNING 지원 시 응답까지 한 번에 조회, 그 외에는 SELECT 한 번 추가
+        """
+        books = Book.__table__
+        quantity = stock_update.quantity
+        statement = update(books).where(books.c.id == book_id)
+        
+        if stock_update.operation == "add":
+            statement = statement.values(stock_quantity=books.c.stock_quantity + quantity)
+        elif stock_update.operation == "subtract":
+            statement = statement.where(books.c.stock_quantity >= quantity).values(
+                stock_quantity=books.c.stock_quantity - quantity
+            )
+        else:
+            raise InvalidOperationException(
+                f"유효하지 않은 작업: {stock_update.operation}"
+            )
+        
+        if supports_returning(db):
+            row = db.execute(statement.returning(*books.c)).first()
+            updated = row is not None
+        else:
+            updated = db.execute(statement).rowcount == 1
+            row = None
+        
+        if not updated:
+            current_stock = db.query(Book.stock_quantity).filter(Book.id == book_id).scalar()
+            if current_stock is None:
+                raise NotFoundException("도서", book_id)
+            raise InsufficientStockException(current_stock, quantity)
+        
+        if row is None:
+            row = db.execute(
+                select(*books.c).where(books.c.id == book_id)
+            ).first()
+        response = BookResponse.parse_obj(dict(row._mapping))
+        after_commit(db, book_cache.delete, book_cache_key(book_id))
+        commit(db)
+        
+        return response
+    
+    @staticmethod
+    def update_stock_batch(
+        db: Session, 
+        items: List[StockBatchItem]
+    ) -> List[StockBatchResult]:
+        """
+        일괄 재고 변경 (주문 단위)
+        - 모든 항목을 하나의 트랜잭션으로 처리, 하나라도 실패하면 전체 미적용
+        - 대상 도서를 id 오름차순으로 한 번에 잠가 트랜잭션 간 잠금 순서 고정 (교착 상태 방지)
+        - 같은 도서의 여러 항목은 요청 순서대로 적용
+        """
+        book_ids = sorted({item.book_id for item in items})
+        books = {
+            book.id: book for book in db.query(Book).filter(
+                Book.id.in_(book_ids)
+            ).order_by(Book.id).with_for_update().all()  # SELECT ... ORDER BY id FOR UPDATE
+        }
+        
+        # 모든 항목을 검증한 뒤에만 도서에 반영
+        stock = {book_id: book.stock_quantity for book_id, book in books.items()}
+        results = []
+        for item in items:
+            if item.book_id not in books:
+                raise NotFoundException("도서", item.book_id)
+            
+            if item.operation == "add":
+                stock[item.book_id] += item.quantity
+            elif item.operation == "subtract":
+                if stock[item.book_id] < item.quantity:
+                    raise InsufficientStockException(
+                        stock[item.book_id], 
+                        item.quantity,
+                        item.book_id
+                    )
+                stock[item.book_id] -= item.quantity
+            else:
+                raise InvalidOperationException(
+                    f"유효하지 않은 작업: {item.operation}"
+                )
+            
+            results.append(StockBatchResult(
+                book_id=item.book_id,
+                operation=item.operation,
+                quantity=item.quantity,
+                stock_quantity=stock[item.book_id]
+            ))
+        
+        for book_id, book in books.items():
+            book.stock_quantity = stock[book_id]
+        after_commit(db, book_cache.delete, *[book_cache_key(book_id) for book_id in book_ids])
+        commit(db)
         
-        return BookService.get_book_by_id(db, book_id)
\ No newline at end of file
+        return results
+
+
+class AsyncBookService:
+    """
+    도서 서비스 비동기 래퍼
+    - BookService의 동일한 로직을 이벤트 루프를 막지 않고 실행
+    - AsyncSession이면 run_sync, 동기 Session이면 스레드풀 사용
+    """
+    
+    @staticmethod
+    async def create_book(db: DBSession, book_data: BookCreate) -> BookResponse:
+        return await run_in_session(db, BookService.create_book, book_data)
+    
+    @staticmethod
+    async def import_books(
+        db: DBSession, 
+        records: List[Any],
+        chunk_size: Optional[int] = None
+    ) -> BookImportResponse:
+        return await run_in_session(db, BookService.import_books, records, chunk_size)
+    
+    @staticmethod
+    async def get_all_books(
+        db: DBSession, 
+        params: BookSearchParams,
+        known_total: Optional[int] = None
+    ) -> Tuple[List[Book], int, bool, Optional[str]]:
+        return await run_in_session(db, BookService.get_all_books, params, known_total)
+    
+    @staticmethod
+    async def get_export_statement(db: DBSession, params: BookSearchParams) -> Optional[Select]:
+        return await run_in_session(db, BookService.get_export_statement, params)
+    
+    @staticmethod
+    async def get_books_version(
+        db: DBSession, 
+        params: BookSearchParams
+    ) -> Tuple[int, Optional[datetime]]:
+        return await run_in_session(db, BookService.get_books_version, params)
+    
+    @staticmethod
+    async def get_book_updated_at(db: DBSession, book_id: int, read_cache: bool = True) -> datetime:
+        return await run_in_session(db, BookService.get_book_updated_at, book_id, read_cache)
+    
+    @staticmethod
+    async def get_book_by_id(db: DBSession, book_id: int) -> Book:
+        return await run_in_session(db, BookService.get_book_by_id, book_id)
+    
+    @staticmethod
+    async def get_book_response(db: DBSession, book_id: int, read_cache: bool = True) -> BookResponse:
+        return await run_in_session(db, BookService.get_book_response, book_id, read_cache)
+    
+    @staticmethod
+    async def update_book(
+        db: DBSession, 
+        book_id: int, 
+        book_data: BookUpdate
+    ) -> BookResponse:
+        return await run_in_session(db, BookService.update_book, book_id, book_data)
+    
+    @staticmethod
+    async def delete_book(db: DBSession, book_id: int) -> dict:
+        return await run_in_session(db, BookService.delete_book, book_id)
+    
+    @staticmethod
+    async def start_sync(db: DBSession, since: Optional[str] = None) -> Tuple[Optional[datetime], str]:
+        return await run_in_session(db, BookService.start_sync, since)
+    
+    @staticmethod
+    async def get_changed_books(
+        db: DBSession, 
+        since: Optional[datetime],
+        after: Optional[List[Any]] = None,
+        limit: int = BOOK_SYNC_PAGE_SIZE
+    ) -> List[Book]:
+        return await run_in_session(db, BookService.get_changed_books, since, after, limit)
+    
+    @staticmethod
+    async def get_deleted_books(
+        db: DBSession, 
+        since: Optional[datetime],
+        after_id: Optional[int] = None,
+        limit: int = BOOK_SYNC_PAGE_SIZE
+    ) -> List[BookTombstone]:
+        return await run_in_session(db, BookService.get_deleted_books, since, after_id, limit)
+    
+    @staticmethod
+    async def update_stock(
+        db: DBSession, 
+        book_id: int, 
+        stock_update: StockUpdateRequest,
+        mode: Optional[str] = None
+    ) -> BookResponse:
+        return await run_in_session(db, BookService.update_stock, book_id, stock_update, mode)
+    
+    @staticmethod
+    async def update_stock_batch(
+        db: DBSession, 
+        items: List[StockBatchItem]
+    ) -> List[StockBatchResult]:
+        return await run_in_session(db, BookService.update_stock_batch, items)
@@ -5,11 +5,21 @@ Category 서비스 계층
 - 데이터베이스 트랜잭션 관리
 """
 from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from app.config import settings
+from app.database import DBSession, SessionLocal, after_commit, commit, run_in_session
+from app.models.book import Book
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
-from app.utils.exceptions import NotFoundException, DuplicateException
+from app.utils.exceptions import BusinessException, NotFoundException, DuplicateException
+from app.utils.counting import book_count_cache
+from app.utils.cache import bump_category_version
+from app.utils.jobs import Job, job_registry
+
+# 백그라운드 카테고리 삭제 시 한 트랜잭션에서 카테고리를 해제할 도서 수
+CATEGORY_DELETE_BATCH_SIZE = settings.category_delete_batch_size
 
 class CategoryService:
     """카테고리 서비스 클래스"""
@@ -24,7 +34,7 @@ class CategoryService:
             # 새 카테고리 객체 생성
             db_category = Category(**category_data.dict())
             db.add(db_category)
-            db.commit()
+            commit(db)
             db.refresh(db_category)  # ID 등 자동 생성 필드 갱신
             return db_category
         except IntegrityError as e:
@@ -38,15 +48,20 @@ class CategoryService:
     def get_all_categories(db: Session) -> List[Category]:
         """
         전체 카테고리 조회
-        - 도서 개수 정보와 함께 조회 (N+1 문제 해결)
+        - 도서 개수는 상관 서브쿼리 COUNT로 함께 조회 (N+1 문제 해결)
+        - 도서 행을 ORM 객체로 불러오지 않으므로 비용은 카테고리 수에 비례
+          (books.category_id 인덱스 범위 COUNT)
         """
-        categories = db.query(Category).options(
-            joinedload(Category.books)  # 한 번의 쿼리로 관련 도서 정보도 조회
-        ).all()
+        book_count = select(func.count(Book.id)).where(
+            Book.category_id == Category.id
+        ).scalar_subquery()
+        rows = db.query(Category, book_count).all()
         
-        # 각 카테고리의 도서 개수 계산
-        for category in categories:
-            category.book_count = len(category.books)
+        # 각 카테고리에 도서 개수 설정
+        categories = []
+        for category, count in rows:
+            category.book_count = count
+            categories.append(category)
         
         return categories
     
@@ -74,8 +89,14 @@ class CategoryService:
         """
         카테고리 수정
         - 부분 업데이트 지원 (PATCH)
+        - 카테고리 행을 먼저 잠가(FOR UPDATE) 이름을 복사 중인 도서 생성/수정(FOR SHARE)이
+          끝난 뒤 도서의 비정규화 카테고리명을 갱신 (잠금 순서: 카테고리 -> 도서)
         """
-        category = CategoryService.get_category_by_id(db, category_id)
+        category = db.query(Category).filter(
+            Category.id == category_id
+        ).with_for_update().first()  # SELECT ... FOR UPDATE
+        if not category:
+            raise NotFoundException("카테고리", category_id)
         
         # 변경할 데이터만 업데이트
         update_data = category_data.dict(exclude_unset=True)
@@ -83,7 +104,15 @@ class CategoryService:
             setattr(category, field, value)
         
         try:
-            db.commit()
+            # 도서의 비정규화 카테고리명을 UPDATE 한 번으로 갱신 (같은 트랜잭션)
+            if "name" in update_data:
+                db.query(Book).filter(Book.category_id == category_id).update(
+                    {Book.category_name: category.name},
+                    synchronize_session=False
+                )
+                # 캐시된 도서 응답의 카테고리명은 커밋 후 카테고리 버전을 바꿔 한 번에 무효화
+                after_commit(db, bump_category_version, category_id)
+            commit(db)
             db.refresh(category)
             return category
         except IntegrityError:
@@ -91,17 +120,135 @@ class CategoryService:
             raise DuplicateException("카테고리명", category_data.name)
     
     @staticmethod
-    def delete_category(db: Session, category_id: int) -> dict:
+    def delete_category(
+        db: Session,
+        category_id: int,
+        batch_size: Optional[int] = None,
+        job: Optional[Job] = None
+    ) -> dict:
         """
         카테고리 삭제
-        - cascade 옵션에 따라 연관 도서도 함께 삭제
+        - 소속 도서는 삭제하지 않고 category_id/category_name을 NULL로 변경
+          (Book.category_id FK의 ondelete="SET NULL"과 같은 결과)
+        - 도서를 ORM 객체로 불러오지 않고 집합 UPDATE/DELETE 문으로 처리
+        - batch_size 미지정: UPDATE 1회 + DELETE 1회를 한 트랜잭션으로 실행
+        - batch_size 지정: 도서를 batch_size개씩 나눠 커밋해 잠금 시간을 제한하고 job에 진행률 기록
+          (백그라운드 작업 전용 - 요청 단위 트랜잭션 밖의 별도 세션)
         """
         category = CategoryService.get_category_by_id(db, category_id)
         
         # 삭제 전 정보 저장 (응답용)
         category_name = category.name
         
+        in_category = Book.category_id == category_id
+        if batch_size is None:
+            detached = CategoryService._detach_books(db, in_category)
+        else:
+            detached = 0
+            while True:
+                # 처리된 도서는 조건에서 빠지므로 매번 앞에서부터 batch_size개 조회
+                book_ids = [
+                    book_id for book_id, in db.query(Book.id)
+                    .filter(in_category)
+                    .order_by(Book.id)
+                    .limit(batch_size)
+                ]
+                if not book_ids:
+                    break
+                CategoryService._detach_books(db, and_(in_category, Book.id.in_(book_ids)))
+                db.commit()
+                bump_category_version(category_id)
+                detached += len(book_ids)
+                if job is not None:
+                    job.advance(len(book_ids))
+        
+        # passive_deletes=True이므로 소속 도서를 불러오지 않고 카테고리 행만 삭제
         db.delete(category)
-        db.commit()
+        # 도서의 카테고리가 바뀌었으므로 카테고리 필터 COUNT 캐시와 상세 캐시 무효화
+        # (도서 자체는 남아 있으므로 검색 색인은 그대로 유지)
+        after_commit(db, book_count_cache.invalidate)
+        after_commit(db, bump_category_version, category_id)
+        commit(db)
         
-        return {"message": f"카테고리 '{category_name}'이(가) 삭제되었습니다"}
+        return {
+            "message": f"카테고리 '{category_name}'이(가) 삭제되었습니다",
+            "detached_books": detached
+        }
+    
+    @staticmethod
+    def _detach_books(db: Session, criterion) -> int:
+        """조건에 맞는 도서의 카테고리를 UPDATE 한 번으로 해제 - 해제한 도서 수 반환"""
+        return db.query(Book).filter(criterion).update(
+            {Book.category_id: None, Book.category_name: None},
+            synchronize_session=False
+        )
+    
+    @staticmethod
+    def start_delete_job(db: Session, category_id: int) -> Job:
+        """
+        백그라운드 카테고리 삭제 작업 등록
+        - 존재 여부를 먼저 확인하고 소속 도서 수를 전체 작업량으로 기록
+        """
+        CategoryService.get_category_by_id(db, category_id)
+        total = db.query(func.count(Book.id)).filter(Book.category_id == category_id).scalar()
+        return job_registry.create("category_delete", total)
+    
+    @staticmethod
+    def run_delete_job(job: Job, category_id: int) -> None:
+        """
+        백그라운드 카테고리 삭제 실행
+        - 요청 세션은 응답 후 닫히므로 별도 세션 사용
+        - 결과/오류는 job에 기록 (호출한 요청은 이미 응답했으므로 예외를 전파하지 않음)
+        """
+        job.start()
+        db = SessionLocal()
+        try:
+            result = CategoryService.delete_category(
+                db, category_id, batch_size=CATEGORY_DELETE_BATCH_SIZE, job=job
+            )
+            job.complete(result)
+        except BusinessException as e:
+            db.rollback()
+            job.fail(e.message)
+        except Exception:
+            db.rollback()
+            job.fail("서버 오류가 발생했습니다")
+        finally:
+            db.close()
+
+
+class AsyncCategoryService:
+    """
+    카테고리 서비스 비동기 래퍼
+    - CategoryService의 동일한 로직을 이벤트 루프를 막지 않고 실행
+    """
+    
+    @staticmethod
+    async def create_category(db: DBSession, category_data: CategoryCreate) -> Category:
+        return await run_in_session(db, CategoryService.create_category, category_data)
+    
+    @staticmethod
+    async def get_all_categories(db: DBSession) -> List[Category]:
+        return await run_in_session(db, CategoryService.get_all_categories)
+    
+    @staticmethod
+    async def get_category_by_id(db: DBSession, category_id: int) -> Category:
+        return await run_in_session(db, CategoryService.get_category_by_id, category_id)
+    
+    @staticmethod
+    async def update_category(
+        db: DBSession, 
+        category_id: int, 
+        category_data: CategoryUpdate
+    ) -> Category:
+        return await run_in_session(
+            db, CategoryService.update_category, category_id, category_data
+        )
+    
+    @staticmethod
+    async def delete_category(db: DBSession, category_id: int) -> dict:
+        return await run_in_session(db, CategoryService.delete_category, category_id)
+    
+    @staticmethod
+    async def start_delete_job(db: DBSession, category_id: int) -> Job:
+        return await run_in_session(db, CategoryService.start_delete_job, category_id)
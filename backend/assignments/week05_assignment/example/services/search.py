@@ -0,0 +1,189 @@
+# app/services/search_service.py
+"""
+전문 검색(Full-Text Search) 서비스 계층
+- MySQL: ngram 파서를 사용하는 FULLTEXT 인덱스 (한글 부분 일치 지원)
+- SQLite: FTS5 섀도 테이블 (trigram 토크나이저 우선)
+- 그 외 / 인덱스가 없는 DB: 기존 LIKE 검색으로 대체
+"""
+import re
+import weakref
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.models.book import Book
+
+# 인덱스/테이블 이름
+MYSQL_FULLTEXT_INDEX = "ft_books_title_author"
+SQLITE_FTS_TABLE = "books_fts"
+
+# 검색 백엔드 종류
+BACKEND_MYSQL = "mysql_fulltext"
+BACKEND_SQLITE = "sqlite_fts5"
+BACKEND_LIKE = "like"
+
+# FTS5 섀도 테이블 - rowid는 books.id와 동일
+books_fts = table(SQLITE_FTS_TABLE, column("rowid"), column("title"), column("author"))
+_fts = literal_column(SQLITE_FTS_TABLE)
+
+# MySQL BOOLEAN MODE 연산자 제거용
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+# 엔진별 검색 백엔드 정보 캐시: engine -> (백엔드, 최소 검색어 길이)
+_backends: "weakref.WeakKeyDictionary[Engine, Tuple[str, int]]" = weakref.WeakKeyDictionary()
+
+
+def _mysql_fulltext_exists(conn) -> bool:
+    """books 테이블에 FULLTEXT 인덱스가 있는지 확인"""
+    return bool(conn.execute(text(
+        "SELECT COUNT(*) FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'books' "
+        "AND INDEX_NAME = :name"
+    ), {"name": MYSQL_FULLTEXT_INDEX}).scalar())
+
+
+def _sqlite_fts_ddl(conn) -> Optional[str]:
+    """FTS5 섀도 테이블의 생성 DDL (없으면 None)"""
+    return conn.execute(text(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"
+    ), {"name": SQLITE_FTS_TABLE}).scalar()
+
+
+def is_search_schema_object(name: str) -> bool:
+    """
+    전문 검색용 DB 객체(FULLTEXT 인덱스, FTS5 테이블과 섀도 테이블) 여부
+    - 모델 메타데이터에 없으므로 마이그레이션 자동 비교(autogenerate)에서 제외
+    """
+    return name == MYSQL_FULLTEXT_INDEX or name.startswith(SQLITE_FTS_TABLE)
+
+
+def _detect_backend(conn) -> Tuple[str, int]:
+    """연결된 DB에서 사용할 검색 백엔드와 최소 검색어 길이 확인"""
+    if conn.dialect.name == "mysql" and _mysql_fulltext_exists(conn):
+        token_size = conn.execute(text("SELECT @@ngram_token_size")).scalar()
+        return BACKEND_MYSQL, int(token_size or 2)
+    if conn.dialect.name == "sqlite":
+        ddl = _sqlite_fts_ddl(conn)
+        if ddl:
+            return BACKEND_SQLITE, 3 if "trigram" in ddl else 1
+    return BACKEND_LIKE, 0
+
+
+class SearchService:
+    """전문 검색 서비스 클래스"""
+
+    @staticmethod
+    def setup(engine: Engine) -> str:
+        """
+        전문 검색 인덱스 생성
+        - 운영 DB는 마이그레이션(alembic upgrade head)이 생성 - 마이그레이션 없이 만든 DB(테스트 등)에서 사용
+        - 이미 존재하면 건너뜀
+        - SQLite FTS5 테이블을 새로 만든 경우 기존 도서로 채움
+        - 반환값: 사용하게 된 검색 백엔드
+        """
+        with engine.begin() as conn:
+            if conn.dialect.name == "mysql" and not _mysql_fulltext_exists(conn):
+                conn.execute(text(
+                    f"ALTER TABLE books ADD FULLTEXT INDEX {MYSQL_FULLTEXT_INDEX} "
+                    "(title, author) WITH PARSER ngram"
+                ))
+            elif conn.dialect.name == "sqlite" and _sqlite_fts_ddl(conn) is None:
+                # trigram 토크나이저는 SQLite 3.34 이상에서만 지원
+                version = tuple(int(v) for v in conn.execute(
+                    text("SELECT sqlite_version()")
+                ).scalar().split("."))
+                tokenizer = "trigram" if version >= (3, 34, 0) else "unicode61"
+                conn.execute(text(
+                    f"CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} "
+                    f"USING fts5(title, author, tokenize='{tokenizer}')"
+                ))
+                conn.execute(text(
+                    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, author) "
+                    "SELECT id, title, author FROM books"
+                ))
+            backend = _detect_backend(conn)
+
+        _backends[engine] = backend
+        return backend[0]
+
+    @staticmethod
+    def _backend(db: Session) -> Tuple[str, int]:
+        """
+        DB에 준비된 검색 백엔드 확인 (엔진별로 1회 조회 후 캐싱)
+        - 반환값: (백엔드, FTS로 검색 가능한 최소 검색어 길이)
+        """
+        bind = db.get_bind()
+        engine = getattr(bind, "engine", bind)
+        backend = _backends.get(engine)
+        if backend is None:
+            backend = _detect_backend(db.connection())
+            _backends[engine] = backend
+        return backend
+
+    @staticmethod
+    def search_condition(db: Session, term: str):
+        """
+        검색어에 대한 WHERE 조건과 관련도 점수 식 생성
+        - 반환값: (조건, 관련도 점수) - 점수가 클수록 관련도가 높음
+        - 검색어가 최소 길이보다 짧거나 인덱스가 없으면 LIKE 조건 (점수 None)
+        """
+        term = term.strip()
+        backend, min_length = SearchService._backend(db)
+
+        if backend == BACKEND_MYSQL:
+            cleaned = _BOOLEAN_OPERATORS.sub(" ", term).strip()
+            if len(cleaned) >= min_length:
+                # 구문 검색으로 ngram 토큰이 연속으로 일치하는 도서만 조회
+                score = match(Book.title, Book.author, against=f'"{cleaned}"').in_boolean_mode()
+                return score > 0, score
+
+        elif backend == BACKEND_SQLITE and len(term) >= min_length:
+            phrase = '"' + term.replace('"', '""') + '"'
+            matched = _fts.op("MATCH")(phrase)
+            candidates = select(books_fts.c.rowid).where(matched)
+            # bm25는 작을수록 관련도가 높으므로 부호를 바꿔 사용
+            score = (
+                select(-func.bm25(_fts))
+                .where(matched, books_fts.c.rowid == Book.id)
+                .scalar_subquery()
+            )
+            return Book.id.in_(candidates), score
+
+        return SearchService.like_condition(term), None
+
+    @staticmethod
+    def like_condition(term: str):
+        """제목 또는 저자명에 검색어가 포함된 도서 조건 (LIKE)"""
+        search_term = f"%{term.strip()}%"
+        return or_(Book.title.like(search_term), Book.author.like(search_term))
+
+    @staticmethod
+    def index_book(db: Session, book: Book) -> None:
+        """
+        도서 색인 갱신 (생성/수정 시, 커밋 전에 같은 트랜잭션에서 호출)
+        - MySQL FULLTEXT 인덱스는 InnoDB가 자동으로 갱신
+        """
+        if SearchService._backend(db)[0] != BACKEND_SQLITE:
+            return
+        db.execute(books_fts.delete().where(books_fts.c.rowid == book.id))
+        db.execute(books_fts.insert().values(rowid=book.id, title=book.title, author=book.author))
+
+    @staticmethod
+    def index_new_books(db: Session, books: Iterable[Tuple[int, str, str]]) -> None:
+        """
+        새로 등록된 도서 일괄 색인 (대량 등록 시, 커밋 전에 같은 트랜잭션에서 호출)
+        - books: (id, 제목, 저자) 목록, executemany 한 번으로 추가
+        """
+        rows = [{"rowid": book_id, "title": title, "author": author} for book_id, title, author in books]
+        if not rows or SearchService._backend(db)[0] != BACKEND_SQLITE:
+            return
+        db.execute(books_fts.insert(), rows)
+
+    @staticmethod
+    def remove_books(db: Session, book_ids: Iterable[int]) -> None:
+        """도서 색인 삭제 (삭제 시, 커밋 전에 같은 트랜잭션에서 호출)"""
+        book_ids = list(book_ids)
+        if not book_ids or SearchService._backend(db)[0] != BACKEND_SQLITE:
+            return
+        db.execute(books_fts.delete().where(books_fts.c.rowid.in_(book_ids)))
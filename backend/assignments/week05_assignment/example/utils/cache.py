@@ -0,0 +1,175 @@
+"""
+조회 결과 캐시 (read-through)
+- 교체 가능한 캐시 백엔드: 프로세스 내부 LRU(TTL) 또는 Redis 호환 클라이언트
+- 값은 직렬화된 문자열(JSON)로 저장하므로 백엔드와 무관하게 동일하게 동작
+- 도서 항목은 소속 카테고리의 버전과 함께 저장 - 카테고리명 변경/삭제는 버전만 바꿔 소속 도서 항목을 한 번에 무효화
+"""
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+# 캐시 설정 (BOOK_CACHE_BACKEND=memory | redis | none)
+BOOK_CACHE_BACKEND = os.getenv("BOOK_CACHE_BACKEND", "memory").lower()
+BOOK_CACHE_TTL = int(os.getenv("BOOK_CACHE_TTL", "300"))
+BOOK_CACHE_MAX_ENTRIES = int(os.getenv("BOOK_CACHE_MAX_ENTRIES", "10000"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+class CacheBackend:
+    """캐시 백엔드 인터페이스"""
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class NullCache(CacheBackend):
+    """캐시 비활성화용 백엔드 - 항상 miss"""
+
+    def get(self, key: str) -> Optional[str]:
+        return None
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class LRUCache(CacheBackend):
+    """
+    프로세스 내부 LRU 캐시
+    - 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 항목별 만료 시간(TTL) 적용
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: int = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache(CacheBackend):
+    """
+    Redis 호환 클라이언트 캐시
+    - get/set(ex=)/delete를 지원하는 클라이언트면 사용 가능 (redis-py, fakeredis 등)
+    - 여러 워커가 캐시와 무효화를 공유
+    """
+
+    def __init__(self, client: Any, prefix: str = "", ttl: int = 300):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.prefix + key)
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self.client.set(self.prefix + key, value, ex=ttl if ttl is not None else self.ttl)
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*[self.prefix + key for key in keys])
+
+    def clear(self) -> None:
+        """prefix로 시작하는 키만 삭제"""
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+def create_cache(backend: str = BOOK_CACHE_BACKEND, prefix: str = "") -> CacheBackend:
+    """설정에 맞는 캐시 백엔드 생성 (redis 패키지는 redis 백엔드 사용 시에만 필요)"""
+    if backend == "redis":
+        import redis
+        return RedisCache(redis.Redis.from_url(REDIS_URL), prefix=prefix, ttl=BOOK_CACHE_TTL)
+    if backend == "none":
+        return NullCache()
+    return LRUCache(max_entries=BOOK_CACHE_MAX_ENTRIES, ttl=BOOK_CACHE_TTL)
+
+
+def book_cache_key(book_id: int) -> str:
+    return f"book:{book_id}"
+
+
+def category_version_key(category_id: int) -> str:
+    return f"category:{category_id}:version"
+
+
+# 도서 상세 조회 캐시 - 직렬화된 BookResponse 저장, BookService/CategoryService 쓰기 경로에서 무효화
+book_cache = create_cache(prefix="bookapi:")
+
+
+def get_book_entry(book_id: int) -> Optional[str]:
+    """
+    캐시된 도서 응답(JSON) 조회
+    - 저장할 때 기록한 카테고리 버전이 현재 버전과 다르면(이후 카테고리명 변경/삭제) miss
+    """
+    cached = book_cache.get(book_cache_key(book_id))
+    if cached is None:
+        return None
+    category_id, version, payload = cached.split("|", 2)
+    if category_id and version != (book_cache.get(category_version_key(int(category_id))) or ""):
+        return None
+    return payload
+
+
+def set_book_entry(book_id: int, category_id: Optional[int], payload: str) -> None:
+    """도서 응답 저장 - "카테고리 id|카테고리 버전|JSON" 형식"""
+    version = (book_cache.get(category_version_key(category_id)) or "") if category_id else ""
+    book_cache.set(book_cache_key(book_id), f"{category_id or ''}|{version}|{payload}")
+
+
+def bump_category_version(category_id: int) -> None:
+    """
+    카테고리 소속 도서의 캐시 항목 무효화 (도서 id를 조회하거나 항목마다 삭제하지 않음)
+    - 버전 키는 도서 항목과 같은 TTL로 저장 - 이전 버전으로 저장된 항목이 버전 키보다 먼저 만료됨
+    """
+    book_cache.set(category_version_key(category_id), uuid.uuid4().hex)
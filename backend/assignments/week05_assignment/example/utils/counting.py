@@ -0,0 +1,90 @@
+"""
+목록 조회용 전체 개수(total) 계산 전략
+- exact: 매 요청마다 COUNT 실행
+- cached: 정규화된 필터 조합별로 COUNT 결과를 메모리에 캐싱 (쓰기 시 무효화)
+- estimated: id 구간 샘플링으로 선택도를 추정해 근사값 계산
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Query
+
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_ESTIMATED = "estimated"
+COUNT_STRATEGIES = (COUNT_EXACT, COUNT_CACHED, COUNT_ESTIMATED)
+
+
+class CountCache:
+    """
+    필터 조합별 COUNT 결과 캐시
+    - 프로세스 내부 캐시이므로 다른 워커의 쓰기는 ttl로만 반영
+    - 쓰기 경로에서 invalidate()를 호출해 즉시 무효화
+    - max_entries를 넘으면 가장 오래된 항목부터 제거
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            total, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return total
+
+    def set(self, key: Hashable, total: int) -> None:
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.popitem(last=False)
+            self._entries[key] = (total, time.monotonic() + self.ttl)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# 도서 목록 COUNT 캐시 - BookService의 쓰기 경로에서 무효화
+book_count_cache = CountCache()
+
+
+def estimate_count(
+    query: Query,
+    id_column,
+    sample_size: int = 1000,
+    windows: int = 4
+) -> Tuple[int, bool]:
+    """
+    id 구간 샘플링 기반 근사 개수 계산
+    - 전체 id 범위에서 균등 간격의 구간 windows개(합계 sample_size개 id)를 골라
+      필터를 적용한 COUNT를 실행하고, 전체 id 범위 비율로 확대
+    - PK 범위 스캔만 하므로 비용이 테이블 크기와 무관
+    - 반환값: (개수, 정확한 값 여부) - 테이블이 작으면 정확한 COUNT로 대체
+    """
+    session = query.session
+    min_id, max_id = session.query(func.min(id_column), func.max(id_column)).one()
+    if min_id is None:
+        return 0, True
+
+    id_span = max_id - min_id + 1
+    if id_span <= sample_size:
+        return query.count(), True
+
+    window_size = sample_size // windows
+    step = id_span // windows
+    ranges = [
+        id_column.between(start, start + window_size - 1)
+        for start in range(min_id, min_id + step * windows, step)
+    ]
+    matched = query.filter(or_(*ranges)).count()
+
+    return round(matched * id_span / (window_size * windows)), False
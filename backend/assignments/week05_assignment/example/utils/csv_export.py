@@ -0,0 +1,44 @@
+"""
+CSV 내보내기 유틸리티
+- 모델 묶음을 CSV 바이트로 직렬화 (스트리밍 응답에서 묶음마다 한 번 전송)
+"""
+import csv
+import io
+from datetime import date, datetime
+from typing import Any, Iterable, List
+from pydantic import BaseModel
+
+# 엑셀에서 UTF-8 한글이 깨지지 않도록 파일 맨 앞에 붙이는 BOM
+UTF8_BOM = "\ufeff"
+
+# 스프레드시트가 수식으로 해석하는 시작 문자 (CSV 인젝션 방지)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def dump_csv_header(columns: List[str]) -> bytes:
+    """BOM + 헤더 행"""
+    return (UTF8_BOM + dump_csv_rows([columns])).encode("utf-8")
+
+
+def dump_csv_rows(rows: Iterable[Iterable[Any]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n")
+    writer.writerows([_cell(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+def dump_csv(items: Iterable[BaseModel], columns: List[str]) -> bytes:
+    """모델 묶음을 columns 순서의 CSV 행으로 직렬화"""
+    return dump_csv_rows(
+        [getattr(item, column) for column in columns] for item in items
+    ).encode("utf-8")
@@ -27,11 +27,19 @@ class DuplicateException(BusinessException):
 
 class InsufficientStockException(BusinessException):
     """재고가 부족할 때 발생하는 예외"""
-    def __init__(self, current_stock: int, requested: int):
+    def __init__(self, current_stock: int, requested: int, book_id: Optional[int] = None):
         message = f"재고가 부족합니다. 현재 재고: {current_stock}, 요청 수량: {requested}"
+        if book_id:
+            message = f"도서 (ID: {book_id})의 {message}"
         super().__init__(message, 400)
 
 class InvalidOperationException(BusinessException):
     """유효하지 않은 작업을 시도할 때 발생하는 예외"""
     def __init__(self, message: str):
-        super().__init__(message, 400)
\ No newline at end of file
+        super().__init__(message, 400)
+
+
+class GoneException(BusinessException):
+    """더 이상 제공할 수 없는 리소스/상태를 요청할 때 발생하는 예외 (예: 보존 기간이 지난 동기화 토큰)"""
+    def __init__(self, message: str):
+        super().__init__(message, 410)
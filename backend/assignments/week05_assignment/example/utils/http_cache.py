@@ -0,0 +1,75 @@
+"""
+HTTP 조건부 요청 (ETag / Last-Modified)
+- 강한 ETag는 리소스 버전(도서 id + updated_at, 목록은 필터 범위의 개수 + 최대 updated_at)으로 계산
+- If-None-Match가 있으면 ETag로만 비교하고, 없을 때만 If-Modified-Since 사용 (RFC 9110)
+- 일치하면 본문 없이 304 Not Modified
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+from starlette.requests import Request
+from starlette.responses import Response
+
+# 응답 형식이 바뀌면 올려서 이전 ETag를 모두 무효화
+ETAG_VERSION = "1"
+
+
+def to_utc(value: datetime) -> datetime:
+    """시간대 정보가 없는 값(SQLite 등)은 UTC로 간주"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 구성 요소로 강한 ETag 생성"""
+    normalized = [to_utc(part).isoformat() if isinstance(part, datetime) else str(part) for part in parts]
+    digest = hashlib.sha1("|".join([ETAG_VERSION, *normalized]).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def http_date(value: datetime) -> str:
+    """Last-Modified 헤더 형식 (초 단위)"""
+    return format_datetime(to_utc(value).replace(microsecond=0), usegmt=True)
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """
+    검증자 헤더
+    - no-cache: 브라우저가 캐시한 응답을 매번 검증(조건부 요청) 후 사용
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """클라이언트가 가진 응답이 현재 버전과 같은지 확인"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match는 약한 비교 (W/ 접두사 무시)
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since is None or since.tzinfo is None:
+            return False
+        # HTTP 날짜는 초 단위이므로 초 단위로 비교 (같은 초 안의 수정은 ETag로만 구분 가능)
+        return to_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def has_conditional_headers(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """304 응답 (본문 없음, 검증자 헤더만)"""
+    return Response(status_code=304, headers=cache_headers(etag, last_modified))
@@ -0,0 +1,91 @@
+"""
+import 시간 예산 확인
+- 새 인터프리터에서 `python -X importtime`으로 코드를 실행하고 stderr 출력을 모듈별 시간으로 해석
+- 워커/테스트 프로세스가 앱을 준비하기까지의 import 시간이 예산(ms) 안인지 확인
+- 사용: python -m app.utils.import_budget [--budget-ms 1500] [--runs 3] [--top 15]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence
+
+# 워커가 앱을 준비하는 과정 (import + 애플리케이션 생성)
+DEFAULT_STATEMENT = "from app.main import create_app; create_app()"
+IMPORT_TIME_BUDGET_MS = int(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+
+# "import time:       self [us] |  cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+class ImportProfile:
+    """한 번의 실행에서 import된 모듈별 시간 (마이크로초)"""
+
+    def __init__(self):
+        self.self_us: Dict[str, int] = {}
+        self.cumulative_us: Dict[str, int] = {}
+        self.total_us = 0
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
+    @property
+    def modules(self) -> List[str]:
+        return list(self.cumulative_us)
+
+    def slowest(self, count: int) -> List[str]:
+        """자기 시간(하위 import 제외)이 긴 모듈 순"""
+        return sorted(self.self_us, key=self.self_us.get, reverse=True)[:count]
+
+
+def parse_importtime(output: str) -> ImportProfile:
+    """-X importtime 출력 해석 - 전체 시간은 최상위(들여쓰기 없는) import의 누적 시간 합"""
+    profile = ImportProfile()
+    for line in output.splitlines():
+        matched = _IMPORTTIME_LINE.match(line)
+        if matched is None:
+            continue
+        self_us, cumulative_us, indent, module = matched.groups()
+        profile.self_us[module] = int(self_us)
+        profile.cumulative_us[module] = int(cumulative_us)
+        if not indent:
+            profile.total_us += int(cumulative_us)
+    return profile
+
+
+def measure_import_time(statement: str = DEFAULT_STATEMENT, env: Optional[Dict[str, str]] = None) -> ImportProfile:
+    """
+    새 인터프리터에서 statement 실행 후 import 시간 측정
+    - 현재 프로세스의 sys.path를 PYTHONPATH로 넘겨 같은 모듈을 import
+    - statement가 실패하면 RuntimeError
+    """
+    run_env = dict(os.environ, **(env or {}))
+    run_env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=run_env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    return parse_importtime(result.stderr)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="앱 준비까지의 import 시간 예산 확인")
+    parser.add_argument("--statement", default=DEFAULT_STATEMENT)
+    parser.add_argument("--budget-ms", type=int, default=IMPORT_TIME_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3, help="가장 빠른 실행으로 판단 (디스크 캐시 등 잡음 제거)")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    profile = min((measure_import_time(args.statement) for _ in range(args.runs)), key=lambda p: p.total_us)
+    for module in profile.slowest(args.top):
+        print(f"{profile.self_us[module] / 1000:8.1f}ms  {module}")
+    print(f"합계 {profile.total_ms:.1f}ms / 예산 {args.budget_ms}ms")
+    return 0 if profile.total_ms <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
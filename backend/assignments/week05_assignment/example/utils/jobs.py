@@ -0,0 +1,89 @@
+"""
+백그라운드 작업 진행 상황 관리
+- 오래 걸리는 작업(예: 도서가 많은 카테고리 삭제)을 요청과 분리해 실행하고 진행률을 조회
+- 프로세스 내부 저장소이므로 다중 워커 환경에서는 작업을 시작한 워커에서만 조회 가능
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class Job:
+    """백그라운드 작업 상태 (processed / total로 진행률 계산)"""
+
+    def __init__(self, kind: str, total: int = 0):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = JOB_PENDING
+        self.total = total
+        self.processed = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self._lock = threading.Lock()
+
+    @property
+    def progress(self) -> float:
+        """진행률 (0~100)"""
+        if self.status == JOB_COMPLETED:
+            return 100.0
+        if self.total <= 0:
+            return 0.0
+        return round(min(self.processed, self.total) * 100.0 / self.total, 1)
+
+    def start(self) -> None:
+        with self._lock:
+            self.status = JOB_RUNNING
+
+    def advance(self, count: int) -> None:
+        with self._lock:
+            self.processed += count
+
+    def complete(self, result: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            self.status = JOB_COMPLETED
+            self.result = result
+
+    def fail(self, error: str) -> None:
+        with self._lock:
+            self.status = JOB_FAILED
+            self.error = error
+
+
+class JobRegistry:
+    """
+    작업 저장소
+    - max_jobs를 넘으면 가장 오래된 작업부터 제거
+    """
+
+    def __init__(self, max_jobs: int = 100):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, kind: str, total: int = 0) -> Job:
+        job = Job(kind, total)
+        with self._lock:
+            if len(self._jobs) >= self.max_jobs:
+                self._jobs.popitem(last=False)
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jobs.clear()
+
+
+# 백그라운드 작업 저장소 - 카테고리 삭제 작업 등에서 사용
+job_registry = JobRegistry()
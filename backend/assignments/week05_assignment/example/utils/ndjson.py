@@ -0,0 +1,52 @@
+"""
+NDJSON(줄 단위 JSON) 처리 유틸리티
+- 요청 본문을 한 번에 읽지 않고 줄 단위로 파싱
+- 응답 스트림용 줄 단위 직렬화
+"""
+import json
+from typing import Any, AsyncIterator, Iterable, List, Optional
+from pydantic import BaseModel
+from app.utils.exceptions import InvalidOperationException
+
+
+async def read_ndjson(stream: AsyncIterator[bytes], max_records: Optional[int] = None) -> List[Any]:
+    """
+    NDJSON 스트림을 레코드 목록으로 파싱
+    - 빈 줄은 무시
+    - JSON으로 해석할 수 없는 줄은 원문 문자열 그대로 두어 호출 측에서 행 단위 오류로 처리
+    - max_records를 넘는 순간 나머지 본문을 읽지 않고 InvalidOperationException
+    """
+    records: List[Any] = []
+    buffer = b""
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        records.extend(_parse_line(line) for line in lines if line.strip())
+        _check_limit(records, max_records)
+    if buffer.strip():
+        records.append(_parse_line(buffer))
+        _check_limit(records, max_records)
+    return records
+
+
+def _check_limit(records: List[Any], max_records: Optional[int]) -> None:
+    if max_records is not None and len(records) > max_records:
+        raise InvalidOperationException(f"한 번에 최대 {max_records}건까지 등록할 수 있습니다")
+
+
+def _parse_line(line: bytes) -> Any:
+    text = line.decode("utf-8", errors="replace").strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def dump_ndjson(items: Iterable[BaseModel], **json_kwargs: Any) -> bytes:
+    """
+    모델 묶음을 NDJSON 바이트로 직렬화 (스트리밍 응답에서 묶음마다 한 번 전송)
+    - json_kwargs는 BaseModel.json()에 전달 (예: exclude_unset=True)
+    """
+    return "".join(
+        item.json(ensure_ascii=False, **json_kwargs) + "\n" for item in items
+    ).encode("utf-8")
@@ -0,0 +1,173 @@
+"""
+도서 제목/저자 n-gram 역색인 (프로세스 메모리)
+- 제목과 저자의 bigram/trigram -> 도서 id 목록(array('I'), 오름차순)
+- 검색어의 n-gram 목록을 교집합해 후보 id를 DB 조회 전에 계산
+- 후보는 상위 집합이므로 최종 일치 여부는 DB의 LIKE 조건으로 확인
+"""
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.models.book import Book
+
+# 애플리케이션 시작 시 색인 적재 여부 (USE_NGRAM_INDEX=false 로 비활성화)
+NGRAM_INDEX_ENABLED = os.getenv("USE_NGRAM_INDEX", "true").lower() in ("1", "true", "yes")
+
+
+def normalize(text: str) -> str:
+    """대소문자와 연속 공백 차이를 무시하도록 정규화"""
+    return " ".join(text.lower().split())
+
+
+def ngrams(text: str, n: int) -> Set[str]:
+    """문자열의 n-gram 집합"""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def book_grams(title: str, author: str) -> Set[str]:
+    """도서 하나에 대한 bigram + trigram 집합 (제목/저자 각각)"""
+    grams: Set[str] = set()
+    for text in (normalize(title), normalize(author)):
+        grams |= ngrams(text, 2)
+        grams |= ngrams(text, 3)
+    return grams
+
+
+class NgramIndex:
+    """
+    n-gram 역색인
+    - 애플리케이션 시작 시 load()로 전체 적재, 이후 BookService 쓰기 경로에서 증분 갱신
+    - 다른 워커의 쓰기는 refresh_interval마다 updated_at 기준으로 추가 반영
+    - max_candidates보다 후보가 많으면 None을 반환해 DB 검색에 맡김
+    """
+
+    def __init__(self, refresh_interval: float = 30.0, max_candidates: int = 1000):
+        self.refresh_interval = refresh_interval
+        self.max_candidates = max_candidates
+        self._postings: Dict[str, array] = {}
+        self._engines: Set[Engine] = set()
+        self._watermark: Optional[datetime] = None
+        self._refreshed_at = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._engines)
+
+    def load(self, engine: Engine) -> int:
+        """
+        전체 도서 색인 적재
+        - 반환값: 색인된 도서 수
+        """
+        with self._lock:
+            self._postings = {}
+            self._watermark = None
+            with Session(bind=engine) as db:
+                count = self._index_rows(db.query(
+                    Book.id, Book.title, Book.author, Book.updated_at
+                ).order_by(Book.id).yield_per(1000))
+            self._engines = {engine}
+            self._refreshed_at = time.monotonic()
+            return count
+
+    def attach(self, engine: Engine) -> None:
+        """같은 DB를 가리키는 다른 엔진(예: 비동기 엔진의 sync_engine)에서도 색인 사용"""
+        with self._lock:
+            self._engines.add(engine)
+
+    def serves(self, db: Session) -> bool:
+        """세션이 색인을 적재한 DB에 연결되어 있는지 확인"""
+        bind = db.get_bind()
+        return getattr(bind, "engine", bind) in self._engines
+
+    def add(self, book_id: int, title: str, author: str) -> None:
+        if not self.loaded:
+            return
+        with self._lock:
+            self._add(book_id, title, author)
+
+    def remove(self, book_id: int, title: str, author: str) -> None:
+        if not self.loaded:
+            return
+        with self._lock:
+            for gram in book_grams(title, author):
+                posting = self._postings.get(gram)
+                if posting is None:
+                    continue
+                position = bisect_left(posting, book_id)
+                if position < len(posting) and posting[position] == book_id:
+                    del posting[position]
+                if not posting:
+                    del self._postings[gram]
+
+    def candidates(self, db: Session, term: str) -> Optional[List[int]]:
+        """
+        검색어를 포함할 수 있는 도서 id 목록 (오름차순)
+        - 색인을 사용할 수 없거나(미적재, 다른 DB, 1글자 검색어) 후보가 너무 많으면 None
+        """
+        term = normalize(term)
+        if len(term) < 2 or not self.serves(db):
+            return None
+
+        self._refresh_if_stale(db)
+        grams = ngrams(term, 3 if len(term) >= 3 else 2)
+
+        with self._lock:
+            postings = [self._postings.get(gram) for gram in grams]
+            if any(posting is None for posting in postings):
+                return []
+            postings.sort(key=len)
+            smallest, others = postings[0], postings[1:]
+            result = [
+                book_id for book_id in smallest
+                if all(_contains(posting, book_id) for posting in others)
+            ]
+
+        if len(result) > self.max_candidates:
+            return None
+        return result
+
+    def _refresh_if_stale(self, db: Session) -> None:
+        """다른 워커에서 생성/수정된 도서를 updated_at 기준으로 색인에 추가"""
+        if time.monotonic() - self._refreshed_at < self.refresh_interval:
+            return
+        with self._lock:
+            query = db.query(Book.id, Book.title, Book.author, Book.updated_at)
+            if self._watermark is not None:
+                # 같은 시각에 갱신된 행을 놓치지 않도록 >= 사용 (재색인은 멱등)
+                query = query.filter(Book.updated_at >= self._watermark)
+            self._index_rows(query)
+            self._refreshed_at = time.monotonic()
+
+    def _index_rows(self, rows: Iterable) -> int:
+        count = 0
+        for book_id, title, author, updated_at in rows:
+            self._add(book_id, title, author)
+            if self._watermark is None or updated_at > self._watermark:
+                self._watermark = updated_at
+            count += 1
+        return count
+
+    def _add(self, book_id: int, title: str, author: str) -> None:
+        for gram in book_grams(title, author):
+            posting = self._postings.setdefault(gram, array("I"))
+            if not posting or posting[-1] < book_id:
+                posting.append(book_id)
+            else:
+                position = bisect_left(posting, book_id)
+                if position == len(posting) or posting[position] != book_id:
+                    posting.insert(position, book_id)
+
+
+def _contains(posting: array, book_id: int) -> bool:
+    position = bisect_left(posting, book_id)
+    return position < len(posting) and posting[position] == book_id
+
+
+# 도서 검색용 n-gram 색인 - main.py에서 적재, BookService 쓰기 경로에서 갱신
+book_ngram_index = NgramIndex()
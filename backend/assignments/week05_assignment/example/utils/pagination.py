@@ -0,0 +1,80 @@
+"""
+커서(키셋) 페이지네이션 유틸리티
+- 마지막 행의 정렬 키와 id를 불투명한 토큰으로 인코딩
+- OFFSET 없이 "WHERE (정렬키, id) > (마지막 값)" 조건으로 다음 페이지 조회
+"""
+import base64
+import json
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import and_, false, or_
+from app.utils.exceptions import InvalidOperationException
+
+
+def encode_cursor(sort: str, values: List[Any]) -> str:
+    """
+    커서 토큰 생성
+    - sort: 커서가 만들어진 정렬 기준 (다른 정렬에 재사용 방지)
+    - values: 마지막 행의 정렬 키 값들 (마지막 원소는 항상 id)
+    """
+    payload = json.dumps({"s": sort, "v": values}, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort: Optional[str] = None) -> Tuple[str, List[Any]]:
+    """
+    커서 토큰 해석
+    - 형식이 잘못되었거나 정렬 기준이 다르면 InvalidOperationException 발생
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_sort, values = payload["s"], payload["v"]
+        if not isinstance(values, list) or not values:
+            raise ValueError(values)
+    except (ValueError, KeyError, TypeError):
+        raise InvalidOperationException("유효하지 않은 커서입니다")
+
+    if sort is not None and cursor_sort != sort:
+        raise InvalidOperationException("커서의 정렬 기준이 요청과 일치하지 않습니다")
+
+    return cursor_sort, values
+
+
+def keyset_condition(order_keys: Sequence[Tuple[Any, bool]], values: Sequence[Any]):
+    """
+    키셋 조건 생성 - (k1, k2, ...) 가 마지막 행 값보다 "뒤"인 행만 조회
+    - order_keys: (컬럼/식, 내림차순 여부) 목록, ORDER BY와 같은 순서
+    - 예: [(price, False), (id, False)] -> price > :p OR (price = :p AND id > :id)
+    - NULL 값(nullable 컬럼)은 IS NULL / IS NOT NULL 조건으로 비교
+    """
+    if len(order_keys) != len(values):
+        raise InvalidOperationException("유효하지 않은 커서입니다")
+
+    conditions = []
+    for index, (key, descending) in enumerate(order_keys):
+        equal_prefix = [
+            _equal(prev_key, value)
+            for (prev_key, _), value in zip(order_keys[:index], values[:index])
+        ]
+        conditions.append(and_(*equal_prefix, _after(key, descending, values[index])))
+    return or_(*conditions)
+
+
+def _nullable(key: Any) -> bool:
+    return bool(getattr(getattr(key, "expression", key), "nullable", False))
+
+
+def _equal(key: Any, value: Any):
+    return key.is_(None) if value is None else key == value
+
+
+def _after(key: Any, descending: bool, value: Any):
+    """
+    정렬 순서상 value 뒤에 오는 값 조건
+    - NULL은 가장 작은 값으로 취급 (MySQL/SQLite 정렬 순서: 오름차순이면 맨 앞, 내림차순이면 맨 뒤)
+    """
+    if value is None:
+        return false() if descending else key.isnot(None)
+    if descending:
+        return or_(key < value, key.is_(None)) if _nullable(key) else key < value
+    return key > value
@@ -0,0 +1,97 @@
+"""
+DB 연결 풀 지표
+- 체크아웃 수, 사용 중/유휴 연결 수, overflow, 체크아웃 대기 시간, 타임아웃 횟수
+- 워커 수에 맞게 pool_size/max_overflow를 정하기 위한 근거 자료
+- 워커 프로세스마다 풀이 따로 있으므로 지표도 프로세스 단위
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """체크아웃 대기 시간 누적 지표"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.total_wait * 1000 / attempts, 3) if attempts else 0.0,
+                "wait_ms_max": round(self.max_wait * 1000, 3),
+            }
+
+
+class MeteredPoolMixin:
+    """
+    체크아웃(pool.connect) 소요 시간을 기록하는 풀
+    - 빈 연결 대기, 새 연결 생성, pre-ping 시간이 모두 포함됨
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started)
+        return connection
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    """동기 엔진용 지표 수집 QueuePool"""
+
+
+class MeteredAsyncQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 지표 수집 QueuePool"""
+
+
+def pool_status(engine: Optional[Engine]) -> Optional[Dict[str, Any]]:
+    """엔진의 현재 풀 상태와 누적 지표"""
+    if engine is None:
+        return None
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__, "pid": os.getpid()}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            # overflow()는 아직 열지 않은 기본 연결 수만큼 음수에서 시작
+            overflow=max(pool.overflow(), 0),
+            timeout=pool.timeout(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
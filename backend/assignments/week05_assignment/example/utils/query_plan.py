@@ -0,0 +1,109 @@
+"""
+쿼리 실행 계획(EXPLAIN) 확인과 인덱스 권장
+- explain: SQLite는 EXPLAIN QUERY PLAN, MySQL은 EXPLAIN 결과에서
+  사용한 인덱스, 커버링 여부, 전체 테이블 스캔/정렬용 임시 테이블 여부 추출
+- recommend_index: 필터 조합(동등 조건 -> 정렬 키/범위 조건)에 맞는 선언된 인덱스 선택
+"""
+import re
+from typing import Any, List, Optional, Sequence, Set
+from sqlalchemy import Index, Table
+
+SQLITE_INDEX_PATTERN = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+SQLITE_TABLE_SCAN_PATTERN = re.compile(r"^SCAN \w+$")
+
+
+class QueryPlan:
+    """실행 계획 요약"""
+
+    def __init__(self, steps: List[str]):
+        self.steps = steps
+        self.indexes: Set[str] = set()
+        self.covering = False
+        self.full_scan = False
+        self.temp_sort = False
+
+    def __repr__(self) -> str:
+        return f"QueryPlan({self.steps!r})"
+
+
+def _explain_sqlite(connection, statement: str, parameters: Any) -> QueryPlan:
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    plan = QueryPlan([row[-1] for row in rows])
+    for step in plan.steps:
+        plan.indexes.update(SQLITE_INDEX_PATTERN.findall(step))
+        plan.covering = plan.covering or "COVERING INDEX" in step
+        plan.full_scan = plan.full_scan or bool(SQLITE_TABLE_SCAN_PATTERN.match(step))
+        plan.temp_sort = plan.temp_sort or ("TEMP B-TREE FOR" in step and "ORDER BY" in step)
+    return plan
+
+
+def _explain_mysql(connection, statement: str, parameters: Any) -> QueryPlan:
+    rows = [row._mapping for row in connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)]
+    plan = QueryPlan([
+        f"{row['table']} type={row['type']} key={row['key']} extra={row['Extra']}" for row in rows
+    ])
+    for row in rows:
+        extra = row["Extra"] or ""
+        if row["key"]:
+            plan.indexes.add(row["key"])
+        # "Using index condition"(ICP)은 커버링이 아님
+        plan.covering = plan.covering or bool(re.search(r"Using index(?! condition)", extra))
+        plan.full_scan = plan.full_scan or row["type"] == "ALL"
+        plan.temp_sort = plan.temp_sort or "Using filesort" in extra
+    return plan
+
+
+def explain(connection, statement: str, parameters: Any = ()) -> QueryPlan:
+    """
+    드라이버 수준 SQL의 실행 계획 조회
+    - statement/parameters: before_cursor_execute 이벤트로 수집한 값 그대로 사용
+    - SQLite/MySQL 외의 DB는 NotImplementedError
+    """
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        return _explain_sqlite(connection, statement, parameters)
+    if dialect == "mysql":
+        return _explain_mysql(connection, statement, parameters)
+    raise NotImplementedError(f"{dialect}의 실행 계획 해석은 지원하지 않습니다")
+
+
+def _index_columns(index: Index) -> List[str]:
+    """인덱스 컬럼 목록 - 보조 인덱스는 PK를 암묵적으로 끝에 포함 (InnoDB, SQLite rowid)"""
+    columns = [column.name for column in index.columns]
+    for column in index.table.primary_key.columns:
+        if column.name not in columns:
+            columns.append(column.name)
+    return columns
+
+
+def recommend_index(
+    table: Table,
+    equality: Sequence[str] = (),
+    range_column: Optional[str] = None,
+    order_by: Sequence[str] = (),
+    columns: Sequence[str] = ()
+) -> Optional[Index]:
+    """
+    필터 조합에 맞는 선언된 인덱스 선택
+    - 동등 조건 컬럼들(순서 무관)로 시작하는 인덱스만 후보
+    - 이어지는 컬럼이 범위 조건 컬럼이면 범위 탐색, 정렬 키(방향 무시)와 같으면 정렬 생략 가능
+    - 우선순위: 범위 탐색 > 정렬 생략 > 커버링(columns를 모두 포함) > 컬럼 수가 적은 인덱스
+    - 동등 조건도 없고 범위/정렬에도 쓸 수 없으면 None (새 인덱스가 필요한 조합)
+    """
+    best, best_score = None, None
+    for index in table.indexes:
+        index_columns = _index_columns(index)
+        prefix, rest = index_columns[:len(equality)], index_columns[len(equality):]
+        if set(prefix) != set(equality):
+            continue
+
+        serves_range = range_column is not None and rest[:1] == [range_column]
+        serves_sort = bool(order_by) and rest[:len(order_by)] == list(order_by)
+        if not (equality or serves_range or serves_sort):
+            continue
+
+        covering = set(columns) <= set(index_columns)
+        score = (serves_range, serves_sort, covering, -len(index_columns))
+        if best_score is None or score > best_score:
+            best, best_score = index, score
+    return best
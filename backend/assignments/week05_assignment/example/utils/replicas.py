@@ -0,0 +1,73 @@
+"""
+읽기 복제본(replica) 선택
+- round_robin: 요청마다 순서대로 분배
+- least_connections: 현재 사용 중인 연결이 가장 적은 복제본 선택 (동률이면 순서대로)
+- 비동기 모드에서는 AsyncEngine을 그대로 보관 (종료 시 await dispose()로 정리, 세션에는 sync_engine을 연결)
+"""
+import itertools
+import threading
+from typing import Dict, List, Sequence, Union
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# 복제본 엔진 - 동기 Engine 또는 AsyncEngine
+ReplicaEngine = Union[Engine, AsyncEngine]
+
+REPLICA_ROUND_ROBIN = "round_robin"
+REPLICA_LEAST_CONNECTIONS = "least_connections"
+REPLICA_STRATEGIES = (REPLICA_ROUND_ROBIN, REPLICA_LEAST_CONNECTIONS)
+
+
+class ReplicaPool:
+    """
+    복제본 엔진 목록과 선택 전략
+    - 사용 중 연결 수는 풀 checkout/checkin 이벤트로 집계 (풀 종류와 무관)
+    """
+
+    def __init__(self, engines: Sequence[ReplicaEngine], strategy: str = REPLICA_ROUND_ROBIN):
+        if not engines:
+            raise ValueError("복제본 엔진이 하나 이상 필요합니다")
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"지원하지 않는 복제본 선택 전략입니다: {strategy}")
+        self.engines: List[ReplicaEngine] = list(engines)
+        self.strategy = strategy
+        self._counter = itertools.count()
+        self._in_use: Dict[int, int] = {index: 0 for index in range(len(self.engines))}
+        self._lock = threading.Lock()
+        for index, engine in enumerate(self.engines):
+            self._track(index, engine)
+
+    def _track(self, index: int, engine: ReplicaEngine) -> None:
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            with self._lock:
+                self._in_use[index] += 1
+
+        def on_checkin(dbapi_connection, connection_record):
+            with self._lock:
+                self._in_use[index] = max(self._in_use[index] - 1, 0)
+
+        # AsyncEngine은 이벤트를 직접 지원하지 않으므로 sync_engine에 등록
+        event.listen(sync_engine(engine), "checkout", on_checkout)
+        event.listen(sync_engine(engine), "checkin", on_checkin)
+
+    def in_use(self, engine: ReplicaEngine) -> int:
+        """복제본의 사용 중 연결 수"""
+        with self._lock:
+            return self._in_use[self.engines.index(engine)]
+
+    def choose(self) -> ReplicaEngine:
+        """전략에 따라 복제본 엔진 하나 선택"""
+        start = next(self._counter) % len(self.engines)
+        if self.strategy == REPLICA_ROUND_ROBIN:
+            return self.engines[start]
+        # 동률일 때 한 복제본에 몰리지 않도록 시작 위치를 돌려가며 비교
+        order = list(range(start, len(self.engines))) + list(range(start))
+        with self._lock:
+            index = min(order, key=lambda i: self._in_use[i])
+        return self.engines[index]
+
+
+def sync_engine(engine: ReplicaEngine) -> Engine:
+    """세션 bind/이벤트에 쓰는 동기 Engine (AsyncEngine이면 sync_engine)"""
+    return engine.sync_engine if isinstance(engine, AsyncEngine) else engine
@@ -0,0 +1,79 @@
+"""
+빠른 JSON 응답 (FAST_JSON_RESPONSE=true)
+- 기본 경로: 라우터가 만든 응답 모델을 FastAPI가 dict로 변환 -> response_model로 다시 검증 -> jsonable_encoder -> json.dumps
+- 빠른 경로: 이미 검증된 응답 모델을 orjson으로 바로 직렬화한 Response를 반환해 재검증/인코딩 단계를 생략
+- 설정이 꺼져 있으면 모델을 그대로 반환하므로 응답 본문은 두 경로가 같음
+- 설정은 요청을 처리하는 앱의 설정(create_app에 전달한 Settings, request.app.state.settings)을 따름
+"""
+from typing import Any, Dict, Optional, Union
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # FAST_JSON_RESPONSE를 켜지 않으면 필요 없음 (설정 검증에서 확인)
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    # orjson이 직접 처리하지 못하는 Pydantic 모델은 dict로 (datetime/date는 orjson이 ISO 형식으로 직렬화)
+    if isinstance(value, BaseModel):
+        return value.dict()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 값입니다: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 직렬화 응답 - Pydantic 모델도 그대로 받음"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _fast_json_enabled(request: Request) -> bool:
+    return request.app.state.settings.fast_json_response
+
+
+def model_response(
+    request: Request,
+    model: BaseModel,
+    response: Optional[Response] = None
+) -> Union[BaseModel, Response]:
+    """
+    라우터 응답 반환
+    - 빠른 경로가 켜져 있으면 직렬화된 Response (의존성으로 받은 response의 상태 코드/헤더 포함)
+    - 꺼져 있으면 모델 그대로 (FastAPI가 response_model로 검증/직렬화)
+    """
+    if not _fast_json_enabled(request):
+        return model
+    return _render(request, FastJSONResponse, model, response)
+
+
+def partial_response(
+    request: Request,
+    model: BaseModel,
+    exclude: Dict[str, Any],
+    response: Optional[Response] = None
+) -> Response:
+    """
+    일부 필드를 제외한 응답 (fields= 필드 선택)
+    - response_model의 필수 필드가 빠지므로 FastAPI 검증을 거치지 않고 직접 직렬화
+    - exclude: BaseModel.dict()의 exclude 형식 (예: {"data": {"__all__": {"created_at"}}})
+    """
+    content = model.dict(exclude=exclude)
+    if _fast_json_enabled(request):
+        return _render(request, FastJSONResponse, content, response)
+    return _render(request, JSONResponse, jsonable_encoder(content), response)
+
+
+def _render(request: Request, response_class: type, content: Any, response: Optional[Response]) -> Response:
+    # 의존성으로 받은 response에 설정된 상태 코드/헤더(ETag 등) 유지
+    # 설정하지 않았으면 라우트에 선언한 status_code (예: 생성 201)
+    status_code = response.status_code if response and response.status_code else None
+    status_code = status_code or getattr(request.scope.get("route"), "status_code", None) or 200
+    rendered = response_class(content, status_code=status_code)
+    if response is not None:
+        rendered.headers.raw.extend(response.headers.raw)
+    return rendered
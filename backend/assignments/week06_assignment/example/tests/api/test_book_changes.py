@@ -0,0 +1,164 @@
+"""
+도서 변경분 동기화 테스트
+- since 없이 전체 스냅샷, 토큰 이후 생성/수정/삭제만 전달되는지 테스트
+- 삭제 기록(tombstone) 저장/정리 테스트
+- 잘못된 토큰(400), 보존 기간이 지난 토큰(410) 테스트
+"""
+import os
+import sys
+import json
+import time
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from models.book import Book
+from models.book_tombstone import BookTombstone
+from services import book as book_service_module
+from services.book import BookService
+from utils.pagination import encode_cursor
+
+
+def get_changes(test_client: TestClient, since: str = None):
+    """변경분 요청 후 (응답, NDJSON 줄 목록) 반환"""
+    params = {"since": since} if since else {}
+    response = test_client.get("/api/v1/books/changes", params=params)
+    lines = [json.loads(line) for line in response.text.splitlines()] if response.status_code == 200 else []
+    return response, lines
+
+
+class TestBookChangesAPI:
+    """변경분 동기화 API 테스트"""
+
+    def test_full_snapshot_without_since(self, test_client: TestClient, sample_books):
+        """
+        since가 없으면 모든 도서를 upsert로 보내고 마지막 줄에 다음 토큰
+        """
+        # Arrange
+        book_ids = {book.id for book in sample_books}
+
+        # Act
+        response, lines = get_changes(test_client)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert [line["op"] for line in lines] == ["upsert"] * 3 + ["sync"]
+        assert {line["book"]["id"] for line in lines[:-1]} == book_ids
+        assert lines[-1]["next_since"]
+
+    def test_only_changes_since_token(self, test_client: TestClient, sample_books, monkeypatch):
+        """
+        토큰 이후 수정/생성된 도서는 upsert, 삭제된 도서는 delete로 (delete 먼저) 전달
+        """
+        # Arrange
+        monkeypatch.setattr(book_service_module, "BOOK_SYNC_OVERLAP_SECONDS", 0)
+        updated_id, deleted_id = sample_books[0].id, sample_books[1].id
+        deleted_isbn = sample_books[1].isbn
+        _, lines = get_changes(test_client)
+        token = lines[-1]["next_since"]
+        time.sleep(0.01)
+
+        test_client.patch(f"/api/v1/books/{updated_id}/stock", json={"quantity": 1, "operation": "add"})
+        test_client.delete(f"/api/v1/books/{deleted_id}")
+        created = test_client.post("/api/v1/books", json={
+            "title": "새 도서", "author": "작가", "isbn": "9784444444444", "price": 10000
+        }).json()["data"]
+
+        # Act
+        response, lines = get_changes(test_client, token)
+
+        # Assert
+        assert response.status_code == 200
+        assert [line["op"] for line in lines] == ["delete", "upsert", "upsert", "sync"]
+        assert (lines[0]["id"], lines[0]["isbn"]) == (deleted_id, deleted_isbn)
+        assert [line["book"]["id"] for line in lines[1:3]] == [updated_id, created["id"]]
+        assert lines[1]["book"]["stock_quantity"] == 11
+        assert lines[-1]["next_since"] != token
+
+    def test_overlap_resends_recent_changes(self, test_client: TestClient, sample_books):
+        """
+        겹침 구간 안의 변경은 다음 동기화에서 다시 전달 (늦게 커밋된 트랜잭션 누락 방지)
+        """
+        # Arrange
+        _, lines = get_changes(test_client)
+
+        # Act
+        response, resent = get_changes(test_client, lines[-1]["next_since"])
+
+        # Assert
+        assert response.status_code == 200
+        assert [line["book"]["id"] for line in resent[:-1]] == [line["book"]["id"] for line in lines[:-1]]
+
+    def test_invalid_token(self, test_client: TestClient):
+        """
+        해석할 수 없는 토큰, 목록 커서 토큰은 400
+        """
+        # Act
+        garbage, _ = get_changes(test_client, "not-a-token")
+        list_cursor, _ = get_changes(test_client, encode_cursor("id", [10]))
+
+        # Assert
+        assert garbage.status_code == 400
+        assert list_cursor.status_code == 400
+        assert garbage.json()["status"] == "error"
+
+    def test_expired_token(self, test_client: TestClient):
+        """
+        삭제 기록 보존 기간보다 오래된 토큰은 410 (전체 재동기화 필요)
+        """
+        # Arrange
+        old = datetime.utcnow() - timedelta(days=book_service_module.BOOK_TOMBSTONE_RETENTION_DAYS + 1)
+        token = encode_cursor("sync", [old.isoformat()])
+
+        # Act
+        response, _ = get_changes(test_client, token)
+
+        # Assert
+        assert response.status_code == 410
+        assert response.json()["status"] == "error"
+
+
+class TestBookChangesService:
+    """변경분 동기화 서비스 테스트"""
+
+    def test_delete_writes_tombstone_and_purges_expired(self, db_session: Session, sample_book: Book):
+        """
+        도서 삭제 시 삭제 기록 추가, 보존 기간이 지난 기록은 정리
+        """
+        # Arrange
+        book_id, isbn = sample_book.id, sample_book.isbn
+        expired = BookTombstone(
+            book_id=99999, isbn="9780000000000",
+            deleted_at=datetime.utcnow() - timedelta(days=book_service_module.BOOK_TOMBSTONE_RETENTION_DAYS + 1)
+        )
+        db_session.add(expired)
+        db_session.commit()
+        db_session.expunge(expired)
+
+        # Act
+        BookService.delete_book(db_session, book_id)
+
+        # Assert
+        tombstones = db_session.query(BookTombstone).all()
+        assert [(tombstone.book_id, tombstone.isbn) for tombstone in tombstones] == [(book_id, isbn)]
+
+    def test_changed_books_keyset_pages(self, db_session: Session, sample_books):
+        """
+        (updated_at, id) 키셋으로 나눠 조회해도 빠짐/중복 없음
+        """
+        # Arrange
+        expected = [book.id for book in sorted(sample_books, key=lambda book: (book.updated_at, book.id))]
+
+        # Act
+        first = BookService.get_changed_books(db_session, None, None, 2)
+        second = BookService.get_changed_books(db_session, None, [first[-1].updated_at, first[-1].id], 2)
+
+        # Assert
+        assert len(first) == 2
+        assert [book.id for book in first + second] == expected
@@ -0,0 +1,105 @@
+"""
+도서 내보내기 테스트
+- NDJSON/CSV 형식 테스트
+- 목록과 같은 필터 적용 테스트
+- 페이지 나눔 없이 조회문 1회로 스트리밍되는지 테스트
+"""
+import os
+import sys
+import csv
+import io
+import json
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+
+class TestBookExport:
+    """도서 내보내기 API 테스트"""
+
+    def test_export_ndjson(self, test_client: TestClient, sample_books):
+        """
+        기본 형식은 NDJSON - 한 줄에 도서 하나, id 순
+        """
+        # Arrange
+        expected_ids = sorted(book.id for book in sample_books)
+
+        # Act
+        response = test_client.get("/api/v1/books/export")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert 'filename="books.ndjson"' in response.headers["content-disposition"]
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == expected_ids
+        assert rows[0]["category_name"] is not None
+
+    def test_export_csv_with_filters(self, test_client: TestClient, sample_books):
+        """
+        CSV는 BOM + 헤더 + 행, 목록 조회와 같은 필터 적용
+        """
+        # Arrange
+        category_id = sample_books[0].category_id
+        expected = sorted(book.isbn for book in sample_books if book.category_id == category_id)
+
+        # Act
+        response = test_client.get(
+            "/api/v1/books/export", params={"format": "csv", "category_id": category_id}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        text = response.content.decode("utf-8")
+        assert text.startswith("\ufeff")
+        rows = list(csv.DictReader(io.StringIO(text[1:])))
+        assert sorted(row["isbn"] for row in rows) == expected
+        assert rows[0]["title"] and rows[0]["published_date"]
+
+    def test_export_csv_escapes_formulas(self, test_client: TestClient, book_factory):
+        """
+        수식으로 해석될 수 있는 값은 ' 를 붙여 내보냄 (CSV 인젝션 방지)
+        """
+        # Arrange
+        book_factory(title="=HYPERLINK(\"http://example.com\")")
+
+        # Act
+        response = test_client.get("/api/v1/books/export", params={"format": "csv"})
+
+        # Assert
+        rows = list(csv.DictReader(io.StringIO(response.content.decode("utf-8-sig"))))
+        assert rows[0]["title"].startswith("'=")
+
+    def test_export_empty_and_invalid(self, test_client: TestClient, sample_books):
+        """
+        결과가 없으면 CSV 헤더만, 잘못된 형식/가격 범위는 400
+        """
+        # Act
+        empty = test_client.get("/api/v1/books/export", params={"format": "csv", "min_price": 999999})
+        invalid_format = test_client.get("/api/v1/books/export", params={"format": "xml"})
+        invalid_range = test_client.get("/api/v1/books/export", params={"min_price": 100, "max_price": 10})
+
+        # Assert
+        assert empty.status_code == 200
+        assert len(empty.content.decode("utf-8-sig").splitlines()) == 1
+        assert invalid_format.status_code == 400
+        assert invalid_range.status_code == 400
+
+    def test_export_runs_single_query(self, test_client: TestClient, db_session: Session, sample_books, capture_statements):
+        """
+        페이지마다 다시 조회하지 않고 조회문 1회 결과를 스트리밍 (LIMIT/OFFSET 없음)
+        """
+        # Act
+        with capture_statements(db_session, "SELECT") as statements:
+            response = test_client.get("/api/v1/books/export")
+
+        # Assert
+        book_queries = [statement.sql for statement in statements if "FROM books" in statement.sql]
+        assert response.status_code == 200
+        assert len(book_queries) == 1
+        assert "LIMIT" not in book_queries[0] and "OFFSET" not in book_queries[0]
@@ -0,0 +1,75 @@
+"""
+도서 목록 필드 선택(fields) 테스트
+- 응답에 선택한 필드만 포함되는지 테스트
+- SQL에도 선택한 컬럼만 조회되고 행마다 추가 조회가 없는지 테스트
+- 알 수 없는 필드는 400 테스트
+"""
+import os
+import sys
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+
+class TestBookFields:
+    """도서 목록 필드 선택 테스트"""
+
+    @pytest.mark.parametrize("fast_json", [False, True])
+    def test_response_contains_only_selected_fields(self, test_client: TestClient, sample_books, monkeypatch, fast_json):
+        """
+        선택한 필드 + id만 응답 (기본/빠른 JSON 경로 모두), 봉투와 meta는 그대로
+        """
+        # Arrange
+        if fast_json:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(test_client.app.state.settings, "fast_json_response", fast_json)
+
+        # Act
+        response = test_client.get("/api/v1/books", params={"fields": "title, price", "size": 2})
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert [set(book) for book in body["data"]] == [{"id", "title", "price"}] * 2
+        assert body["meta"]["total"] == len(sample_books)
+        assert body["meta"]["next_cursor"] is not None
+        assert "ETag" in response.headers
+
+    def test_selects_only_requested_columns(self, test_client: TestClient, db_session: Session, sample_books, capture_statements):
+        """
+        목록 조회 SQL도 선택한 컬럼만 포함, 응답 생성 중 행마다 추가 조회 없음
+        """
+        # Arrange
+        db_session.expunge_all()  # 픽스처가 로드한 전체 속성 대신 조회 결과 사용
+
+        # Act
+        with capture_statements(db_session, "SELECT") as statements:
+            response = test_client.get(
+                "/api/v1/books", params={"fields": "id,published_date", "count_strategy": "estimated"}
+            )
+
+        # Assert
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == len(sample_books)
+        list_queries = [
+            statement.sql for statement in statements if "books.id" in statement.sql and "LIMIT" in statement.sql
+        ]
+        assert len(list_queries) == 1
+        assert "books.title" not in list_queries[0]
+        assert "books.created_at" not in list_queries[0]
+
+    def test_unknown_field(self, test_client: TestClient):
+        """
+        응답에 없는 필드는 400
+        """
+        # Act
+        response = test_client.get("/api/v1/books", params={"fields": "title,password"})
+
+        # Assert
+        assert response.status_code == 400
+        assert "password" in response.json()["message"]
@@ -0,0 +1,148 @@
+"""
+도서 목록 다중 정렬(sort) 테스트
+- 여러 필드/내림차순 정렬과 id 보조 정렬 테스트
+- 정렬된 커서 페이지네이션이 빠짐/중복 없이 이어지는지 테스트 (NULL 포함)
+- 허용되지 않은 정렬 필드, 다른 정렬의 커서는 400 테스트
+"""
+import os
+import sys
+from datetime import date
+import pytest
+from fastapi.testclient import TestClient
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from models.book import Book
+
+
+@pytest.fixture
+def sortable_books(book_factory):
+    """가격/출간일이 겹치고 출간일이 없는 도서를 포함한 데이터"""
+    rows = [
+        ("A", 20000, date(2020, 1, 1)),
+        ("B", 10000, None),
+        ("C", 20000, date(2021, 6, 1)),
+        ("D", 10000, date(2019, 3, 1)),
+        ("E", 20000, None),
+        ("F", 30000, date(2021, 6, 1)),
+        ("G", 10000, date(2019, 3, 1)),
+    ]
+    return [
+        book_factory(title=title, price=price, published_date=published, isbn=f"97810000000{index:02d}")
+        for index, (title, price, published) in enumerate(rows)
+    ]
+
+
+def fetch_all_pages(test_client: TestClient, **params):
+    """next_cursor를 따라 마지막 페이지까지 조회한 제목 목록"""
+    titles, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        body = test_client.get("/api/v1/books", params=query).json()
+        titles.extend(book["title"] for book in body["data"])
+        cursor = body["meta"]["next_cursor"]
+        if cursor is None:
+            return titles
+
+
+def expected_titles(books, key):
+    return [book.title for book in sorted(books, key=key)]
+
+
+class TestBookSort:
+    """도서 목록 정렬 테스트"""
+
+    def test_multi_column_sort(self, test_client: TestClient, sortable_books):
+        """
+        price 오름차순 -> title 내림차순 -> id
+        """
+        # Arrange
+        by_title_desc = sorted(sortable_books, key=lambda book: book.title, reverse=True)
+        expected = expected_titles(by_title_desc, lambda book: book.price)  # 안정 정렬이므로 같은 가격은 제목 내림차순 유지
+
+        # Act
+        response = test_client.get("/api/v1/books", params={"sort": "price,-title", "size": 100})
+
+        # Assert
+        assert response.status_code == 200
+        assert [book["title"] for book in response.json()["data"]] == expected
+
+    def test_id_tiebreaker(self, test_client: TestClient, sortable_books):
+        """
+        같은 가격이면 id 순 (결과 순서가 항상 같음)
+        """
+        # Arrange
+        expected = expected_titles(sortable_books, lambda book: (-book.price, book.id))
+
+        # Act
+        response = test_client.get("/api/v1/books", params={"sort": "-price", "size": 100})
+
+        # Assert
+        assert [book["title"] for book in response.json()["data"]] == expected
+
+    @pytest.mark.parametrize("sort", ["price,-published_date,title", "-published_date", "published_date,-price", "-created_at,title"])
+    def test_cursor_pages_cover_all_rows(self, test_client: TestClient, sortable_books, sort):
+        """
+        2건씩 커서로 끝까지 조회해도 한 번에 조회한 순서와 같음 (출간일 NULL 포함)
+        """
+        # Arrange
+        single_page = test_client.get("/api/v1/books", params={"sort": sort, "size": 100}).json()["data"]
+
+        # Act
+        titles = fetch_all_pages(test_client, sort=sort, size=2)
+
+        # Assert
+        assert titles == [book["title"] for book in single_page]
+        assert sorted(titles) == sorted(book.title for book in sortable_books)
+
+    def test_nulls_sort_first_ascending(self, test_client: TestClient, sortable_books):
+        """
+        NULL은 가장 작은 값 - 오름차순이면 맨 앞
+        """
+        # Act
+        response = test_client.get("/api/v1/books", params={"sort": "published_date", "size": 100})
+
+        # Assert
+        dates = [book["published_date"] for book in response.json()["data"]]
+        assert dates[:2] == [None, None]
+        assert dates[2:] == sorted(dates[2:])
+
+    @pytest.mark.parametrize("sort", ["password", "price,price", "-", "price,title,author,id"])
+    def test_invalid_sort(self, test_client: TestClient, sort):
+        """
+        허용되지 않은 필드, 중복, 빈 필드, 개수 초과는 400
+        """
+        # Act
+        response = test_client.get("/api/v1/books", params={"sort": sort})
+
+        # Assert
+        assert response.status_code == 400
+        assert response.json()["status"] == "error"
+
+    def test_cursor_from_other_sort(self, test_client: TestClient, sortable_books):
+        """
+        다른 정렬 기준에서 받은 커서는 400
+        """
+        # Arrange
+        cursor = test_client.get("/api/v1/books", params={"sort": "price", "size": 2}).json()["meta"]["next_cursor"]
+
+        # Act
+        response = test_client.get("/api/v1/books", params={"sort": "-price", "size": 2, "cursor": cursor})
+
+        # Assert
+        assert response.status_code == 400
+
+    def test_composite_indexes_declared(self):
+        """
+        정렬 키 조합에 맞는 (필터, 정렬 키, id) 복합 인덱스 선언 (가격 인덱스는 updated_at까지 커버링)
+        """
+        # Act
+        indexes = {index.name: [column.name for column in index.columns] for index in Book.__table__.indexes}
+
+        # Assert
+        assert indexes["ix_books_price_cover"] == ["price", "id", "updated_at"]
+        assert indexes["ix_books_category_price_cover"] == ["category_id", "price", "id", "updated_at"]
+        assert indexes["ix_books_category_published_date_id"] == ["category_id", "published_date", "id"]
@@ -4,10 +4,12 @@ Book API 테스트
 - 검색 및 필터링 테스트
 - 페이지네이션 테스트
 - 재고 관리 테스트
+- 대량 등록 테스트
 - 에러 케이스 테스트
 """
 import os
 import sys
+import json
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -21,6 +23,8 @@ if week05_example_path not in sys.path:
 
 from models.book import Book
 from models.category import Category
+from utils.exceptions import InvalidOperationException
+from utils.ndjson import read_ndjson
 
 
 class TestBookAPI:
@@ -555,6 +559,147 @@ class TestBookPagination:
         assert response.status_code == 400
 
 
+class TestBookCursorPagination:
+    """도서 커서(키셋) 페이지네이션 테스트"""
+    
+    def test_cursor_pagination_walks_all_books(self, test_client: TestClient, large_dataset):
+        """
+        next_cursor를 따라가며 전체 도서를 중복/누락 없이 조회하는지 테스트
+        """
+        # Arrange
+        size = 30
+        seen_ids = []
+        
+        # Act
+        response = test_client.get(f"/api/v1/books?size={size}")
+        while True:
+            assert response.status_code == 200
+            response_data = response.json()
+            seen_ids.extend(book["id"] for book in response_data["data"])
+            next_cursor = response_data["meta"]["next_cursor"]
+            if next_cursor is None:
+                break
+            response = test_client.get(f"/api/v1/books?size={size}&cursor={next_cursor}")
+        
+        # Assert
+        assert len(seen_ids) == 100
+        assert len(set(seen_ids)) == 100
+        assert seen_ids == sorted(seen_ids)
+    
+    def test_cursor_pagination_with_filter(self, test_client: TestClient, large_dataset, sample_categories: list[Category]):
+        """
+        필터와 커서를 함께 사용할 때 필터 조건이 유지되는지 테스트
+        """
+        # Arrange
+        category_id = sample_categories[0].id
+        first = test_client.get(f"/api/v1/books?category_id={category_id}&size=5").json()
+        
+        # Act
+        response = test_client.get(
+            f"/api/v1/books?category_id={category_id}&size=5&cursor={first['meta']['next_cursor']}"
+        )
+        
+        # Assert
+        assert response.status_code == 200
+        books = response.json()["data"]
+        assert len(books) == 5
+        assert all(book["category_id"] == category_id for book in books)
+        assert books[0]["id"] > first["data"][-1]["id"]
+    
+    def test_cursor_pagination_last_page(self, test_client: TestClient, sample_books: list[Book]):
+        """
+        마지막 페이지에서는 next_cursor가 없어야 함
+        """
+        # Arrange & Act
+        response = test_client.get("/api/v1/books?size=10")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["meta"]["next_cursor"] is None
+    
+    def test_cursor_pagination_invalid_cursor(self, test_client: TestClient):
+        """
+        잘못된 커서는 400 에러
+        """
+        # Arrange & Act
+        response = test_client.get("/api/v1/books?cursor=not-a-cursor")
+        
+        # Assert
+        assert response.status_code == 400
+        
+        response_data = response.json()
+        assert response_data["status"] == "error"
+        assert "커서" in response_data["message"]
+
+
+class TestBookCountStrategy:
+    """도서 목록 전체 개수 계산 방식 테스트"""
+    
+    def test_exact_count_is_default(self, test_client: TestClient, sample_books: list[Book]):
+        """
+        기본값은 정확한 COUNT
+        """
+        # Arrange & Act
+        response = test_client.get("/api/v1/books")
+        
+        # Assert
+        meta = response.json()["meta"]
+        assert meta["total"] == len(sample_books)
+        assert meta["total_exact"] is True
+    
+    def test_cached_count_invalidated_on_write(self, test_client: TestClient, sample_books: list[Book], sample_categories: list[Category]):
+        """
+        캐시된 COUNT는 도서 등록 시 무효화되어야 함
+        """
+        # Arrange
+        url = "/api/v1/books?count_strategy=cached"
+        before = test_client.get(url).json()["meta"]["total"]
+        
+        # Act
+        test_client.post("/api/v1/books", json={
+            "title": "캐시 무효화 테스트",
+            "author": "테스트 저자",
+            "isbn": "9780000000001",
+            "price": 10000,
+            "category_id": sample_categories[0].id
+        })
+        after = test_client.get(url).json()["meta"]
+        
+        # Assert
+        assert after["total"] == before + 1
+        assert after["total_exact"] is True
+    
+    def test_estimated_count(self, db_session: Session, large_dataset):
+        """
+        id 구간 샘플링 추정값 테스트
+        - 샘플 크기보다 작은 테이블은 정확한 값으로 대체
+        - 필터가 없으면 추정값이 실제 개수와 근접
+        """
+        from utils.counting import estimate_count
+        
+        # Arrange
+        query = db_session.query(Book)
+        
+        # Act
+        exact_total, exact_flag = estimate_count(query, Book.id)
+        estimated_total, estimated_flag = estimate_count(query, Book.id, sample_size=40, windows=4)
+        
+        # Assert
+        assert (exact_total, exact_flag) == (100, True)
+        assert estimated_flag is False
+        assert abs(estimated_total - 100) <= 10
+    
+    def test_invalid_count_strategy(self, test_client: TestClient):
+        """
+        지원하지 않는 계산 방식은 400 에러
+        """
+        # Arrange & Act
+        response = test_client.get("/api/v1/books?count_strategy=guess")
+        
+        # Assert
+        assert response.status_code == 400
+
+
 class TestBookStockManagement:
     """도서 재고 관리 테스트"""
     
@@ -689,6 +834,228 @@ class TestBookStockManagement:
         assert "찾을 수 없습니다" in response_data["message"]
 
 
+
+class TestBookStockBatch:
+    """일괄 재고 변경 테스트"""
+    
+    def test_batch_success(self, test_client: TestClient, sample_books):
+        """
+        여러 도서의 재고를 한 번에 변경하고 항목별 결과 반환
+        - 같은 도서의 항목은 요청 순서대로 적용
+        """
+        # Arrange
+        first, second = sample_books[0], sample_books[1]
+        first_stock, second_stock = first.stock_quantity, second.stock_quantity
+        batch = {
+            "items": [
+                {"book_id": second.id, "quantity": 2, "operation": "subtract"},
+                {"book_id": first.id, "quantity": 1, "operation": "subtract"},
+                {"book_id": second.id, "quantity": 5, "operation": "add"},
+            ]
+        }
+        
+        # Act
+        response = test_client.patch("/api/v1/books/stock:batch", json=batch)
+        
+        # Assert
+        assert response.status_code == 200
+        
+        response_data = response.json()
+        assert response_data["status"] == "success"
+        assert [item["stock_quantity"] for item in response_data["data"]] == [
+            second_stock - 2, first_stock - 1, second_stock + 3
+        ]
+        
+        book_response = test_client.get(f"/api/v1/books/{second.id}")
+        assert book_response.json()["data"]["stock_quantity"] == second_stock + 3
+    
+    def test_batch_all_or_nothing(self, test_client: TestClient, sample_books):
+        """
+        한 항목이라도 재고가 부족하면 전체 미적용
+        """
+        # Arrange
+        first, second = sample_books[0], sample_books[1]
+        first_stock, second_stock = first.stock_quantity, second.stock_quantity
+        batch = {
+            "items": [
+                {"book_id": first.id, "quantity": 1, "operation": "subtract"},
+                {"book_id": second.id, "quantity": second_stock + 1, "operation": "subtract"},
+            ]
+        }
+        
+        # Act
+        response = test_client.patch("/api/v1/books/stock:batch", json=batch)
+        
+        # Assert
+        assert response.status_code == 400
+        
+        response_data = response.json()
+        assert response_data["status"] == "error"
+        assert f"ID: {second.id}" in response_data["message"]
+        
+        for book_id, stock in ((first.id, first_stock), (second.id, second_stock)):
+            book_response = test_client.get(f"/api/v1/books/{book_id}")
+            assert book_response.json()["data"]["stock_quantity"] == stock
+    
+    def test_batch_book_not_found(self, test_client: TestClient, sample_book: Book):
+        """
+        존재하지 않는 도서가 포함되면 404
+        """
+        # Arrange
+        batch = {
+            "items": [
+                {"book_id": sample_book.id, "quantity": 1, "operation": "add"},
+                {"book_id": 99999, "quantity": 1, "operation": "add"},
+            ]
+        }
+        
+        # Act
+        response = test_client.patch("/api/v1/books/stock:batch", json=batch)
+        
+        # Assert
+        assert response.status_code == 404
+        assert "99999" in response.json()["message"]
+    
+    def test_batch_empty_items(self, test_client: TestClient):
+        """
+        빈 항목 목록은 검증 오류
+        """
+        # Act
+        response = test_client.patch("/api/v1/books/stock:batch", json={"items": []})
+        
+        # Assert
+        assert response.status_code == 400
+
+
+
+class TestBookImport:
+    """도서 대량 등록 테스트"""
+    
+    @staticmethod
+    def make_record(index: int, **overrides) -> dict:
+        record = {
+            "title": f"대량 등록 도서 {index}",
+            "author": "테스트 저자",
+            "isbn": f"{9790000000000 + index}",
+            "price": 10000 + index,
+            "stock_quantity": 1
+        }
+        record.update(overrides)
+        return record
+    
+    def test_import_json_array_with_row_report(self, test_client: TestClient, sample_book: Book, sample_category: Category):
+        """
+        JSON 배열 등록 - 유효한 행은 등록, 실패한 행은 사유와 함께 보고
+        """
+        # Arrange
+        records = [
+            self.make_record(0, category_id=sample_category.id),
+            self.make_record(1, isbn="123"),                      # 형식 오류
+            self.make_record(2, isbn=self.make_record(0)["isbn"]),  # 요청 내 중복
+            self.make_record(3, isbn=sample_book.isbn),            # DB 중복
+            self.make_record(4, category_id=99999),                # 없는 카테고리
+            self.make_record(5),
+        ]
+        
+        # Act
+        response = test_client.post("/api/v1/books/bulk", json=records)
+        
+        # Assert
+        assert response.status_code == 200
+        
+        result = response.json()["data"]
+        assert result["success_count"] == 2
+        assert result["failed_count"] == 4
+        assert [item["index"] for item in result["created_items"]] == [0, 5]
+        assert [item["index"] for item in result["failed_items"]] == [1, 2, 3, 4]
+        assert "isbn" in result["failed_items"][0]["error"]
+        assert "이미 존재하는 ISBN" in result["failed_items"][2]["error"]
+        assert "카테고리" in result["failed_items"][3]["error"]
+        
+        created_id = result["created_items"][0]["id"]
+        book_response = test_client.get(f"/api/v1/books/{created_id}")
+        assert book_response.json()["data"]["category_name"] == sample_category.name
+    
+    def test_import_ndjson_in_chunks(self, test_client: TestClient):
+        """
+        NDJSON 등록 - chunk 크기보다 많은 행과 잘못된 JSON 줄 처리
+        """
+        # Arrange
+        lines = [json.dumps(self.make_record(index)) for index in range(5)]
+        lines.insert(2, "{잘못된 JSON")
+        body = "\n".join(lines) + "\n"
+        
+        # Act
+        response = test_client.post(
+            "/api/v1/books/bulk?chunk_size=2",
+            content=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"}
+        )
+        
+        # Assert
+        assert response.status_code == 200
+        
+        result = response.json()["data"]
+        assert result["success_count"] == 5
+        assert [item["index"] for item in result["failed_items"]] == [2]
+        
+        list_response = test_client.get("/api/v1/books?search=대량 등록")
+        assert list_response.json()["meta"]["total"] == 5
+    
+    def test_import_lookups_are_batched(self, test_client: TestClient, db_session: Session, sample_categories, capture_statements):
+        """
+        행 수와 무관하게 카테고리/ISBN 조회는 한 번씩, INSERT는 chunk 수만큼 실행
+        (두 번째 chunk부터는 커밋으로 풀린 카테고리 공유 잠금을 다시 잡는 조회 1회씩)
+        """
+        # Arrange
+        records = [
+            self.make_record(index, category_id=sample_categories[index % len(sample_categories)].id)
+            for index in range(120)
+        ]
+        
+        # Act
+        with capture_statements(db_session, "SELECT", "INSERT") as statements:
+            response = test_client.post("/api/v1/books/bulk?chunk_size=50", json=records)
+        
+        # Assert
+        kinds = [statement.kind for statement in statements]
+        assert response.json()["data"]["success_count"] == 120
+        assert kinds.count("INSERT") == 3
+        assert kinds.count("SELECT") <= 2 + 2 + 3  # 카테고리/ISBN + 카테고리 재잠금 + chunk별 id 조회
+    
+    def test_import_requires_array(self, test_client: TestClient):
+        """
+        JSON 본문이 배열이 아니면 400
+        """
+        # Act
+        response = test_client.post("/api/v1/books/bulk", json={"title": "단건"})
+        
+        # Assert
+        assert response.status_code == 400
+        assert response.json()["status"] == "error"
+    
+    @pytest.mark.asyncio
+    async def test_ndjson_limit_stops_reading(self):
+        """
+        NDJSON은 최대 행 수를 넘는 순간 나머지 본문을 읽지 않고 오류
+        """
+        # Arrange
+        consumed = []
+        
+        async def stream():
+            for index in range(100):
+                consumed.append(index)
+                yield (json.dumps(self.make_record(index)) + "\n").encode("utf-8")
+        
+        # Act
+        with pytest.raises(InvalidOperationException) as exc_info:
+            await read_ndjson(stream(), max_records=3)
+        
+        # Assert
+        assert "최대 3건" in exc_info.value.message
+        assert len(consumed) == 4
+
+
 @pytest.mark.integration
 class TestBookAPIIntegration:
     """도서 API 통합 테스트"""
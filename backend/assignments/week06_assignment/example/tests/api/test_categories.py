@@ -16,7 +16,11 @@ week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".
 if week05_example_path not in sys.path:
     sys.path.insert(0, week05_example_path)
 
+from models.book import Book
 from models.category import Category
+from services import category as category_service_module
+from services.category import CategoryService
+from utils.jobs import JOB_COMPLETED
 
 
 class TestCategoryAPI:
@@ -180,6 +184,128 @@ class TestCategoryAPI:
         assert response_data["status"] == "success"
         assert len(response_data["data"]) > 0
 
+    
+    def test_get_all_categories_book_count(self, test_client: TestClient, sample_books):
+        """
+        카테고리별 도서 개수가 정확히 계산되는지 테스트
+        """
+        # Arrange
+        expected = {}
+        for book in sample_books:
+            expected[book.category_id] = expected.get(book.category_id, 0) + 1
+        
+        # Act
+        response = test_client.get("/api/v1/categories")
+        
+        # Assert
+        assert response.status_code == 200
+        for category in response.json()["data"]:
+            assert category["book_count"] == expected.get(category["id"], 0)
+    
+    def test_get_all_categories_does_not_load_books(self, db_session: Session, large_dataset):
+        """
+        도서 개수 계산 시 도서 행을 ORM 객체로 불러오지 않는지 테스트
+        """
+        # Arrange
+        db_session.expire_all()
+        
+        # Act
+        categories = CategoryService.get_all_categories(db_session)
+        
+        # Assert
+        assert sum(category.book_count for category in categories) == len(large_dataset)
+        assert all("books" not in vars(category) for category in categories)
+
+
+class TestCategoryDelete:
+    """카테고리 삭제 테스트 - 소속 도서는 남기고 카테고리만 해제"""
+    
+    @pytest.fixture
+    def job_session(self, db_session: Session, monkeypatch):
+        """백그라운드 작업도 테스트 연결(롤백 격리)을 사용하도록 세션 팩토리 교체"""
+        monkeypatch.setattr(
+            category_service_module, "SessionLocal",
+            lambda: Session(bind=db_session.connection())
+        )
+        monkeypatch.setattr(category_service_module, "CATEGORY_DELETE_BATCH_SIZE", 2)
+    
+    def test_delete_category_detaches_books(self, test_client: TestClient, db_session: Session, sample_books):
+        """
+        카테고리 삭제 시 소속 도서는 삭제되지 않고 category_id/category_name이 NULL
+        """
+        # Arrange
+        category_id = sample_books[0].category_id
+        book_ids = [book.id for book in sample_books if book.category_id == category_id]
+        
+        # Act
+        response = test_client.delete(f"/api/v1/categories/{category_id}")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["data"]["detached_books"] == len(book_ids)
+        rows = db_session.query(Book.category_id, Book.category_name).filter(Book.id.in_(book_ids)).all()
+        assert len(rows) == len(book_ids)
+        assert set(rows) == {(None, None)}
+        assert db_session.query(Category).filter(Category.id == category_id).first() is None
+    
+    def test_delete_category_does_not_load_books(self, db_session: Session, sample_books):
+        """
+        도서를 ORM 객체로 불러오지 않고 집합 UPDATE로 처리
+        """
+        # Arrange
+        category_id = sample_books[0].category_id
+        db_session.expunge_all()
+        
+        # Act
+        CategoryService.delete_category(db_session, category_id)
+        
+        # Assert
+        assert not any(isinstance(obj, Book) for obj in db_session.identity_map.values())
+    
+    def test_delete_category_not_found(self, test_client: TestClient):
+        """
+        존재하지 않는 카테고리 삭제 시 404
+        """
+        # Act
+        response = test_client.delete("/api/v1/categories/99999")
+        
+        # Assert
+        assert response.status_code == 404
+    
+    def test_delete_category_in_background(self, test_client: TestClient, db_session: Session, sample_books, job_session):
+        """
+        background=true면 202와 작업 ID 반환, 작업은 나눠서 커밋하며 진행률 기록
+        """
+        # Arrange
+        category_id = sample_books[0].category_id
+        book_ids = [book.id for book in sample_books if book.category_id == category_id]
+        
+        # Act
+        response = test_client.delete(f"/api/v1/categories/{category_id}", params={"background": "true"})
+        job = response.json()["data"]
+        status_response = test_client.get(f"/api/v1/categories/jobs/{job['id']}")
+        
+        # Assert
+        assert response.status_code == 202
+        assert job["total"] == len(book_ids)
+        result = status_response.json()["data"]
+        assert result["status"] == JOB_COMPLETED
+        assert result["processed"] == len(book_ids)
+        assert result["progress"] == 100.0
+        assert result["result"]["detached_books"] == len(book_ids)
+        remaining = db_session.query(Book).filter(Book.id.in_(book_ids), Book.category_id.isnot(None)).count()
+        assert remaining == 0
+    
+    def test_get_unknown_job(self, test_client: TestClient):
+        """
+        존재하지 않는 작업 조회 시 404
+        """
+        # Act
+        response = test_client.get("/api/v1/categories/jobs/unknown")
+        
+        # Assert
+        assert response.status_code == 404
+
 
 class TestCategoryAPIErrorHandling:
     """카테고리 API 에러 처리 테스트"""
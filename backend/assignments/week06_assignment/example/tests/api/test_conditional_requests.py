@@ -0,0 +1,209 @@
+"""
+조건부 GET (ETag / Last-Modified) 테스트
+- 도서 상세/목록, 카테고리 목록의 검증자 헤더 테스트
+- If-None-Match / If-Modified-Since 일치 시 304 테스트
+- 304 판단 시 도서 행 전체를 조회하지 않는지 테스트
+"""
+import os
+import sys
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from models.book import Book
+from utils.cache import book_cache
+
+
+class TestBookDetailConditional:
+    """도서 상세 조건부 요청 테스트"""
+
+    def test_validators_and_not_modified(self, test_client: TestClient, sample_book: Book):
+        """
+        ETag/Last-Modified를 내려주고 같은 ETag로 재요청하면 본문 없이 304
+        """
+        # Arrange
+        url = f"/api/v1/books/{sample_book.id}"
+        first = test_client.get(url)
+
+        # Act
+        response = test_client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+
+        # Assert
+        assert first.status_code == 200
+        assert first.headers["Last-Modified"]
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == first.headers["ETag"]
+
+    def test_not_modified_reads_only_updated_at(self, test_client: TestClient, db_session: Session, sample_book: Book, capture_statements):
+        """
+        304 판단은 updated_at 한 컬럼만 조회 (도서 행 전체를 읽지 않음)
+        """
+        # Arrange
+        url = f"/api/v1/books/{sample_book.id}"
+        etag = test_client.get(url).headers["ETag"]
+        book_cache.clear()  # 캐시된 응답 없이 DB에서 확인하는 경로
+
+        # Act
+        with capture_statements(db_session, "SELECT") as statements:
+            response = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert len(statements) == 1
+        assert "books.title" not in statements[0].sql
+
+    def test_change_within_same_second_changes_etag(self, test_client: TestClient, sample_book: Book):
+        """
+        연속 수정(같은 초 안)도 ETag가 바뀌어 이전 ETag로는 200
+        """
+        # Arrange
+        url = f"/api/v1/books/{sample_book.id}"
+        etag = test_client.get(url).headers["ETag"]
+
+        # Act
+        test_client.patch(f"{url}/stock", json={"quantity": 1, "operation": "add"})
+        response = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_if_modified_since(self, test_client: TestClient, sample_book: Book):
+        """
+        If-None-Match 없이 If-Modified-Since만 보내면 초 단위로 비교
+        """
+        # Arrange
+        url = f"/api/v1/books/{sample_book.id}"
+        last_modified = test_client.get(url).headers["Last-Modified"]
+
+        # Act
+        not_modified = test_client.get(url, headers={"If-Modified-Since": last_modified})
+        modified = test_client.get(url, headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+
+        # Assert
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
+
+    def test_conditional_request_for_missing_book(self, test_client: TestClient):
+        """
+        존재하지 않는 도서는 조건부 요청이어도 404
+        """
+        # Act
+        response = test_client.get("/api/v1/books/99999", headers={"If-None-Match": '"abc"'})
+
+        # Assert
+        assert response.status_code == 404
+
+
+class TestBookListConditional:
+    """도서 목록 조건부 요청 테스트"""
+
+    def test_not_modified_without_reading_rows(self, test_client: TestClient, db_session: Session, sample_books, capture_statements):
+        """
+        목록 ETag가 같으면 집계 조회 1회 후 304
+        """
+        # Arrange
+        first = test_client.get("/api/v1/books", params={"size": 2})
+
+        # Act
+        with capture_statements(db_session, "SELECT") as statements:
+            response = test_client.get(
+                "/api/v1/books", params={"size": 2}, headers={"If-None-Match": first.headers["ETag"]}
+            )
+
+        # Assert
+        assert first.status_code == 200
+        assert response.status_code == 304
+        assert len(statements) == 1
+        assert "books.title" not in statements[0].sql
+
+    def test_etag_changes_with_data_and_query(self, test_client: TestClient, sample_books):
+        """
+        도서 추가 시, 쿼리 문자열이 다를 때 ETag가 달라짐
+        """
+        # Arrange
+        category_id = sample_books[0].category_id
+        etag = test_client.get("/api/v1/books").headers["ETag"]
+        other_page = test_client.get("/api/v1/books", params={"page": 2}).headers["ETag"]
+
+        # Act
+        test_client.post("/api/v1/books", json={
+            "title": "새 도서", "author": "작가", "isbn": "9783333333333",
+            "price": 10000, "category_id": category_id
+        })
+        response = test_client.get("/api/v1/books", headers={"If-None-Match": etag})
+
+        # Assert
+        assert other_page != etag
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_etag_changes_on_delete(self, test_client: TestClient, sample_books):
+        """
+        도서 삭제 시(최대 updated_at은 그대로여도) 개수가 바뀌어 ETag가 달라짐
+        """
+        # Arrange
+        book_id = sample_books[0].id
+        etag = test_client.get("/api/v1/books").headers["ETag"]
+
+        # Act
+        test_client.delete(f"/api/v1/books/{book_id}")
+        response = test_client.get("/api/v1/books", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 200
+
+    def test_cached_count_etag_skips_count(self, test_client: TestClient, db_session: Session, sample_books, capture_statements):
+        """
+        count_strategy=cached는 캐시 적중 시 ETag/total 계산에 COUNT 없이 MAX(updated_at)만 조회
+        """
+        # Arrange
+        first = test_client.get("/api/v1/books", params={"count_strategy": "cached"})
+
+        # Act
+        with capture_statements(db_session, "SELECT") as statements:
+            response = test_client.get("/api/v1/books", params={"count_strategy": "cached"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["ETag"] == first.headers["ETag"]
+        assert response.json()["meta"]["total"] == len(sample_books)
+        assert not [statement for statement in statements if "count(" in statement.sql.lower()]
+
+    def test_estimated_count_has_no_etag(self, test_client: TestClient, sample_books):
+        """
+        count_strategy=estimated는 ETag 계산(COUNT) 생략
+        """
+        # Act
+        response = test_client.get("/api/v1/books", params={"count_strategy": "estimated"})
+
+        # Assert
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+
+class TestCategoryListConditional:
+    """카테고리 목록 조건부 요청 테스트"""
+
+    def test_not_modified_until_changed(self, test_client: TestClient, sample_categories):
+        """
+        같은 ETag면 304, 카테고리가 추가되면 200
+        """
+        # Arrange
+        etag = test_client.get("/api/v1/categories").headers["ETag"]
+
+        # Act
+        not_modified = test_client.get("/api/v1/categories", headers={"If-None-Match": etag})
+        test_client.post("/api/v1/categories", json={"name": "새 카테고리"})
+        modified = test_client.get("/api/v1/categories", headers={"If-None-Match": etag})
+
+        # Assert
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
+        assert modified.headers["ETag"] != etag
@@ -8,10 +8,11 @@ import os
 import sys
 import pytest
 import tempfile
-from typing import Generator, Any
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Generator, Any, List, NamedTuple
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, StaticPool
+from sqlalchemy import create_engine, event, StaticPool
 from sqlalchemy.orm import sessionmaker, Session
 from unittest.mock import Mock
 
@@ -23,12 +24,15 @@ if week05_example_path not in sys.path:
 # 테스트용 환경 변수 설정
 os.environ["TESTING"] = "1"
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ["USE_NGRAM_INDEX"] = "false"  # 앱 엔진 색인 적재 생략 - 테스트는 별도 엔진/색인 사용
 
 # Import from week05 with app namespace
-from main import app
+# (main/라우터는 import하지 않음 - 앱은 test_app 픽스처에서 필요할 때 생성)
 from database import get_db, Base
 from models.book import Book
 from models.category import Category
+from utils.counting import book_count_cache
+from utils.cache import book_cache
 
 
 # 테스트 데이터베이스 설정
@@ -79,8 +83,18 @@ def db_session(test_db_engine) -> Generator[Session, None, None]:
         connection.close()
 
 
+@pytest.fixture(scope="session")
+def test_app() -> FastAPI:
+    """
+    세션 스코프 애플리케이션 픽스처
+    - API 테스트가 처음 필요로 할 때 create_app()으로 한 번 생성
+    """
+    from main import create_app
+    return create_app()
+
+
 @pytest.fixture(scope="function")
-def test_client(db_session: Session) -> Generator[TestClient, None, None]:
+def test_client(test_app: FastAPI, db_session: Session) -> Generator[TestClient, None, None]:
     """
     테스트 클라이언트 픽스처
     - FastAPI 애플리케이션 테스트용 클라이언트
@@ -92,12 +106,50 @@ def test_client(db_session: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
     
-    app.dependency_overrides[get_db] = override_get_db
+    test_app.dependency_overrides[get_db] = override_get_db
     
-    with TestClient(app) as client:
+    with TestClient(test_app) as client:
         yield client
     
-    app.dependency_overrides.clear()
+    test_app.dependency_overrides.clear()
+
+
+class ExecutedStatement(NamedTuple):
+    """capture_statements가 수집한 SQL 문"""
+    sql: str
+    parameters: Any
+
+    @property
+    def kind(self) -> str:
+        return self.sql.split(None, 1)[0].upper()
+
+
+@pytest.fixture
+def capture_statements() -> Callable[..., ContextManager[List[ExecutedStatement]]]:
+    """
+    SQL 문 수집 픽스처
+    - with capture_statements(db, "SELECT", "UPDATE") as statements: 블록 안에서 세션의 엔진이 실행한 문 수집
+    - 종류를 생략하면 SELECT/INSERT/UPDATE/DELETE 모두 (테스트 격리용 SAVEPOINT 등은 제외)
+    - 검색 백엔드 감지용 메타데이터 조회(sqlite_master)는 제외
+    """
+    @contextmanager
+    def capture(db: Session, *kinds: str) -> Generator[List[ExecutedStatement], None, None]:
+        statements: List[ExecutedStatement] = []
+        engine = db.get_bind().engine
+        kinds = kinds or ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            executed = ExecutedStatement(statement.strip(), parameters)
+            if executed.kind in kinds and "sqlite_master" not in statement:
+                statements.append(executed)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return capture
 
 
 # 테스트 데이터 픽스처들
@@ -146,7 +198,8 @@ def sample_book(db_session: Session, sample_category: Category) -> Book:
         price=35000,
         stock_quantity=10,
         published_date=date(2008, 8, 1),
-        category_id=sample_category.id
+        category_id=sample_category.id,
+        category_name=sample_category.name
     )
     
     db_session.add(book)
@@ -168,7 +221,8 @@ def sample_books(db_session: Session, sample_categories: list[Category]) -> list
             price=35000,
             stock_quantity=10,
             published_date=date(2008, 8, 1),
-            category_id=sample_categories[0].id
+            category_id=sample_categories[0].id,
+            category_name=sample_categories[0].name
         ),
         Book(
             title="Python Crash Course",
@@ -177,7 +231,8 @@ def sample_books(db_session: Session, sample_categories: list[Category]) -> list
             price=28000,
             stock_quantity=5,
             published_date=date(2019, 5, 3),
-            category_id=sample_categories[0].id
+            category_id=sample_categories[0].id,
+            category_name=sample_categories[0].name
         ),
         Book(
             title="Database System Concepts",
@@ -186,7 +241,8 @@ def sample_books(db_session: Session, sample_categories: list[Category]) -> list
             price=45000,
             stock_quantity=3,
             published_date=date(2019, 2, 19),
-            category_id=sample_categories[1].id
+            category_id=sample_categories[1].id,
+            category_name=sample_categories[1].name
         ),
     ]
     
@@ -294,6 +350,10 @@ def setup_test_environment():
         os.environ["DATABASE_URL"] = original_db_url
     elif "DATABASE_URL" in os.environ:
         del os.environ["DATABASE_URL"]
+    
+    # 테스트마다 DB가 롤백되므로 프로세스 내부 캐시도 비움
+    book_count_cache.invalidate()
+    book_cache.clear()
 
 
 # 성능 테스트용 픽스처
@@ -314,7 +374,8 @@ def large_dataset(db_session: Session, sample_categories: list[Category]):
             price=random.randint(15000, 50000),
             stock_quantity=random.randint(0, 20),
             published_date=base_date + timedelta(days=i),
-            category_id=sample_categories[i % len(sample_categories)].id
+            category_id=sample_categories[i % len(sample_categories)].id,
+            category_name=sample_categories[i % len(sample_categories)].name
         )
         books.append(book)
     
@@ -0,0 +1,190 @@
+"""
+도서 상세 조회 캐시 테스트
+- LRU/TTL 동작 테스트
+- Redis 호환 백엔드 테스트 (로컬 가짜 클라이언트 사용)
+- 쓰기 경로 무효화 테스트
+- 카테고리명 변경/삭제는 도서 id 조회 없이 카테고리 버전으로 무효화되는지 테스트
+"""
+import os
+import sys
+import fnmatch
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from models.book import Book
+from models.category import Category
+from schemas.category import CategoryUpdate
+from services.book import BookService
+from services.category import CategoryService
+from utils.cache import LRUCache, RedisCache, book_cache, book_cache_key
+
+
+class FakeRedis:
+    """get/set(ex=)/delete/scan_iter만 지원하는 Redis 대역"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        value = self.store.get(key)
+        return value.encode() if value is not None else None
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def scan_iter(self, match="*"):
+        return [key for key in self.store if fnmatch.fnmatch(key, match)]
+
+
+class TestCacheBackends:
+    """캐시 백엔드 테스트"""
+
+    def test_lru_evicts_least_recently_used(self):
+        """
+        최대 개수를 넘으면 가장 오래 사용되지 않은 항목 제거
+        """
+        # Arrange
+        cache = LRUCache(max_entries=2, ttl=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+
+        # Act
+        cache.set("c", "3")
+
+        # Assert
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_lru_expires_entries(self):
+        """
+        TTL이 지난 항목은 miss
+        """
+        # Arrange
+        cache = LRUCache(max_entries=10, ttl=60)
+        cache.set("a", "1", ttl=-1)
+
+        # Act & Assert
+        assert cache.get("a") is None
+
+    def test_redis_backend_with_fake_client(self):
+        """
+        Redis 호환 클라이언트 백엔드 - prefix 적용, bytes 디코딩, clear 범위
+        """
+        # Arrange
+        client = FakeRedis()
+        client.set("other:key", "keep")
+        cache = RedisCache(client, prefix="bookapi:")
+
+        # Act
+        cache.set("book:1", '{"id": 1}')
+        value = cache.get("book:1")
+        cache.clear()
+
+        # Assert
+        assert value == '{"id": 1}'
+        assert cache.get("book:1") is None
+        assert client.store == {"other:key": "keep"}
+
+
+class TestBookDetailCache:
+    """도서 상세 조회 캐시 테스트"""
+
+    def test_second_read_served_from_cache(self, test_client: TestClient, sample_book: Book):
+        """
+        두 번째 상세 조회는 DB 조회 없이 캐시에서 응답
+        """
+        # Arrange
+        url = f"/api/v1/books/{sample_book.id}"
+        first = test_client.get(url)
+
+        # Act
+        with patch.object(BookService, "get_book_by_id") as mock_get:
+            second = test_client.get(url)
+
+        # Assert
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        mock_get.assert_not_called()
+
+    @pytest.mark.parametrize("method, path, body", [
+        ("patch", "", {"price": 99000}),
+        ("patch", "/stock", {"quantity": 1, "operation": "add"}),
+        ("delete", "", None),
+    ])
+    def test_write_invalidates_cache(self, test_client: TestClient, sample_book: Book, method, path, body):
+        """
+        수정/재고 변경/삭제 시 캐시 무효화
+        """
+        # Arrange
+        url = f"/api/v1/books/{sample_book.id}"
+        test_client.get(url)
+        assert book_cache.get(book_cache_key(sample_book.id)) is not None
+
+        # Act
+        kwargs = {"json": body} if body is not None else {}
+        getattr(test_client, method)(url + path, **kwargs)
+
+        # Assert
+        assert book_cache.get(book_cache_key(sample_book.id)) is None
+
+    def test_category_rename_invalidates_cache(self, db_session: Session, sample_book: Book, sample_category: Category):
+        """
+        카테고리명 변경 시 해당 카테고리 도서의 캐시 무효화
+        """
+        # Arrange
+        cached = BookService.get_book_response(db_session, sample_book.id)
+        assert cached.category_name == sample_category.name
+
+        # Act
+        CategoryService.update_category(db_session, sample_category.id, CategoryUpdate(name="소프트웨어 공학"))
+        refreshed = BookService.get_book_response(db_session, sample_book.id)
+
+        # Assert
+        assert refreshed.category_name == "소프트웨어 공학"
+
+    def test_category_rename_skips_book_ids(self, db_session: Session, sample_books, capture_statements):
+        """
+        카테고리명 변경 시 소속 도서 id를 조회하지 않음 (도서 UPDATE 한 번 + 카테고리 버전 변경)
+        """
+        # Arrange
+        book = sample_books[0]
+        BookService.get_book_response(db_session, book.id)
+
+        # Act
+        with capture_statements(db_session, "SELECT") as statements:
+            CategoryService.update_category(db_session, book.category_id, CategoryUpdate(name="이름 변경"))
+
+        # Assert
+        assert not [statement for statement in statements if "FROM books" in statement.sql]
+        assert BookService.get_book_updated_at(db_session, book.id) == (
+            db_session.query(Book.updated_at).filter(Book.id == book.id).scalar()
+        )
+        assert BookService.get_book_response(db_session, book.id).category_name == "이름 변경"
+
+    def test_category_delete_invalidates_cache(self, db_session: Session, sample_book: Book, sample_category: Category):
+        """
+        카테고리 삭제 시 소속 도서의 캐시된 카테고리가 남지 않음
+        """
+        # Arrange
+        BookService.get_book_response(db_session, sample_book.id)
+
+        # Act
+        result = CategoryService.delete_category(db_session, sample_category.id)
+        refreshed = BookService.get_book_response(db_session, sample_book.id)
+
+        # Assert
+        assert result["detached_books"] == 1
+        assert (refreshed.category_id, refreshed.category_name) == (None, None)
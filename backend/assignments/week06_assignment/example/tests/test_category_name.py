@@ -0,0 +1,81 @@
+"""
+비정규화 카테고리명 테스트
+- 도서 생성/카테고리 변경 시 category_name 저장 테스트
+- 카테고리명 변경 시 UPDATE 한 번으로 도서에 반영되는지 테스트
+- 도서 조회 시 JOIN/추가 쿼리가 없는지 테스트
+"""
+import os
+import sys
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from models.book import Book
+from schemas.book import BookCreate, BookUpdate, BookSearchParams
+from schemas.category import CategoryUpdate
+from services.book import BookService
+from services.category import CategoryService
+
+
+class TestCategoryNameDenormalization:
+    """비정규화 카테고리명 테스트"""
+
+    def test_create_and_move_book(self, db_session: Session, sample_categories):
+        """
+        도서 생성/카테고리 변경 시 category_name 컬럼 갱신
+        """
+        # Arrange
+        first, second = sample_categories[0], sample_categories[1]
+
+        # Act
+        created = BookService.create_book(db_session, BookCreate(
+            title="비정규화", author="테스트", isbn="9782222222222", price=1000, category_id=first.id
+        ))
+        moved = BookService.update_book(db_session, created.id, BookUpdate(category_id=second.id))
+
+        # Assert
+        assert created.category_name == first.name
+        assert moved.category_name == second.name
+        stored = db_session.query(Book.category_name).filter(Book.id == created.id).scalar()
+        assert stored == second.name
+
+    def test_rename_fans_out_with_single_update(self, db_session: Session, sample_books, sample_categories, capture_statements):
+        """
+        카테고리명 변경 시 소속 도서 수와 무관하게 도서 UPDATE는 한 번
+        """
+        # Arrange
+        category = sample_categories[0]
+        category_id = category.id
+        book_ids = [book.id for book in sample_books if book.category_id == category_id]
+
+        # Act
+        with capture_statements(db_session, "SELECT", "UPDATE") as statements:
+            CategoryService.update_category(db_session, category_id, CategoryUpdate(name="프로그래밍 언어"))
+
+        # Assert
+        book_updates = [s for s in statements if s.sql.upper().startswith("UPDATE BOOKS")]
+        assert len(book_updates) == 1
+        names = db_session.query(Book.category_name).filter(Book.id.in_(book_ids)).all()
+        assert len(book_ids) > 1
+        assert {name for name, in names} == {"프로그래밍 언어"}
+
+    def test_reads_need_no_join(self, db_session: Session, sample_books, capture_statements):
+        """
+        목록/상세 조회 시 categories 테이블을 읽지 않음
+        """
+        # Arrange
+        book_id = sample_books[0].id
+        expected = sample_books[0].category_name
+
+        # Act
+        with capture_statements(db_session, "SELECT", "UPDATE") as statements:
+            books, _, _, _ = BookService.get_all_books(db_session, BookSearchParams())
+            book = BookService.get_book_by_id(db_session, book_id)
+
+        # Assert
+        assert book.category_name == expected
+        assert all(b.category_name for b in books)
+        assert not any("categories" in statement.sql for statement in statements)
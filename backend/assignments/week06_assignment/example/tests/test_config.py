@@ -0,0 +1,168 @@
+"""
+설정 및 연결 풀 테스트
+- 환경별 프로필과 환경 변수 우선순위 테스트
+- 엔진 인자 생성 테스트
+- 연결 풀 지표(체크아웃 대기 시간, 타임아웃) 테스트
+"""
+import os
+import sys
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from config import PROFILES, Settings, load_settings
+from utils.pool_metrics import MeteredQueuePool, pool_status
+
+MYSQL_URL = "mysql+pymysql://user:password@db:3306/book_management"
+
+
+class TestSettings:
+    """설정 프로필 테스트"""
+
+    def test_production_profile(self, monkeypatch):
+        """
+        운영 프로필은 SQL 로그를 끄고 풀 크기/재연결 주기 적용
+        """
+        # Arrange
+        monkeypatch.delenv("APP_ENV", raising=False)
+        monkeypatch.delenv("DB_POOL_SIZE", raising=False)
+
+        # Act
+        settings = load_settings("production")
+
+        # Assert
+        assert settings.app_env == "production"
+        assert settings.db_sql_log_level == "off"
+        assert settings.db_pool_size == PROFILES["production"]["db_pool_size"]
+        assert settings.db_pool_recycle == PROFILES["production"]["db_pool_recycle"]
+
+    def test_env_overrides_profile(self, monkeypatch):
+        """
+        환경 변수가 프로필 기본값보다 우선
+        """
+        # Arrange
+        monkeypatch.delenv("APP_ENV", raising=False)
+        monkeypatch.setenv("DB_POOL_SIZE", "3")
+        monkeypatch.setenv("DB_SQL_LOG_LEVEL", "DEBUG")
+
+        # Act
+        settings = load_settings("production")
+
+        # Assert
+        assert settings.db_pool_size == 3
+        assert settings.db_sql_log_level == "debug"
+        assert settings.db_max_overflow == PROFILES["production"]["db_max_overflow"]
+
+    def test_init_arguments_override_env(self, monkeypatch):
+        """
+        Settings(...)에 직접 넘긴 값은 환경 변수보다 우선 (create_app(Settings(...)))
+        """
+        # Arrange
+        monkeypatch.setenv("DB_POOL_SIZE", "7")
+
+        # Act
+        settings = Settings(db_pool_size=3)
+
+        # Assert
+        assert settings.db_pool_size == 3
+        assert Settings().db_pool_size == 7
+
+    @pytest.mark.parametrize("name, value", [
+        ("DB_POOL_SIZE", "0"),
+        ("DB_POOL_TIMEOUT", "-1"),
+        ("DB_SQL_LOG_LEVEL", "verbose"),
+        ("BOOK_SYNC_PAGE_SIZE", "0"),
+        ("BOOK_SYNC_OVERLAP_SECONDS", "-1"),
+        ("BOOK_SYNC_PAGE_SIZE", "many"),
+        ("BOOK_EXPORT_BATCH_SIZE", "0"),
+        ("STOCK_UPDATE_MODE", "fast"),
+        ("BOOK_IMPORT_CHUNK_SIZE", "0"),
+        ("CATEGORY_DELETE_BATCH_SIZE", "0"),
+    ])
+    def test_invalid_values_rejected(self, monkeypatch, name, value):
+        """
+        잘못된 설정값은 시작 시점에 검증 오류
+        """
+        # Arrange
+        monkeypatch.delenv("APP_ENV", raising=False)
+        monkeypatch.setenv(name, value)
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            load_settings("test")
+
+    def test_unknown_profile_rejected(self):
+        """
+        알 수 없는 APP_ENV는 ValueError
+        """
+        # Act & Assert
+        with pytest.raises(ValueError):
+            load_settings("staging")
+
+    def test_engine_options(self, monkeypatch):
+        """
+        SQLite 외에는 풀 크기/대기 시간/재연결 주기 인자 포함
+        """
+        # Arrange
+        monkeypatch.delenv("APP_ENV", raising=False)
+        settings = load_settings("production")
+
+        # Act
+        mysql_options = settings.engine_options(MYSQL_URL)
+        sqlite_options = settings.engine_options("sqlite:///:memory:")
+
+        # Assert
+        assert mysql_options["echo"] is False
+        assert mysql_options["pool_size"] == settings.db_pool_size
+        assert mysql_options["pool_timeout"] == settings.db_pool_timeout
+        assert "pool_size" not in sqlite_options
+        assert sqlite_options["pool_pre_ping"] is True
+
+
+class TestPoolMetrics:
+    """연결 풀 지표 테스트"""
+
+    def test_checkout_and_timeout_recorded(self, tmp_path):
+        """
+        체크아웃 수/사용 중 연결 수와 풀 고갈 시 타임아웃 기록
+        """
+        # Arrange
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=MeteredQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05,
+        )
+        held = engine.connect()
+
+        # Act
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        status = pool_status(engine)
+        held.close()
+
+        # Assert
+        assert status["pool_class"] == "MeteredQueuePool"
+        assert status["checked_out"] == 1
+        assert status["checkouts"] == 1
+        assert status["timeouts"] == 1
+        assert status["wait_ms_max"] >= 50
+        engine.dispose()
+
+    def test_pool_endpoint(self, test_client: TestClient):
+        """
+        풀 지표 엔드포인트 응답 형식
+        """
+        # Act
+        response = test_client.get("/health/pool")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["sync"]["pool_class"]
+        assert "pool_size" in data["config"]
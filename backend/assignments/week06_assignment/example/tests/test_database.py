@@ -0,0 +1,131 @@
+"""
+데이터베이스 설정 테스트
+- 비동기 드라이버 URL 변환 테스트
+- 동기/비동기 세션 실행 경로 테스트
+- 서버 측 커서 스트리밍 테스트
+"""
+import os
+import sys
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from database import to_async_url, run_in_session, stream_in_session
+from models.category import Category
+
+
+class TestAsyncDatabaseUrl:
+    """비동기 드라이버 URL 변환 테스트"""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("mysql+pymysql://root:pw@localhost:3306/db", "mysql+aiomysql://root:pw@localhost:3306/db"),
+        ("sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+        ("postgresql://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("mysql+aiomysql://root:pw@localhost/db", "mysql+aiomysql://root:pw@localhost/db"),
+    ])
+    def test_to_async_url(self, url, expected):
+        """동기 드라이버 URL이 대응하는 비동기 드라이버로 변환되는지 확인"""
+        # Act & Assert
+        assert to_async_url(url) == expected
+
+
+class TestRunInSession:
+    """서비스 실행 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_run_in_session_with_sync_session(self, db_session: Session, sample_category: Category):
+        """
+        동기 세션은 스레드풀에서 실행
+        - 서비스 함수와 동일한 (db, *args) 시그니처로 호출되는지 확인
+        """
+        # Arrange
+        def load_name(db: Session, category_id: int) -> str:
+            return db.get(Category, category_id).name
+
+        # Act
+        name = await run_in_session(db_session, load_name, sample_category.id)
+
+        # Assert
+        assert name == sample_category.name
+
+    @pytest.mark.asyncio
+    async def test_run_in_session_with_async_session(self):
+        """
+        AsyncSession은 run_sync로 실행
+        - aiosqlite 드라이버 위에서 동기 서비스 로직이 그대로 동작하는지 확인
+        """
+        pytest.importorskip("aiosqlite")
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from database import Base
+
+        # Arrange
+        async_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        def create_and_count(db: Session, name: str) -> int:
+            db.add(Category(name=name))
+            db.commit()
+            return db.query(Category).count()
+
+        # Act
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            count = await run_in_session(session, create_and_count, "비동기")
+        await async_engine.dispose()
+
+        # Assert
+        assert count == 1
+
+
+class TestStreamInSession:
+    """서버 측 커서 스트리밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_in_batches_with_sync_session(self, db_session: Session, sample_categories):
+        """
+        동기 세션은 batch_size개씩 나눠 ORM 객체를 전달
+        """
+        # Arrange
+        ids = [category.id for category in sample_categories]
+        statement = select(Category).where(Category.id.in_(ids)).order_by(Category.id)
+
+        # Act
+        batches = [batch async for batch in stream_in_session(db_session, statement, 2)]
+
+        # Assert
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert [category.name for batch in batches for category in batch] == [
+            category.name for category in sample_categories
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream_in_batches_with_async_session(self):
+        """
+        AsyncSession은 stream()으로 나눠 전달
+        """
+        pytest.importorskip("aiosqlite")
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from database import Base
+
+        # Arrange
+        async_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        # Act
+        async with AsyncSession(async_engine) as session:
+            session.add_all([Category(name=f"카테고리{i}") for i in range(5)])
+            await session.commit()
+            batches = [
+                [category.name for category in batch]
+                async for batch in stream_in_session(session, select(Category).order_by(Category.id), 2)
+            ]
+        await async_engine.dispose()
+
+        # Assert
+        assert [len(batch) for batch in batches] == [2, 2, 1]
@@ -0,0 +1,186 @@
+"""
+빠른 JSON 응답 테스트
+- 빠른 경로(orjson, 재검증 생략)와 기본 경로의 응답 본문/헤더가 같은지 테스트
+- 쓰기/카테고리 엔드포인트도 빠른 경로를 타고 상태 코드가 유지되는지 테스트
+- orjson 없이 설정을 켜면 시작 시 오류인지 테스트
+- create_app에 넘긴 설정의 값을 앱마다 따르는지 테스트
+- GET /api/v1/books?size=100 요청당 CPU 시간 비교 벤치마크
+"""
+import os
+import sys
+import time
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+import config
+from config import settings
+from database import get_db
+from main import create_app
+from utils.responses import FastJSONResponse
+
+pytest.importorskip("orjson")
+
+
+@pytest.fixture
+def fast_json(test_client: TestClient, monkeypatch):
+    """테스트 앱의 빠른 JSON 응답 경로 켜기"""
+    monkeypatch.setattr(test_client.app.state.settings, "fast_json_response", True)
+
+
+def get_both(test_client: TestClient, monkeypatch, url: str, **kwargs):
+    """같은 요청을 기본 경로와 빠른 경로로 각각 보냄"""
+    app_settings = test_client.app.state.settings
+    monkeypatch.setattr(app_settings, "fast_json_response", False)
+    default = test_client.get(url, **kwargs)
+    monkeypatch.setattr(app_settings, "fast_json_response", True)
+    fast = test_client.get(url, **kwargs)
+    return default, fast
+
+
+class TestFastJSONResponse:
+    """빠른 JSON 응답 경로 테스트"""
+
+    def test_book_list_same_body_and_headers(self, test_client: TestClient, sample_books, monkeypatch):
+        """
+        목록 응답 본문과 ETag가 기본 경로와 같음
+        """
+        # Act
+        default, fast = get_both(test_client, monkeypatch, "/api/v1/books", params={"size": 100})
+
+        # Assert
+        assert fast.status_code == default.status_code == 200
+        assert fast.json() == default.json()
+        assert fast.headers["ETag"] == default.headers["ETag"]
+        assert fast.headers["content-type"] == "application/json"
+
+    def test_book_detail_same_body_and_headers(self, test_client: TestClient, sample_book, monkeypatch):
+        """
+        상세 응답 본문과 Last-Modified가 기본 경로와 같음
+        """
+        # Act
+        default, fast = get_both(test_client, monkeypatch, f"/api/v1/books/{sample_book.id}")
+
+        # Assert
+        assert fast.json() == default.json()
+        assert fast.headers["Last-Modified"] == default.headers["Last-Modified"]
+
+    def test_category_list_same_body_and_headers(self, test_client: TestClient, sample_categories, monkeypatch):
+        """
+        카테고리 목록 응답 본문과 ETag가 기본 경로와 같음
+        """
+        # Act
+        default, fast = get_both(test_client, monkeypatch, "/api/v1/categories")
+
+        # Assert
+        assert fast.json() == default.json()
+        assert fast.headers["ETag"] == default.headers["ETag"]
+
+    def test_write_endpoints_use_fast_path(self, test_client: TestClient, sample_category, fast_json, monkeypatch):
+        """
+        생성(201)/재고 변경/일괄 변경/대량 등록/삭제 응답도 orjson으로 직렬화, 상태 코드는 라우트 선언대로
+        """
+        # Arrange
+        rendered = []
+        render = FastJSONResponse.render
+        monkeypatch.setattr(FastJSONResponse, "render", lambda self, content: rendered.append(content) or render(self, content))
+        book = {"title": "빠른 응답", "author": "테스트", "isbn": "9784444444444", "price": 10000, "category_id": sample_category.id}
+
+        # Act
+        created = test_client.post("/api/v1/books", json=book)
+        book_id = created.json()["data"]["id"]
+        stock = test_client.patch(f"/api/v1/books/{book_id}/stock", json={"quantity": 2, "operation": "add"})
+        batch = test_client.patch("/api/v1/books/stock:batch", json={"items": [
+            {"book_id": book_id, "quantity": 1, "operation": "subtract"}
+        ]})
+        imported = test_client.post("/api/v1/books/bulk", json=[dict(book, isbn="9784444444445")])
+        category = test_client.post("/api/v1/categories", json={"name": "빠른 응답"})
+        deleted = test_client.delete(f"/api/v1/books/{book_id}")
+
+        # Assert
+        assert [r.status_code for r in (created, stock, batch, imported, category, deleted)] == [201, 200, 200, 200, 201, 200]
+        assert created.json()["data"]["category_name"] == sample_category.name
+        assert stock.json()["data"]["stock_quantity"] == 2
+        assert batch.json()["data"][0]["stock_quantity"] == 1
+        assert imported.json()["data"]["success_count"] == 1
+        assert len(rendered) == 6
+
+    def test_errors_unchanged(self, test_client: TestClient, fast_json):
+        """
+        빠른 경로에서도 오류 응답 형식은 그대로
+        """
+        # Act
+        response = test_client.get("/api/v1/books/99999")
+
+        # Assert
+        assert response.status_code == 404
+        assert response.json()["status"] == "error"
+
+    def test_follows_app_settings(self, db_session: Session, sample_book, monkeypatch):
+        """
+        프로세스 설정이 꺼져 있어도 create_app에 넘긴 설정이 켜져 있으면 빠른 경로
+        """
+        # Arrange
+        rendered = []
+        render = FastJSONResponse.render
+        monkeypatch.setattr(settings, "fast_json_response", False)
+        monkeypatch.setattr(FastJSONResponse, "render", lambda self, content: rendered.append(content) or render(self, content))
+        app = create_app(settings.copy(update={"fast_json_response": True}))
+        app.dependency_overrides[get_db] = lambda: db_session
+
+        # Act
+        with TestClient(app) as client:
+            response = client.get(f"/api/v1/books/{sample_book.id}")
+
+        # Assert
+        assert response.status_code == 200
+        assert len(rendered) == 1
+
+    def test_requires_orjson(self, monkeypatch):
+        """
+        orjson이 없으면 FAST_JSON_RESPONSE=true 설정은 시작 시 오류
+        """
+        # Arrange
+        monkeypatch.setenv("FAST_JSON_RESPONSE", "true")
+        monkeypatch.setattr(config, "find_spec", lambda name: None)
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            config.load_settings("test")
+
+
+@pytest.mark.slow
+class TestFastJSONBenchmark:
+    """빠른 JSON 응답 벤치마크"""
+
+    def test_book_list_cpu_per_request(self, test_client: TestClient, large_dataset, monkeypatch):
+        """
+        GET /api/v1/books?size=100 100회 - 기본 경로와 요청당 CPU 시간 비교
+        (시간은 출력만 하고, 실행 환경에 따라 흔들리지 않도록 두 경로의 응답이 같은지만 확인)
+        """
+        # Arrange
+        iterations = 100
+        params = {"size": 100}
+        elapsed = {}
+        bodies = {}
+
+        # Act
+        for name, enabled in (("기본", False), ("빠른 경로", True)):
+            monkeypatch.setattr(test_client.app.state.settings, "fast_json_response", enabled)
+            bodies[name] = test_client.get("/api/v1/books", params=params).json()  # 캐시/색인 준비
+            started = time.process_time()
+            for _ in range(iterations):
+                test_client.get("/api/v1/books", params=params)
+            elapsed[name] = (time.process_time() - started) * 1000 / iterations
+
+        print("".join(f"\n{name}: {value:.2f}ms CPU/요청" for name, value in elapsed.items()))
+
+        # Assert
+        assert bodies["빠른 경로"] == bodies["기본"]
+        assert len(bodies["기본"]["data"]) == params["size"]
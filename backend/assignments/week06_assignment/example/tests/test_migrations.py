@@ -0,0 +1,101 @@
+"""
+스키마 마이그레이션(Alembic) 테스트
+- 빈 DB에 upgrade head 후 모델 메타데이터와 차이가 없는지 테스트
+- downgrade base로 모든 테이블이 제거되는지 테스트
+- 앱 시작 시 DDL을 실행하지 않는지 테스트
+"""
+import os
+import sys
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from database import Base
+from main import create_app
+from services.search import is_search_schema_object
+
+pytest.importorskip("alembic")
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+
+ALEMBIC_INI = os.path.join(week05_example_path, "alembic.ini")
+
+
+@pytest.fixture
+def migration_db(tmp_path):
+    """빈 SQLite 파일 DB를 대상으로 하는 Alembic 설정"""
+    url = f"sqlite:///{tmp_path / 'migrations.db'}"
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False  # pytest 로그 설정 유지
+    engine = create_engine(url)
+    yield config, engine
+    engine.dispose()
+
+
+class TestMigrations:
+    """마이그레이션 테스트"""
+
+    def test_upgrade_matches_models(self, migration_db):
+        """
+        upgrade head 결과가 모델(테이블, 컬럼 타입, 인덱스)과 같고 전문 검색 테이블도 생성
+        """
+        # Arrange
+        config, engine = migration_db
+
+        # Act
+        command.upgrade(config, "head")
+
+        # Assert
+        with engine.connect() as connection:
+            context = MigrationContext.configure(connection, opts={
+                "compare_type": True,
+                "include_name": lambda name, type_, parent_names: name is None or not is_search_schema_object(name),
+            })
+            assert compare_metadata(context, Base.metadata) == []
+            if connection.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar():
+                assert "books_fts" in inspect(connection).get_table_names()
+
+    def test_downgrade_to_base(self, migration_db):
+        """
+        downgrade base 후에는 버전 테이블만 남음
+        """
+        # Arrange
+        config, engine = migration_db
+        command.upgrade(config, "head")
+
+        # Act
+        command.downgrade(config, "base")
+
+        # Assert
+        assert inspect(engine).get_table_names() == ["alembic_version"]
+
+    def test_app_startup_runs_no_ddl(self):
+        """
+        앱 생성/시작(lifespan)/요청 처리 중 DDL(CREATE/ALTER/DROP) 실행 없음
+        """
+        # Arrange
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(("CREATE", "ALTER", "DROP")):
+                statements.append(statement)
+
+        # Act
+        event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            with TestClient(create_app()) as client:
+                client.get("/health")
+        finally:
+            event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+        # Assert
+        assert statements == []
@@ -0,0 +1,119 @@
+"""
+n-gram 메모리 색인 테스트
+- 색인 적재 및 후보 id 계산 테스트
+- 증분 갱신(추가/삭제) 테스트
+- get_all_books 연동 테스트
+"""
+import os
+import sys
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from database import Base
+from models.book import Book
+from schemas.book import BookCreate, BookSearchParams
+from services import book as book_service_module
+from services.book import BookService
+from utils.ngram_index import NgramIndex
+
+
+@pytest.fixture
+def indexed_session(monkeypatch) -> Session:
+    """
+    n-gram 색인이 적재된 독립 DB 세션
+    - 전역 색인 대신 테스트용 색인을 BookService에 주입
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    session.add_all([
+        Book(title="파이썬 기초", author="홍길동", isbn="9780000000001", price=10000),
+        Book(title="자바스크립트 입문", author="김철수", isbn="9780000000002", price=20000),
+        Book(title="Clean Code", author="Robert C. Martin", isbn="9780000000003", price=30000),
+    ])
+    session.commit()
+
+    index = NgramIndex()
+    index.load(engine)
+    monkeypatch.setattr(book_service_module, "book_ngram_index", index)
+
+    yield session, index
+
+    session.close()
+    engine.dispose()
+
+
+class TestNgramIndex:
+    """n-gram 색인 테스트"""
+
+    def test_candidates_partial_syllable_match(self, indexed_session):
+        """
+        음절 단위 부분 일치 검색어의 후보 id 계산
+        """
+        # Arrange
+        session, index = indexed_session
+
+        # Act & Assert
+        assert index.candidates(session, "썬 기") == [1]
+        assert index.candidates(session, "스크립") == [2]
+        assert index.candidates(session, "clean") == [3]
+        assert index.candidates(session, "철수") == [2]
+        assert index.candidates(session, "없는책") == []
+
+    def test_candidates_not_usable(self, indexed_session, db_session: Session):
+        """
+        1글자 검색어나 다른 DB에 연결된 세션은 색인을 사용하지 않음
+        """
+        # Arrange
+        session, index = indexed_session
+
+        # Act & Assert
+        assert index.candidates(session, "파") is None
+        assert index.candidates(db_session, "파이썬") is None
+
+    def test_incremental_add_and_remove(self, indexed_session):
+        """
+        도서 추가/삭제 시 색인이 증분 갱신되는지 테스트
+        """
+        # Arrange
+        session, index = indexed_session
+
+        # Act
+        index.add(10, "파이썬 심화", "이영희")
+        added = index.candidates(session, "파이썬")
+        index.remove(1, "파이썬 기초", "홍길동")
+        removed = index.candidates(session, "파이썬")
+
+        # Assert
+        assert added == [1, 10]
+        assert removed == [10]
+
+    def test_get_all_books_uses_candidates(self, indexed_session):
+        """
+        get_all_books가 색인 후보와 BookService 쓰기 경로를 함께 사용하는지 테스트
+        """
+        # Arrange
+        session, index = indexed_session
+        BookService.create_book(session, BookCreate(
+            title="파이썬 심화", author="이영희", isbn="9780000000004", price=40000
+        ))
+
+        # Act
+        books, total, _, _ = BookService.get_all_books(session, BookSearchParams(search="파이썬"))
+
+        # Assert
+        assert [book.title for book in books] == ["파이썬 기초", "파이썬 심화"]
+        assert total == 2
+        assert index.candidates(session, "이영희") == [4]
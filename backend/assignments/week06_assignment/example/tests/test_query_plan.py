@@ -0,0 +1,151 @@
+"""
+도서 목록 실행 계획 회귀 테스트
+- 필터 조합별 목록 버전(COUNT/MAX) 조회가 커버링 인덱스만 읽는지 테스트
+- 목록 페이지 조회가 필터/정렬에 맞는 복합 인덱스를 쓰는지 테스트 (SQLite, MySQL)
+- 인덱스 권장(recommend_index)이 실제 실행 계획과 같은 인덱스를 고르는지 테스트
+"""
+import os
+import sys
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from database import Base
+from models.book import Book
+from models.category import Category
+from schemas.book import BookSearchParams
+from services.book import BookService
+from utils.query_plan import explain, recommend_index
+
+# (필터, 목록 버전 조회 인덱스, 목록 페이지 조회 인덱스)
+LISTING_PLANS = [
+    ({"category_id": 1}, "ix_books_category_price_cover", "ix_books_category_id"),
+    ({"category_id": 1, "min_price": 10000, "max_price": 20000}, "ix_books_category_price_cover", "ix_books_category_price_cover"),
+    ({"min_price": 10000, "max_price": 20000}, "ix_books_price_cover", "ix_books_price_cover"),
+    ({"category_id": 1, "sort": "price"}, "ix_books_category_price_cover", "ix_books_category_price_cover"),
+    ({"category_id": 1, "sort": "published_date"}, "ix_books_category_price_cover", "ix_books_category_published_date_id"),
+]
+
+
+def listing_plans(capture_statements, db: Session, filters: dict):
+    """목록 버전 조회와 목록 페이지 조회의 실행 계획 (capture_statements는 같은 이름의 픽스처)"""
+    params = BookSearchParams(**filters)
+    with capture_statements(db, "SELECT") as statements:
+        BookService.get_books_version(db, params)
+        BookService.get_all_books(db, params, known_total=0)
+    (version_sql, version_parameters), (page_sql, page_parameters) = [
+        statement for statement in statements if "FROM books" in statement.sql
+    ]
+    connection = db.connection()
+    return explain(connection, version_sql, version_parameters), explain(connection, page_sql, page_parameters)
+
+
+def advise(filters: dict, version: bool = False):
+    """
+    목록 필터 조합 -> 권장 인덱스 이름
+    - version: 목록 버전 조회 (정렬 없이 count(id), max(updated_at)만 읽음)
+    """
+    params = BookSearchParams(**filters)
+    equality = ["category_id"] if params.category_id is not None else []
+    range_column = "price" if params.min_price is not None or params.max_price is not None else None
+    if version:
+        order_by, columns = [], equality + ["price", "id", "updated_at"]
+    else:
+        order_by, columns = [key.name for key, _ in BookService._sort_keys(params.sort or "id")], []
+    index = recommend_index(Book.__table__, equality, range_column, order_by, columns)
+    return index.name if index is not None else None
+
+
+def assert_listing_plans(version_plan, page_plan, filters: dict, version_index: str, page_index: str):
+    assert version_plan.indexes == {version_index}, version_plan
+    assert version_plan.covering, version_plan
+    assert not version_plan.full_scan, version_plan
+    assert page_index in page_plan.indexes, page_plan
+    assert not page_plan.full_scan, page_plan
+    if "sort" in filters:
+        assert not page_plan.temp_sort, page_plan
+
+
+class TestListingQueryPlan:
+    """SQLite 목록 조회 실행 계획 테스트"""
+
+    @pytest.mark.parametrize("filters, version_index, page_index", LISTING_PLANS)
+    def test_listing_uses_composite_indexes(self, db_session: Session, capture_statements, filters, version_index, page_index):
+        """
+        목록 버전 조회는 커버링 인덱스만, 목록 페이지는 필터/정렬용 복합 인덱스 사용 (전체 스캔 없음)
+        """
+        # Act
+        version_plan, page_plan = listing_plans(capture_statements, db_session, filters)
+
+        # Assert
+        assert_listing_plans(version_plan, page_plan, filters, version_index, page_index)
+
+    @pytest.mark.parametrize("filters, version_index, page_index", LISTING_PLANS)
+    def test_advisor_matches_plan(self, filters, version_index, page_index):
+        """
+        권장 인덱스가 실행 계획에서 쓰는 인덱스와 같음
+        """
+        # Act & Assert
+        assert advise(filters, version=True) == version_index
+        assert advise(filters) == page_index
+
+    def test_advisor_without_usable_index(self):
+        """
+        인덱스가 없는 정렬 키만 있으면 None (새 인덱스가 필요한 조합)
+        """
+        # Act
+        index = recommend_index(Book.__table__, order_by=["stock_quantity", "id"])
+
+        # Assert
+        assert index is None
+
+
+@pytest.fixture(scope="module")
+def mysql_session():
+    """BENCHMARK_DATABASE_URL(MySQL)에 목록 조회용 데이터 준비"""
+    url = os.getenv("BENCHMARK_DATABASE_URL")
+    if not url or not url.startswith("mysql"):
+        pytest.skip("BENCHMARK_DATABASE_URL(MySQL)이 설정되지 않음")
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(Category.__table__.insert(), [{"name": f"카테고리{index}"} for index in range(1, 21)])
+        connection.execute(Book.__table__.insert(), [
+            {
+                "title": f"도서{index}", "author": f"저자{index % 50}", "isbn": f"978{index:010d}",
+                "price": 1000 + index * 37 % 50000, "category_id": index % 20 + 1
+            }
+            for index in range(5000)
+        ])
+        # 옵티마이저가 실제 선택도로 판단하도록 통계 갱신
+        connection.execute(text("ANALYZE TABLE books"))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.mark.external
+class TestListingQueryPlanMySQL:
+    """
+    MySQL 목록 조회 실행 계획 테스트
+    - BENCHMARK_DATABASE_URL이 MySQL일 때만 실행
+    """
+
+    @pytest.mark.parametrize("filters, version_index, page_index", LISTING_PLANS)
+    def test_listing_uses_composite_indexes(self, mysql_session: Session, capture_statements, filters, version_index, page_index):
+        """
+        SQLite와 같은 인덱스 사용 (버전 조회는 커버링, 전체 스캔 없음)
+        """
+        # Act
+        version_plan, page_plan = listing_plans(capture_statements, mysql_session, filters)
+
+        # Assert
+        assert_listing_plans(version_plan, page_plan, filters, version_index, page_index)
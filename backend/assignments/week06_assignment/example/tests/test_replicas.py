@@ -0,0 +1,242 @@
+"""
+읽기 복제본 라우팅 테스트
+- 여러 SQLite 파일을 primary/복제본으로 사용
+- 조회는 복제본, 쓰기와 쓰기 이후 조회는 primary로 가는지 테스트
+- round_robin / least_connections 선택 테스트
+- 상세 캐시는 primary에서 읽은 값으로만 채우는지 테스트
+- 비동기 모드 복제본(AsyncEngine) 조회와 종료 시 정리 테스트
+"""
+import os
+import sys
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from starlette.requests import Request
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+import database
+from database import Base, RoutingSession, READ_PRIMARY_COOKIE, get_read_db
+from models.book import Book
+from schemas.category import CategoryCreate
+from services.book import BookService
+from services.category import CategoryService
+from utils.cache import book_cache, book_cache_key, set_book_entry
+from utils.replicas import ReplicaPool, REPLICA_LEAST_CONNECTIONS
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """
+    primary 1개 + 복제본 2개 (각각 다른 도서를 넣어 어느 DB에서 읽었는지 구분)
+    """
+    created = {}
+    for name in ("primary", "replica1", "replica2"):
+        engine = create_engine(f"sqlite:///{tmp_path / (name + '.db')}")
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(Book.__table__.insert(), [{
+                "title": name, "author": "테스트", "isbn": "9780000000001", "price": 1000,
+            }])
+        created[name] = engine
+    yield created
+    for engine in created.values():
+        engine.dispose()
+
+
+def make_request(cookies: str = "") -> Request:
+    headers = [(b"cookie", cookies.encode())] if cookies else []
+    return Request({"type": "http", "headers": headers})
+
+
+class TestRoutingSession:
+    """라우팅 세션 테스트"""
+
+    def test_reads_round_robin_over_replicas(self, engines):
+        """
+        조회 전용 세션은 복제본을 번갈아 사용
+        """
+        # Arrange
+        replicas = ReplicaPool([engines["replica1"], engines["replica2"]])
+
+        # Act
+        titles = []
+        for _ in range(4):
+            with RoutingSession(bind=engines["primary"], replicas=replicas) as db:
+                titles.append(BookService.get_book_by_id(db, 1).title)
+
+        # Assert
+        assert titles == ["replica1", "replica2", "replica1", "replica2"]
+
+    def test_writes_go_to_primary_and_stick(self, engines):
+        """
+        쓰기는 primary로, 같은 세션의 이후 조회도 primary (read-your-writes)
+        """
+        # Arrange
+        replicas = ReplicaPool([engines["replica1"], engines["replica2"]])
+
+        # Act
+        with RoutingSession(bind=engines["primary"], replicas=replicas) as db:
+            category = CategoryService.create_category(db, CategoryCreate(name="복제본"))
+            title = BookService.get_book_by_id(db, 1).title
+
+        # Assert
+        assert category.id is not None
+        assert title == "primary"
+        with engines["primary"].connect() as connection:
+            assert connection.exec_driver_sql("SELECT name FROM categories").scalar() == "복제본"
+        with engines["replica1"].connect() as connection:
+            assert connection.exec_driver_sql("SELECT COUNT(*) FROM categories").scalar() == 0
+
+    def test_session_without_replicas_uses_primary(self, engines):
+        """
+        복제본이 없는 세션은 모든 조회가 primary
+        """
+        # Act
+        with RoutingSession(bind=engines["primary"]) as db:
+            title = BookService.get_book_by_id(db, 1).title
+
+        # Assert
+        assert title == "primary"
+
+
+class TestReplicaBookCache:
+    """복제본 조회와 도서 상세 캐시 테스트"""
+
+    def test_replica_read_does_not_fill_cache(self, engines):
+        """
+        쓰기로 무효화된 직후 복제본(복제 지연)에서 읽은 값은 캐시하지 않고, 이후 primary 값으로 채움
+        """
+        # Arrange - primary에는 반영되고 복제본은 아직 이전 제목
+        replicas = ReplicaPool([engines["replica1"]])
+        key = book_cache_key(1)
+        book_cache.delete(key)
+
+        # Act
+        with RoutingSession(bind=engines["primary"], replicas=replicas) as db:
+            replica_title = BookService.get_book_response(db, 1).title
+        cached_after_replica = book_cache.get(key)
+        with RoutingSession(bind=engines["primary"]) as db:
+            BookService.get_book_response(db, 1)
+
+        # Assert
+        assert replica_title == "replica1"
+        assert cached_after_replica is None
+        assert '"primary"' in book_cache.get(key)
+
+    def test_recent_writer_skips_cache(self, engines):
+        """
+        read_cache=False(최근 쓰기 클라이언트)면 캐시된 값 대신 DB에서 조회
+        """
+        # Arrange
+        with RoutingSession(bind=engines["primary"]) as db:
+            stale = BookService.get_book_response(db, 1).copy(update={"title": "이전 제목"})
+        set_book_entry(1, stale.category_id, stale.json())
+
+        # Act
+        with RoutingSession(bind=engines["primary"]) as db:
+            cached = BookService.get_book_response(db, 1)
+            fresh = BookService.get_book_response(db, 1, read_cache=False)
+
+        # Assert
+        assert cached.title == "이전 제목"
+        assert fresh.title == "primary"
+
+
+class TestReplicaPool:
+    """복제본 선택 전략 테스트"""
+
+    def test_least_connections(self, engines):
+        """
+        사용 중인 연결이 적은 복제본 선택
+        """
+        # Arrange
+        replica1, replica2 = engines["replica1"], engines["replica2"]
+        replicas = ReplicaPool([replica1, replica2], REPLICA_LEAST_CONNECTIONS)
+        held = replica1.connect()
+
+        # Act
+        chosen = [replicas.choose() for _ in range(3)]
+        held.close()
+
+        # Assert
+        assert chosen == [replica2, replica2, replica2]
+        assert replicas.in_use(replica1) == 0
+
+    def test_invalid_strategy(self, engines):
+        """
+        알 수 없는 전략은 ValueError
+        """
+        # Act & Assert
+        with pytest.raises(ValueError):
+            ReplicaPool([engines["replica1"]], "random")
+
+
+class TestReadSessionDependency:
+    """조회 전용 세션 의존성 테스트"""
+
+    @pytest.fixture
+    def factories(self, engines, monkeypatch):
+        replicas = ReplicaPool([engines["replica1"]])
+        monkeypatch.setattr(database, "SessionLocal", lambda: RoutingSession(bind=engines["primary"]))
+        monkeypatch.setattr(
+            database, "ReadSessionLocal",
+            lambda: RoutingSession(bind=engines["primary"], replicas=replicas)
+        )
+
+    @pytest.mark.parametrize("cookies, expected", [
+        ("", "replica1"),
+        (f"{READ_PRIMARY_COOKIE}={time.time() + 60}", "primary"),
+        (f"{READ_PRIMARY_COOKIE}={time.time() - 60}", "replica1"),
+        (f"{READ_PRIMARY_COOKIE}=invalid", "replica1"),
+    ])
+    def test_recent_writer_reads_primary(self, factories, cookies, expected):
+        """
+        최근 쓰기 쿠키가 유효하면 primary, 아니면 복제본
+        """
+        # Arrange
+        dependency = get_read_db(make_request(cookies))
+
+        # Act
+        db = next(dependency)
+        title = BookService.get_book_by_id(db, 1).title
+        dependency.close()
+
+        # Assert
+        assert title == expected
+
+
+class TestAsyncReplicas:
+    """비동기 모드 복제본 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_async_replica_reads_and_disposes(self, engines, tmp_path, monkeypatch, caplog):
+        """
+        AsyncEngine 복제본에서 조회하고, 종료 시 이벤트 루프 안에서 연결을 닫음 (MissingGreenlet 없음)
+        """
+        # Arrange
+        primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+        replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica1.db'}")
+        replicas = ReplicaPool([replica])
+        monkeypatch.setattr(database, "engine", None)
+        monkeypatch.setattr(database, "async_engine", None)
+        monkeypatch.setattr(database, "replica_pool", replicas)
+        for name in ("SessionLocal", "AsyncSessionLocal", "ReadSessionLocal", "AsyncReadSessionLocal"):
+            monkeypatch.setattr(database, name, None)
+
+        # Act
+        async with AsyncSession(bind=primary, sync_session_class=RoutingSession, replicas=replicas) as db:
+            title = await db.run_sync(lambda session: BookService.get_book_by_id(session, 1).title)
+        in_use = replicas.in_use(replica)
+        checked_in = replica.pool.checkedin()
+        await database.dispose_engines()
+        await primary.dispose()
+
+        # Assert
+        assert title == "replica1"
+        assert (in_use, checked_in) == (0, 1)
+        assert "MissingGreenlet" not in caplog.text
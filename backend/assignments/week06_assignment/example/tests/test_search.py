@@ -0,0 +1,135 @@
+"""
+전문 검색 테스트
+- SQLite FTS5 섀도 테이블 생성 및 초기 색인 테스트
+- 도서 생성/수정/삭제/대량 등록 시 색인 동기화 테스트
+- 관련도순 정렬 테스트
+"""
+import os
+import sys
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from database import Base
+from models.book import Book
+from schemas.book import BookCreate, BookUpdate, BookSearchParams
+from services.book import BookService
+from services.search import SearchService, BACKEND_SQLITE
+
+
+@pytest.fixture
+def fts_session() -> Session:
+    """
+    FTS5 색인이 준비된 독립 DB 세션
+    - 공용 테스트 엔진에 FTS 테이블을 만들지 않도록 별도 엔진 사용
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    session.add_all([
+        Book(title="파이썬 기초", author="홍길동", isbn="9780000000001", price=10000),
+        Book(title="자바 입문", author="김철수", isbn="9780000000002", price=20000),
+    ])
+    session.commit()
+
+    backend = SearchService.setup(engine)
+    if backend != BACKEND_SQLITE:
+        pytest.skip("SQLite FTS5를 지원하지 않는 환경")
+
+    yield session
+
+    session.close()
+    engine.dispose()
+
+
+def search_titles(db: Session, **kwargs) -> list:
+    books, _, _, _ = BookService.get_all_books(db, BookSearchParams(**kwargs))
+    return [book.title for book in books]
+
+
+class TestFullTextSearch:
+    """전문 검색 테스트"""
+
+    def test_setup_indexes_existing_books(self, fts_session: Session):
+        """
+        색인 생성 시 기존 도서가 색인되는지 테스트
+        """
+        # Act & Assert
+        assert search_titles(fts_session, search="파이썬") == ["파이썬 기초"]
+        assert search_titles(fts_session, search="김철수") == ["자바 입문"]
+
+    def test_index_synced_on_create_update_delete(self, fts_session: Session):
+        """
+        BookService 쓰기 경로에서 색인이 동기화되는지 테스트
+        """
+        # Arrange & Act - 생성
+        created = BookService.create_book(fts_session, BookCreate(
+            title="파이썬 심화", author="이영희", isbn="9780000000003", price=30000
+        ))
+
+        # Assert
+        assert search_titles(fts_session, search="파이썬") == ["파이썬 기초", "파이썬 심화"]
+
+        # Act - 수정
+        BookService.update_book(fts_session, created.id, BookUpdate(title="러스트 심화"))
+
+        # Assert
+        assert search_titles(fts_session, search="파이썬") == ["파이썬 기초"]
+        assert search_titles(fts_session, search="러스트") == ["러스트 심화"]
+
+        # Act - 삭제
+        BookService.delete_book(fts_session, created.id)
+
+        # Assert
+        assert search_titles(fts_session, search="러스트") == []
+
+    def test_relevance_sort(self, fts_session: Session):
+        """
+        sort=relevance 지정 시 관련도가 높은 도서가 먼저 조회되는지 테스트
+        """
+        # Arrange
+        BookService.create_book(fts_session, BookCreate(
+            title="파이썬 파이썬 파이썬", author="파이썬", isbn="9780000000004", price=40000
+        ))
+
+        # Act
+        titles = search_titles(fts_session, search="파이썬", sort="relevance")
+
+        # Assert
+        assert titles == ["파이썬 파이썬 파이썬", "파이썬 기초"]
+
+    def test_short_term_falls_back_to_like(self, fts_session: Session):
+        """
+        trigram보다 짧은 검색어는 LIKE 검색으로 대체되는지 테스트
+        """
+        # Act & Assert
+        assert search_titles(fts_session, search="자바") == ["자바 입문"]
+
+    def test_imported_books_are_indexed(self, fts_session: Session):
+        """
+        대량 등록된 도서도 색인되는지 테스트
+        """
+        # Arrange
+        records = [
+            {"title": "파이썬 데이터 분석", "author": "박민수", "isbn": "9780000000005", "price": 25000},
+            {"title": "러스트 프로그래밍", "author": "최지훈", "isbn": "9780000000006", "price": 32000},
+        ]
+
+        # Act
+        result = BookService.import_books(fts_session, records, chunk_size=1)
+
+        # Assert
+        assert result.success_count == 2
+        assert search_titles(fts_session, search="파이썬") == ["파이썬 기초", "파이썬 데이터 분석"]
+        assert search_titles(fts_session, search="최지훈") == ["러스트 프로그래밍"]
@@ -0,0 +1,115 @@
+"""
+애플리케이션 시작 테스트
+- main import만으로는 앱/엔진/라우터를 만들지 않는지 테스트
+- lifespan에서 엔진을 만들고 종료 시 정리하는지 테스트
+- 앱 준비(import + create_app) 시간이 import 예산 안인지 테스트 (python -X importtime)
+"""
+import os
+import sys
+import pytest
+from fastapi.testclient import TestClient
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+import database
+import main
+from config import settings
+from utils.import_budget import IMPORT_TIME_BUDGET_MS, measure_import_time, parse_importtime
+
+# 실행 방식에 따라 "main" 또는 "app.main" - 새 인터프리터에서도 같은 이름으로 import
+MAIN_MODULE = main.__name__
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        420 |   encodings
+import time:      1000 |       1500 | fastapi
+import time:       200 |        200 |   app.config
+import time:       500 |        700 | app.main
+"""
+
+
+class TestAppFactory:
+    """애플리케이션 팩토리 테스트"""
+
+    def test_import_is_lazy(self):
+        """
+        main import만으로는 라우터, DB 드라이버, uvicorn을 import하지 않음
+        """
+        # Act
+        profile = measure_import_time(f"import {MAIN_MODULE}")
+
+        # Assert
+        imported = set(profile.modules)
+        assert not imported & {"sqlite3", "pymysql", "aiomysql", "uvicorn"}
+        assert not [module for module in imported if module.endswith("routers.books")]
+
+    def test_lifespan_creates_and_disposes_engines(self):
+        """
+        엔진은 lifespan 시작 시 생성되어 요청에 쓰이고 종료 시 정리
+        """
+        # Arrange
+        app = main.create_app()
+
+        # Act
+        with TestClient(app) as client:
+            engine_during_lifespan = database.engine
+            response = client.get("/health/pool")
+
+        # Assert
+        assert engine_during_lifespan is not None
+        assert response.status_code == 200
+        assert response.json()["data"]["sync"] is not None
+        assert database.engine is None
+
+    def test_module_app_created_once(self):
+        """
+        main.app은 처음 접근할 때 한 번만 생성
+        """
+        # Act & Assert
+        assert main.app is main.app
+
+    def test_settings_must_match_process_routing(self):
+        """
+        동기/비동기 경로를 프로세스 설정과 다르게 지정하면 ValueError
+        """
+        # Arrange
+        other = settings.copy(update={"use_async_db": not settings.use_async_db})
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            main.create_app(other)
+
+    def test_parse_importtime(self):
+        """
+        전체 시간은 최상위 import의 누적 시간 합, 모듈별 자기 시간 기록
+        """
+        # Act
+        profile = parse_importtime(IMPORTTIME_OUTPUT)
+
+        # Assert
+        assert profile.total_ms == 2.2
+        assert profile.slowest(2) == ["fastapi", "app.main"]
+        assert profile.cumulative_us["encodings"] == 420
+
+
+@pytest.mark.slow
+class TestImportTimeBudget:
+    """앱 준비 시간 예산 테스트"""
+
+    def test_startup_within_budget(self):
+        """
+        새 인터프리터에서 main import + create_app()까지의 import 시간이 예산(IMPORT_TIME_BUDGET_MS) 이내
+        """
+        # Act - 3회 중 가장 빠른 실행 (디스크 캐시 등 잡음 제거)
+        profile = min(
+            (measure_import_time(f"import {MAIN_MODULE} as main; main.create_app()") for _ in range(3)),
+            key=lambda result: result.total_us
+        )
+        print(f"\nimport 시간: {profile.total_ms:.1f}ms / 예산 {IMPORT_TIME_BUDGET_MS}ms")
+        print("".join(f"\n  {profile.self_us[module] / 1000:.1f}ms {module}" for module in profile.slowest(5)))
+
+        # Assert
+        assert profile.total_ms <= IMPORT_TIME_BUDGET_MS
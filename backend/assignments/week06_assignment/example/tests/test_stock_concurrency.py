@@ -0,0 +1,209 @@
+"""
+재고 변경 동시성 테스트
+- 조건부 UPDATE(atomic) 모드 동작 테스트
+- 동시 주문 시 재고 초과 차감이 없는지 테스트
+- 행 잠금(lock) 모드와 atomic 모드의 경합 상황 처리량 비교 벤치마크
+"""
+import os
+import sys
+import time
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from database import Base
+from models.book import Book
+from models.category import Category
+from schemas.book import StockUpdateRequest
+from services import book as book_service_module
+from services.book import BookService, STOCK_MODE_ATOMIC, STOCK_MODE_LOCK
+from utils.exceptions import InsufficientStockException, NotFoundException
+
+
+def run_orders(engine, book_id: int, mode: str, orders: int, workers: int):
+    """
+    여러 스레드에서 1권씩 차감 주문 실행
+    - 반환값: (성공 수, 재고 부족 거절 수, 소요 시간)
+    """
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+    counts = {"succeeded": 0, "rejected": 0}
+    lock = threading.Lock()
+
+    def order(_):
+        with SessionLocal() as db:
+            try:
+                BookService.update_stock(
+                    db, book_id, StockUpdateRequest(quantity=1, operation="subtract"), mode=mode
+                )
+                result = "succeeded"
+            except InsufficientStockException:
+                result = "rejected"
+        with lock:
+            counts[result] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(order, range(orders)))
+    return counts["succeeded"], counts["rejected"], time.perf_counter() - started
+
+
+def create_contended_book(engine, stock: int) -> int:
+    """경합 테스트용 도서 생성"""
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        book = Book(title="베스트셀러", author="작가", isbn="9789999999999", price=10000, stock_quantity=stock)
+        db.add(book)
+        db.commit()
+        return book.id
+
+
+def current_stock(engine, book_id: int) -> int:
+    with sessionmaker(bind=engine)() as db:
+        return db.query(Book.stock_quantity).filter(Book.id == book_id).scalar()
+
+
+class TestAtomicStockUpdate:
+    """조건부 UPDATE 재고 변경 테스트"""
+
+    def test_subtract_success(self, db_session: Session, sample_book: Book, sample_category: Category):
+        """
+        재고가 충분하면 차감 후 카테고리명이 포함된 응답 반환
+        """
+        # Arrange
+        before = sample_book.stock_quantity
+
+        # Act
+        result = BookService.update_stock(
+            db_session, sample_book.id,
+            StockUpdateRequest(quantity=3, operation="subtract"), mode=STOCK_MODE_ATOMIC
+        )
+
+        # Assert
+        assert result.stock_quantity == before - 3
+        assert result.category_name == sample_category.name
+
+    def test_add_success(self, db_session: Session, sample_book: Book):
+        """
+        재고 추가
+        """
+        # Arrange
+        before = sample_book.stock_quantity
+
+        # Act
+        result = BookService.update_stock(
+            db_session, sample_book.id,
+            StockUpdateRequest(quantity=5, operation="add"), mode=STOCK_MODE_ATOMIC
+        )
+
+        # Assert
+        assert result.stock_quantity == before + 5
+
+    def test_insufficient_stock(self, db_session: Session, sample_book: Book):
+        """
+        재고보다 많이 차감하면 변경 없이 재고 부족 예외
+        """
+        # Arrange
+        book_id, before = sample_book.id, sample_book.stock_quantity
+
+        # Act & Assert
+        with pytest.raises(InsufficientStockException) as exc_info:
+            BookService.update_stock(
+                db_session, book_id,
+                StockUpdateRequest(quantity=before + 1, operation="subtract"), mode=STOCK_MODE_ATOMIC
+            )
+        assert f"현재 재고: {before}" in exc_info.value.message
+        assert db_session.query(Book.stock_quantity).filter(Book.id == book_id).scalar() == before
+
+    def test_book_not_found(self, db_session: Session):
+        """
+        존재하지 않는 도서는 NotFoundException
+        """
+        # Act & Assert
+        with pytest.raises(NotFoundException):
+            BookService.update_stock(
+                db_session, 99999,
+                StockUpdateRequest(quantity=1, operation="subtract"), mode=STOCK_MODE_ATOMIC
+            )
+
+    def test_api_uses_configured_mode(self, test_client: TestClient, sample_book: Book, monkeypatch):
+        """
+        STOCK_UPDATE_MODE=atomic 설정 시 API도 조건부 UPDATE 사용
+        """
+        # Arrange
+        monkeypatch.setattr(book_service_module, "STOCK_UPDATE_MODE", STOCK_MODE_ATOMIC)
+        url = f"/api/v1/books/{sample_book.id}/stock"
+        before = sample_book.stock_quantity
+
+        # Act
+        ok = test_client.patch(url, json={"quantity": 1, "operation": "subtract"})
+        rejected = test_client.patch(url, json={"quantity": 10000, "operation": "subtract"})
+
+        # Assert
+        assert ok.status_code == 200
+        assert ok.json()["data"]["stock_quantity"] == before - 1
+        assert rejected.status_code == 400
+        assert "재고가 부족합니다" in rejected.json()["message"]
+
+
+@pytest.mark.slow
+class TestStockConcurrency:
+    """동시 주문 테스트"""
+
+    def test_atomic_mode_never_oversells(self, tmp_path):
+        """
+        재고 100권에 150건 동시 주문 - 정확히 100건만 성공하고 재고는 0
+        """
+        # Arrange
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'stock.db'}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        book_id = create_contended_book(engine, stock=100)
+
+        # Act
+        succeeded, rejected, _ = run_orders(engine, book_id, STOCK_MODE_ATOMIC, orders=150, workers=8)
+
+        # Assert
+        assert (succeeded, rejected) == (100, 50)
+        assert current_stock(engine, book_id) == 0
+        engine.dispose()
+
+
+@pytest.mark.slow
+@pytest.mark.external
+class TestStockContentionBenchmark:
+    """
+    행 잠금 모드와 atomic 모드의 경합 처리량 비교
+    - SQLite는 FOR UPDATE를 지원하지 않으므로 BENCHMARK_DATABASE_URL(MySQL 등)이 있을 때만 실행
+    """
+
+    @pytest.mark.parametrize("mode", [STOCK_MODE_LOCK, STOCK_MODE_ATOMIC])
+    def test_contention_throughput(self, mode):
+        """
+        한 도서에 500건 동시 주문 (재고 400권)
+        """
+        # Arrange
+        url = os.getenv("BENCHMARK_DATABASE_URL")
+        if not url:
+            pytest.skip("BENCHMARK_DATABASE_URL이 설정되지 않음")
+        engine = create_engine(url, pool_size=16)
+        Base.metadata.drop_all(bind=engine)
+        book_id = create_contended_book(engine, stock=400)
+
+        # Act
+        succeeded, rejected, elapsed = run_orders(engine, book_id, mode, orders=500, workers=16)
+        print(f"\n{mode}: {500 / elapsed:.0f}건/초 (성공 {succeeded}, 거절 {rejected}, {elapsed:.2f}초)")
+
+        # Assert
+        assert (succeeded, rejected) == (400, 100)
+        assert current_stock(engine, book_id) == 0
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
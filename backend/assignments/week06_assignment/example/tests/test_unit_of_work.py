@@ -0,0 +1,271 @@
+"""
+요청 단위 트랜잭션(UnitOfWorkMiddleware) 테스트
+- 쓰기 요청마다 커밋이 한 번인지 테스트 (여러 서비스를 호출해도 한 번)
+- 오류 응답(BusinessException)이면 flush한 변경까지 롤백되는지 테스트
+- 캐시 무효화 등 커밋 후 작업이 커밋된 뒤에만 실행되는지 테스트
+"""
+import os
+import sys
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from database import Base, UNIT_OF_WORK_KEY, UnitOfWorkMiddleware, after_commit, commit, get_db
+from models.book import Book
+from models.category import Category
+from schemas.book import BookCreate, BookUpdate
+from schemas.category import CategoryCreate
+from services.book import BookService
+from services.category import CategoryService
+from utils.cache import book_cache, book_cache_key
+from utils.exceptions import InvalidOperationException
+
+
+@pytest.fixture
+def uow_engine(tmp_path):
+    """
+    파일 SQLite 엔진 - 실제 COMMIT/ROLLBACK 횟수를 세기 위해 테스트 트랜잭션으로 감싸지 않음
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'unit_of_work.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def transactions(uow_engine):
+    """엔진에서 실행된 COMMIT/ROLLBACK 기록"""
+    events = []
+    event.listen(uow_engine, "commit", lambda conn: events.append("COMMIT"))
+    event.listen(uow_engine, "rollback", lambda conn: events.append("ROLLBACK"))
+    return events
+
+
+@pytest.fixture
+def uow_client(test_app, uow_engine, transactions):
+    """
+    요청 단위 트랜잭션을 사용하는 클라이언트
+    - 앱의 라우터/예외 핸들러/설정은 그대로, 세션만 테스트 엔진에 연결
+    """
+    from routers import books, categories
+
+    app = FastAPI()
+    app.state.settings = test_app.state.settings
+    app.add_middleware(
+        UnitOfWorkMiddleware, session_factory=sessionmaker(bind=uow_engine, autoflush=False)
+    )
+    app.include_router(books.router, prefix="/api/v1")
+    app.include_router(categories.router, prefix="/api/v1")
+    for exc_class, handler in test_app.exception_handlers.items():
+        app.add_exception_handler(exc_class, handler)
+
+    @app.post("/test/category-with-book")
+    def create_category_with_book(fail: bool = False, db: Session = Depends(get_db)):
+        """서비스 두 개를 호출하는 엔드포인트 - fail이면 모두 처리한 뒤 BusinessException"""
+        category = CategoryService.create_category(db, CategoryCreate(name="작업 단위"))
+        book = BookService.create_book(db, BookCreate(
+            title="작업 단위 도서", author="테스트", isbn="9780000000001",
+            price=10000, category_id=category.id
+        ))
+        if fail:
+            raise InvalidOperationException("처리 후 실패")
+        return {"book_id": book.id}
+
+    @app.get("/test/unit-of-work")
+    @app.post("/test/unit-of-work")
+    def has_unit_of_work(request: Request):
+        return {"unit_of_work": hasattr(request.state, UNIT_OF_WORK_KEY)}
+
+    with TestClient(app) as client:
+        yield client
+    transactions.clear()
+
+
+@pytest.fixture
+def uow_book(uow_engine) -> Book:
+    """테스트 엔진에 저장된 도서"""
+    with sessionmaker(bind=uow_engine)() as db:
+        book = Book(title="작업 단위", author="테스트", isbn="9780000000002", price=10000, stock_quantity=5)
+        db.add(book)
+        db.commit()
+        db.refresh(book)
+        db.expunge(book)
+    return book
+
+
+def count_books(engine) -> int:
+    with sessionmaker(bind=engine)() as db:
+        return db.query(Book).count()
+
+
+class TestUnitOfWorkMiddleware:
+    """요청 단위 트랜잭션 테스트"""
+
+    def test_create_app_registers_middleware(self, test_app):
+        """
+        create_app()이 요청 단위 트랜잭션 미들웨어 등록 (DB_UNIT_OF_WORK 기본값)
+        """
+        # Act & Assert
+        assert UnitOfWorkMiddleware in [middleware.cls for middleware in test_app.user_middleware]
+
+    def test_write_request_commits_once(self, uow_client, uow_book, transactions):
+        """
+        쓰기 요청은 COMMIT 한 번, 응답 후 추가 롤백 없음
+        """
+        # Arrange
+        transactions.clear()
+
+        # Act
+        response = uow_client.patch(f"/api/v1/books/{uow_book.id}", json={"price": 12000})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["data"]["price"] == 12000
+        assert transactions == ["COMMIT"]
+
+    def test_multiple_services_share_one_commit(self, uow_client, uow_engine, transactions):
+        """
+        한 요청에서 서비스를 여러 번 호출해도 COMMIT 한 번
+        """
+        # Act
+        response = uow_client.post("/test/category-with-book")
+
+        # Assert
+        assert response.status_code == 200
+        assert transactions == ["COMMIT"]
+        assert count_books(uow_engine) == 1
+
+    def test_business_exception_rolls_back(self, uow_client, uow_engine, transactions):
+        """
+        BusinessException 응답이면 이미 flush한 변경까지 롤백
+        """
+        # Act
+        response = uow_client.post("/test/category-with-book", params={"fail": True})
+
+        # Assert
+        assert response.status_code == 400
+        assert transactions == ["ROLLBACK"]
+        assert count_books(uow_engine) == 0
+
+    def test_error_response_from_router_rolls_back(self, uow_client, uow_book, transactions):
+        """
+        라우터가 HTTPException으로 바꾼 오류 응답(재고 부족)도 롤백
+        """
+        # Arrange
+        transactions.clear()
+
+        # Act
+        response = uow_client.patch(
+            f"/api/v1/books/{uow_book.id}/stock", json={"quantity": 100, "operation": "subtract"}
+        )
+
+        # Assert
+        assert response.status_code == 400
+        assert "COMMIT" not in transactions
+
+    def test_read_request_not_wrapped(self, uow_client):
+        """
+        조회 요청은 요청 단위 트랜잭션 밖에서 처리 (스트리밍 응답이 본문 전송 중에도 세션 사용)
+        """
+        # Act
+        read = uow_client.get("/test/unit-of-work").json()
+        write = uow_client.post("/test/unit-of-work").json()
+
+        # Assert
+        assert read == {"unit_of_work": False}
+        assert write == {"unit_of_work": True}
+
+    def test_commit_failure_returns_error(self, uow_engine):
+        """
+        응답 직전 커밋이 실패하면 성공 응답 대신 500
+        """
+        # Arrange
+        class FailingCommitSession(Session):
+            def commit(self):
+                raise RuntimeError("commit failed")
+
+        app = FastAPI()
+        app.add_middleware(
+            UnitOfWorkMiddleware, session_factory=sessionmaker(bind=uow_engine, class_=FailingCommitSession)
+        )
+
+        @app.post("/categories")
+        def create_category(db: Session = Depends(get_db)):
+            db.add(Category(name="커밋 실패"))
+            db.flush()
+            return {"status": "success"}
+
+        # Act
+        response = TestClient(app).post("/categories")
+
+        # Assert
+        assert response.status_code == 500
+        assert response.json()["status"] == "error"
+
+
+class TestDeferredCommit:
+    """서비스의 커밋 헬퍼 테스트"""
+
+    def test_commit_flushes_inside_unit_of_work(self, uow_engine, transactions, uow_book):
+        """
+        요청 단위 트랜잭션 안의 서비스는 flush만 하고, 캐시 무효화는 커밋 후 실행
+        """
+        # Arrange
+        transactions.clear()
+        key = book_cache_key(uow_book.id)
+        book_cache.set(key, "{}")
+        db = sessionmaker(bind=uow_engine, autoflush=False)()
+        db.info[UNIT_OF_WORK_KEY] = True
+
+        try:
+            # Act
+            BookService.update_book(db, uow_book.id, BookUpdate(price=15000))
+            before_commit = (list(transactions), book_cache.get(key))
+            db.commit()
+
+            # Assert
+            assert before_commit == ([], "{}")
+            assert transactions == ["COMMIT"]
+            assert book_cache.get(key) is None
+        finally:
+            db.close()
+
+    def test_commit_outside_unit_of_work(self, db_session: Session):
+        """
+        요청 단위 트랜잭션 밖에서는 바로 커밋하고 커밋 후 작업 실행
+        """
+        # Arrange
+        executed = []
+        db_session.add(Category(name="바로 커밋"))
+        after_commit(db_session, executed.append, "done")
+
+        # Act
+        commit(db_session)
+
+        # Assert
+        assert executed == ["done"]
+
+    def test_rollback_discards_after_commit(self, uow_engine):
+        """
+        롤백되면 등록한 커밋 후 작업은 실행되지 않음
+        """
+        # Arrange
+        executed = []
+        with sessionmaker(bind=uow_engine)() as db:
+            db.add(Category(name="롤백"))
+            db.flush()
+            after_commit(db, executed.append, "done")
+
+            # Act
+            db.rollback()
+            db.commit()
+
+        # Assert
+        assert executed == []
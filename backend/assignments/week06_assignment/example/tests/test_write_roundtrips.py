@@ -0,0 +1,155 @@
+"""
+쓰기 경로 DB 왕복 횟수 테스트
+- 생성/수정/재고 변경 후 재조회 없이 응답을 만드는지 테스트
+- 기존 방식(커밋 -> refresh -> 재조회)과의 왕복 횟수/소요 시간 비교 벤치마크
+"""
+import os
+import sys
+import time
+import pytest
+from sqlalchemy.orm import Session
+
+# Add week05 assignment path to sys.path for imports
+week05_example_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "week05_assignment", "example"))
+if week05_example_path not in sys.path:
+    sys.path.insert(0, week05_example_path)
+
+from models.book import Book
+from models.category import Category
+from schemas.book import BookCreate, BookUpdate, BookResponse, StockUpdateRequest
+from services.book import BookService
+
+
+def after_write(statements: list) -> list:
+    """첫 INSERT/UPDATE 이후의 SQL 문 종류 (쓰기 + 응답 생성을 위한 조회)"""
+    kinds = [statement.kind for statement in statements]
+    for index, kind in enumerate(kinds):
+        if kind in ("INSERT", "UPDATE"):
+            return kinds[index:]
+    return []
+
+
+def max_roundtrips(db: Session) -> int:
+    """RETURNING을 지원하면 쓰기 1회, 아니면 쓰기 + 서버 생성 값 조회 2회"""
+    dialect = db.get_bind().dialect
+    returning = getattr(dialect, "update_returning", getattr(dialect, "full_returning", False))
+    return 1 if returning else 2
+
+
+def legacy_update_stock(db: Session, book_id: int, quantity: int) -> Book:
+    """비교용 기존 방식 - 커밋 후 refresh와 상세 재조회"""
+    book = db.query(Book).filter(Book.id == book_id).with_for_update().first()
+    book.stock_quantity += quantity
+    db.commit()
+    db.refresh(book)
+    return BookService.get_book_by_id(db, book_id)
+
+
+class TestWriteRoundTrips:
+    """쓰기 경로 왕복 횟수 테스트"""
+
+    def test_create_book_returns_populated_response(self, db_session: Session, sample_category: Category, capture_statements):
+        """
+        생성 후 재조회 없이 카테고리명과 타임스탬프가 채워진 응답 반환
+        """
+        # Arrange
+        book_data = BookCreate(
+            title="왕복 테스트", author="테스트", isbn="9781111111111",
+            price=10000, category_id=sample_category.id
+        )
+
+        # Act
+        with capture_statements(db_session) as statements:
+            result = BookService.create_book(db_session, book_data)
+
+        # Assert
+        assert isinstance(result, BookResponse)
+        assert result.category_name == sample_category.name
+        assert result.created_at is not None
+        assert result.updated_at is not None
+        assert after_write(statements).count("SELECT") <= max_roundtrips(db_session) - 1
+        assert [statement.kind for statement in statements].count("INSERT") == 1
+
+    def test_update_book_without_requery(self, db_session: Session, sample_book: Book, sample_category: Category, capture_statements):
+        """
+        수정 시 기존 도서 조회 1회 + 쓰기(RETURNING) 1회
+        """
+        # Act
+        with capture_statements(db_session) as statements:
+            result = BookService.update_book(db_session, sample_book.id, BookUpdate(price=12345))
+
+        # Assert
+        assert result.price == 12345
+        assert result.category_name == sample_category.name
+        assert len(after_write(statements)) <= max_roundtrips(db_session)
+        assert len(statements) <= max_roundtrips(db_session) + 1
+
+    def test_update_book_category_name_follows_change(self, db_session: Session, sample_books):
+        """
+        카테고리 변경 시 응답의 카테고리명도 새 카테고리로 채워짐
+        """
+        # Arrange
+        book = sample_books[0]
+        new_category = next(b.category for b in sample_books if b.category_id != book.category_id)
+
+        # Act
+        result = BookService.update_book(db_session, book.id, BookUpdate(category_id=new_category.id))
+
+        # Assert
+        assert result.category_id == new_category.id
+        assert result.category_name == new_category.name
+
+    def test_update_stock_without_requery(self, db_session: Session, sample_book: Book, sample_category: Category, capture_statements):
+        """
+        재고 변경 시 잠금 조회 1회 + 쓰기(RETURNING) 1회
+        """
+        # Arrange
+        before = sample_book.stock_quantity
+
+        # Act
+        with capture_statements(db_session) as statements:
+            result = BookService.update_stock(
+                db_session, sample_book.id, StockUpdateRequest(quantity=3, operation="add")
+            )
+
+        # Assert
+        assert result.stock_quantity == before + 3
+        assert result.category_name == sample_category.name
+        assert len(after_write(statements)) <= max_roundtrips(db_session)
+        assert len(statements) <= max_roundtrips(db_session) + 1
+
+
+@pytest.mark.slow
+class TestWriteRoundTripBenchmark:
+    """기존 방식 대비 왕복 횟수 감소 벤치마크"""
+
+    def test_update_stock_benchmark(self, db_session: Session, sample_book: Book, capture_statements):
+        """
+        재고 변경 200회 - 기존 방식과 SQL 문 수/소요 시간 비교
+        """
+        # Arrange
+        iterations = 200
+        book_id = sample_book.id
+        stock_update = StockUpdateRequest(quantity=1, operation="add")
+
+        # Act
+        with capture_statements(db_session) as legacy_statements:
+            started = time.perf_counter()
+            for _ in range(iterations):
+                legacy_update_stock(db_session, book_id, 1)
+            legacy_elapsed = time.perf_counter() - started
+
+        with capture_statements(db_session) as statements:
+            started = time.perf_counter()
+            for _ in range(iterations):
+                BookService.update_stock(db_session, book_id, stock_update)
+            elapsed = time.perf_counter() - started
+
+        print(
+            f"\n기존: {len(legacy_statements) / iterations:.1f}문/요청, {legacy_elapsed * 1000 / iterations:.2f}ms/요청"
+            f"\n개선: {len(statements) / iterations:.1f}문/요청, {elapsed * 1000 / iterations:.2f}ms/요청"
+        )
+
+        # Assert
+        assert len(statements) < len(legacy_statements)
+        assert len(statements) <= iterations * (max_roundtrips(db_session) + 1)